@@ -0,0 +1,289 @@
+"""Benchmark every TorchBoxes entry point across sizes, dtypes, devices and
+threads, and compare the throughputs with a stored baseline.
+"""
+import argparse
+import importlib.util
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+
+import torch
+
+from anyboxes import TorchBoxes
+
+IMAGE_SIZE = 2000
+MASK_SIZE = 64
+MAX_BATCHED_BOXES = 10**6
+# Calls shorter than this in seconds are gated with a larger tolerance.
+SHORT_TIME = 1e-5
+
+
+def make_boxes(n: int, dtype: torch.dtype, device: str, seed: int = 0):
+    """Generate random boxes in the two corners format inside the image."""
+    generator = torch.Generator().manual_seed(seed)
+    top_left = torch.rand(n, 2, generator=generator) * (IMAGE_SIZE / 2)
+    sizes = torch.rand(n, 2, generator=generator) * 99 + 1
+    return torch.cat([top_left, top_left + sizes], dim=1).to(device, dtype)
+
+
+def converted(boxes: torch.Tensor) -> TorchBoxes:
+    """Build boxes whose `boxes_` is freshly computed, for the `as_*` exports,
+    which then time the cast to float32 and the export itself.
+    """
+    return TorchBoxes.from_two_corners(boxes).to_top_left_corner()
+
+
+# name: (setup building the argument from the input boxes, timed function,
+# largest number of boxes). Objects are rebuilt for every call, so that the
+# cached outputs of the `to` methods are never reused.
+ENTRY_POINTS = {
+    "from_two_corners": (lambda b: b, TorchBoxes.from_two_corners, None),
+    "from_top_left_corner": (lambda b: b, TorchBoxes.from_top_left_corner, None),
+    "from_bottom_left_corner": (
+        lambda b: b,
+        TorchBoxes.from_bottom_left_corner,
+        None,
+    ),
+    "from_center": (lambda b: b, TorchBoxes.from_center, None),
+    "to_two_corners": (TorchBoxes.from_two_corners, TorchBoxes.to_two_corners, None),
+    "to_top_left_corner": (
+        TorchBoxes.from_two_corners,
+        TorchBoxes.to_top_left_corner,
+        None,
+    ),
+    "to_bottom_left_corner": (
+        TorchBoxes.from_two_corners,
+        TorchBoxes.to_bottom_left_corner,
+        None,
+    ),
+    "to_center": (TorchBoxes.from_two_corners, TorchBoxes.to_center, None),
+    "square": (TorchBoxes.from_two_corners, TorchBoxes.square, None),
+    "flip_origin": (
+        TorchBoxes.from_two_corners,
+        lambda b: b.flip_origin(IMAGE_SIZE),
+        None,
+    ),
+    "get_binary_mask": (
+        TorchBoxes.from_two_corners,
+        lambda b: b.get_binary_mask(MASK_SIZE, MASK_SIZE),
+        10**4,
+    ),
+    "as_tensor": (converted, lambda b: b.as_tensor, None),
+    "as_numpy": (converted, lambda b: b.as_numpy, None),
+    "as_dict": (converted, lambda b: b.as_dict, 10**6),
+    "as_tuple": (converted, lambda b: b.as_tuple, 10**6),
+}
+# Exports to the optional frameworks, through DLPack.
+if importlib.util.find_spec("jax") is not None:
+    ENTRY_POINTS["as_array"] = (converted, lambda b: b.as_array, None)
+if importlib.util.find_spec("tensorflow") is not None:
+    ENTRY_POINTS["as_tf_tensor"] = (converted, lambda b: b.as_tf_tensor, None)
+DTYPES = {"float32": torch.float32, "float64": torch.float64, "int32": torch.int32}
+
+
+def synchronize(device: str):
+    """Wait for the kernels of the device, so that they are timed."""
+    if device.startswith("cuda"):
+        torch.cuda.synchronize(device)
+
+
+def timeit(setup, function, inputs, device: str, repeat: int, min_time: float):
+    """Return the median time per call of `function`. Calls are batched so
+    that a measurement lasts at least `min_time`, each call gets a fresh argument
+    built by `setup` out of the timed region. Batches hold at most
+    `MAX_BATCHED_BOXES` boxes, as all their arguments are alive at once.
+    """
+    number, timings = 1, []
+    for index in range(repeat + 1):
+        arguments = [setup(inputs) for _ in range(number)]
+        synchronize(device)
+        start = time.perf_counter()
+        for argument in arguments:
+            function(argument)
+        synchronize(device)
+        elapsed = time.perf_counter() - start
+        del arguments
+        if index == 0:
+            # Calibration run, also warms up the allocator and the caches.
+            number = math.ceil(min_time / max(elapsed, 1e-9))
+            number = max(1, min(number, 10**4, MAX_BATCHED_BOXES // len(inputs)))
+            continue
+        timings.append(elapsed / number)
+    return statistics.median(timings)
+
+
+def read_memory_status(field: str) -> int:
+    """Return a memory field of `/proc/self/status` in bytes."""
+    with open("/proc/self/status") as file:
+        for line in file:
+            if line.startswith(field):
+                return int(line.split()[1]) * 1024
+    raise KeyError(field)
+
+
+def peak_memory(setup, function, inputs, device: str):
+    """Return the peak memory allocated by a call of `function` in bytes, the
+    increase of the peak resident set size on CPU, None if it can't be
+    measured on this platform.
+    """
+    argument = setup(inputs)
+    if device.startswith("cuda"):
+        synchronize(device)
+        torch.cuda.reset_peak_memory_stats(device)
+        before = torch.cuda.memory_allocated(device)
+        function(argument)
+        return torch.cuda.max_memory_allocated(device) - before
+    try:
+        # Writing 5 to `clear_refs` resets the peak RSS to the current RSS.
+        with open("/proc/self/clear_refs", "w") as file:
+            file.write("5")
+        before = read_memory_status("VmRSS")
+        function(argument)
+        # Freed memory may be returned to the system, lowering the RSS.
+        return max(0, read_memory_status("VmHWM") - before)
+    except OSError:
+        return None
+
+
+def run(args) -> dict:
+    """Run the sweep and print one line per measurement."""
+    results = {}
+    for threads in args.threads:
+        torch.set_num_threads(threads)
+        for device in args.devices:
+            for dtype_name in args.dtypes:
+                for n in args.sizes:
+                    inputs = make_boxes(n, DTYPES[dtype_name], device)
+                    for name in args.entry_points:
+                        setup, function, max_size = ENTRY_POINTS[name]
+                        if max_size is not None and n > max_size:
+                            continue
+                        elapsed = timeit(
+                            setup, function, inputs, device, args.repeat, args.min_time
+                        )
+                        memory = peak_memory(setup, function, inputs, device)
+                        key = f"{name}|{device}|{dtype_name}|{n}|{threads}"
+                        results[key] = {
+                            "seconds": elapsed,
+                            "boxes_per_second": n / elapsed,
+                            "peak_memory": memory,
+                        }
+                        memory = "n/a" if memory is None else f"{memory / 2**20:.1f}"
+                        print(
+                            (
+                                f"{name:<24} {device:<6} {dtype_name:<8} n={n:<9}"
+                                f" threads={threads:<3} {elapsed * 1e6:12.2f} us"
+                                f" {n / elapsed:14.4g} boxes/s peak={memory:>8} MiB"
+                            ),
+                            flush=True,
+                        )
+                    del inputs
+    return results
+
+
+def compare(
+    results: dict,
+    baseline: dict,
+    tolerance: float,
+    short_tolerance: float,
+    min_gated_size: int,
+) -> list:
+    """Return the measurements slower than the baseline by more than
+    `tolerance`, as (key, baseline throughput, throughput). Calls shorter than
+    `SHORT_TIME` in the baseline are dominated by Python overheads and timer
+    noise, so they are compared with `short_tolerance`, and measurements of less
+    than `min_gated_size` boxes aren't compared.
+    """
+    regressions = []
+    for key, result in results.items():
+        if key not in baseline["results"]:
+            continue
+        if int(key.split("|")[3]) < min_gated_size:
+            continue
+        expected = baseline["results"][key]
+        allowed = tolerance if expected["seconds"] >= SHORT_TIME else short_tolerance
+        expected = expected["boxes_per_second"]
+        if result["boxes_per_second"] < expected * (1 - allowed):
+            regressions.append((key, expected, result["boxes_per_second"]))
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1, 100, 10**4, 10**6, 10**7]
+    )
+    parser.add_argument(
+        "--dtypes", nargs="+", choices=list(DTYPES), default=list(DTYPES)
+    )
+    parser.add_argument("--devices", nargs="+", default=["cpu"])
+    parser.add_argument(
+        "--threads", type=int, nargs="+", default=sorted({1, os.cpu_count() or 1})
+    )
+    parser.add_argument(
+        "--entry-points",
+        nargs="+",
+        choices=list(ENTRY_POINTS),
+        default=list(ENTRY_POINTS),
+    )
+    parser.add_argument("--repeat", type=int, default=11)
+    parser.add_argument("--min-time", type=float, default=0.1)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--baseline", help="compare with this JSON file of results")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.3,
+        help="relative slowdown above which a measurement is a regression",
+    )
+    parser.add_argument(
+        "--short-tolerance",
+        type=float,
+        default=0.6,
+        help=f"tolerance of the calls shorter than {SHORT_TIME * 1e6:g} us",
+    )
+    parser.add_argument(
+        "--min-gated-size",
+        type=int,
+        default=100,
+        help="smallest number of boxes compared with the baseline",
+    )
+    args = parser.parse_args()
+
+    results = run(args)
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(
+                {
+                    "machine": {
+                        "platform": platform.platform(),
+                        "processor": platform.processor(),
+                        "cpu_count": os.cpu_count(),
+                        "torch": torch.__version__,
+                    },
+                    "results": results,
+                },
+                file,
+                indent=1,
+            )
+    if args.baseline:
+        with open(args.baseline) as file:
+            regressions = compare(
+                results,
+                json.load(file),
+                args.tolerance,
+                args.short_tolerance,
+                args.min_gated_size,
+            )
+        for key, expected, measured in regressions:
+            print(
+                f"REGRESSION {key}: {measured:.4g} boxes/s,"
+                f" baseline {expected:.4g} boxes/s ({measured / expected - 1:+.0%})"
+            )
+        if regressions:
+            sys.exit(1)
+        print("No regression against the baseline.")
@@ -0,0 +1,88 @@
+"""Benchmark non-maximum suppression against a naive sequential reference."""
+import argparse
+import time
+
+import torch
+
+from anyboxes import TorchBoxes
+
+
+def naive_nms(boxes: torch.Tensor, scores: torch.Tensor, iou_threshold: float):
+    """Sequential greedy NMS comparing every candidate with the kept boxes."""
+    keep = []
+    for i in scores.argsort(descending=True).tolist():
+        box = boxes[i]
+        suppressed = False
+        for j in keep:
+            top_left = torch.maximum(box[:2], boxes[j, :2])
+            bottom_right = torch.minimum(box[2:], boxes[j, 2:])
+            inter = (bottom_right - top_left).clamp(min=0).prod()
+            union = (box[2:] - box[:2]).prod() + (boxes[j, 2:] - boxes[j, :2]).prod()
+            if inter / (union - inter) > iou_threshold:
+                suppressed = True
+                break
+        if not suppressed:
+            keep.append(i)
+    return torch.tensor(keep)
+
+
+def make_detections(n: int, seed: int = 0):
+    """Generate random detections on a 1920x1080 frame."""
+    generator = torch.Generator().manual_seed(seed)
+    centers = torch.rand(n, 2, generator=generator) * torch.tensor([1920, 1080])
+    sizes = torch.rand(n, 2, generator=generator) * 100 + 10
+    boxes = torch.cat([centers - sizes / 2, centers + sizes / 2], dim=1)
+    return boxes, torch.rand(n, generator=generator)
+
+
+def make_chain(n: int):
+    """Generate boxes of decreasing scores, each suppressing only the next one,
+    the worst case of the fixed-point iterations of `nms`.
+    """
+    x_1 = torch.arange(n, dtype=torch.float32) * 2
+    boxes = torch.stack([x_1, torch.zeros(n), x_1 + 10, torch.ones(n)], dim=1)
+    return boxes, torch.linspace(1, 0, n)
+
+
+def timeit(function, repeat: int) -> float:
+    """Return the best wall time of `repeat` runs of `function`."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[500, 1000, 10000, 30000]
+    )
+    parser.add_argument("--iou-threshold", type=float, default=0.5)
+    parser.add_argument("--naive-max-size", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--chain-size", type=int, default=20000)
+    args = parser.parse_args()
+
+    for n in args.sizes:
+        boxes, scores = make_detections(n)
+        tboxes = TorchBoxes.from_two_corners(boxes)
+        keep = tboxes.nms(scores, args.iou_threshold)
+        elapsed = timeit(lambda: tboxes.nms(scores, args.iou_threshold), args.repeat)
+        soft = timeit(lambda: tboxes.soft_nms(scores, top_k=2000), args.repeat)
+        line = (
+            f"n={n:>7} kept={len(keep):>6} nms={elapsed * 1e3:9.2f} ms"
+            f" soft_nms(top_k=2000)={soft * 1e3:9.2f} ms"
+        )
+        if n <= args.naive_max_size:
+            reference = naive_nms(boxes, scores, args.iou_threshold)
+            assert torch.equal(keep, reference), "NMS differs from the reference"
+            naive = timeit(lambda: naive_nms(boxes, scores, args.iou_threshold), 1)
+            line += f" naive={naive * 1e3:9.2f} ms speedup={naive / elapsed:7.1f}x"
+        print(line)
+
+    boxes, scores = make_chain(args.chain_size)
+    tboxes = TorchBoxes.from_two_corners(boxes)
+    elapsed = timeit(lambda: tboxes.nms(scores, args.iou_threshold), args.repeat)
+    print(f"chain n={args.chain_size:>7} nms={elapsed * 1e3:9.2f} ms")
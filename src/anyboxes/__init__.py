@@ -1,6 +1,57 @@
 """Package."""
-from importlib.metadata import version
+from __future__ import annotations
 
-__version__ = version(__name__.split(".", 1)[0])
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from anyboxes.implementations.torch.boxes import TorchBoxes
+if TYPE_CHECKING:
+    from anyboxes.implementations.jax.boxes import JaxBoxes
+    from anyboxes.implementations.numpy.boxes import NumpyBoxes
+    from anyboxes.implementations.tensorflow.boxes import TfBoxes
+    from anyboxes.implementations.torch.batched import BatchedTorchBoxes
+    from anyboxes.implementations.torch.boxes import TorchBoxes
+
+# Implementations are imported on first access, so that `import anyboxes` doesn't
+# import the computing frameworks.
+_LAZY_ATTRIBUTES = {
+    "NumpyBoxes": "anyboxes.implementations.numpy.boxes",
+    "JaxBoxes": "anyboxes.implementations.jax.boxes",
+    "TfBoxes": "anyboxes.implementations.tensorflow.boxes",
+    "TorchBoxes": "anyboxes.implementations.torch.boxes",
+    "BatchedTorchBoxes": "anyboxes.implementations.torch.batched",
+}
+
+__all__ = ["__version__", *_LAZY_ATTRIBUTES]
+
+
+def __getattr__(name: str) -> Any:
+    """Import an implementation, or read the version, on first access.
+
+    Args:
+        name (str): Name of the attribute.
+
+    Raises:
+        AttributeError: Raised if the attribute doesn't exist.
+
+    Returns:
+        Any: Value of the attribute.
+    """
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value = version(__name__.split(".", 1)[0])
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the attributes of the package, including the lazy ones.
+
+    Returns:
+        list[str]: Names of the attributes.
+    """
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from enum import Enum
+from functools import lru_cache
+from typing import Tuple
+
+Matrix = Tuple[Tuple[float, float, float, float], ...]
+
+
+class BoxFormat(Enum):
+    """Enum class for format of boxes."""
+
+    TOP_LEFT_CORNER = "top-left-corner"
+    BOTTOM_LEFT_CORNER = "bottom-left-corner"
+    TWO_CORNERS = "two-corners"
+    CENTER = "center"
+
+
+# Row `i` of a matrix holds the contribution of the input column `i` to every output
+# column, so that a (n, 4) tensor of boxes is converted with `boxes @ matrix`.
+_TO_TWO_CORNERS: dict[BoxFormat, Matrix] = {
+    # (x_1, y_1, w, h) -> (x_1, y_1, x_1 + w, y_1 + h)
+    BoxFormat.TOP_LEFT_CORNER: (
+        (1.0, 0.0, 1.0, 0.0),
+        (0.0, 1.0, 0.0, 1.0),
+        (0.0, 0.0, 1.0, 0.0),
+        (0.0, 0.0, 0.0, 1.0),
+    ),
+    # (x_4, y_4, w, h) -> (x_4, y_4 - h, x_4 + w, y_4)
+    BoxFormat.BOTTOM_LEFT_CORNER: (
+        (1.0, 0.0, 1.0, 0.0),
+        (0.0, 1.0, 0.0, 1.0),
+        (0.0, 0.0, 1.0, 0.0),
+        (0.0, -1.0, 0.0, 0.0),
+    ),
+    BoxFormat.TWO_CORNERS: (
+        (1.0, 0.0, 0.0, 0.0),
+        (0.0, 1.0, 0.0, 0.0),
+        (0.0, 0.0, 1.0, 0.0),
+        (0.0, 0.0, 0.0, 1.0),
+    ),
+    # (x_c, y_c, w, h) -> (x_c - w / 2, y_c - h / 2, x_c + w / 2, y_c + h / 2)
+    BoxFormat.CENTER: (
+        (1.0, 0.0, 1.0, 0.0),
+        (0.0, 1.0, 0.0, 1.0),
+        (-0.5, 0.0, 0.5, 0.0),
+        (0.0, -0.5, 0.0, 0.5),
+    ),
+}
+
+_FROM_TWO_CORNERS: dict[BoxFormat, Matrix] = {
+    # (x_1, y_1, x_3, y_3) -> (x_1, y_1, x_3 - x_1, y_3 - y_1)
+    BoxFormat.TOP_LEFT_CORNER: (
+        (1.0, 0.0, -1.0, 0.0),
+        (0.0, 1.0, 0.0, -1.0),
+        (0.0, 0.0, 1.0, 0.0),
+        (0.0, 0.0, 0.0, 1.0),
+    ),
+    # (x_1, y_1, x_3, y_3) -> (x_1, y_3, x_3 - x_1, y_3 - y_1)
+    BoxFormat.BOTTOM_LEFT_CORNER: (
+        (1.0, 0.0, -1.0, 0.0),
+        (0.0, 0.0, 0.0, -1.0),
+        (0.0, 0.0, 1.0, 0.0),
+        (0.0, 1.0, 0.0, 1.0),
+    ),
+    BoxFormat.TWO_CORNERS: _TO_TWO_CORNERS[BoxFormat.TWO_CORNERS],
+    # (x_1, y_1, x_3, y_3) -> ((x_1 + x_3) / 2, (y_1 + y_3) / 2, x_3 - x_1, y_3 - y_1)
+    BoxFormat.CENTER: (
+        (0.5, 0.0, -1.0, 0.0),
+        (0.0, 0.5, 0.0, -1.0),
+        (0.5, 0.0, 1.0, 0.0),
+        (0.0, 0.5, 0.0, 1.0),
+    ),
+}
+
+
+@lru_cache(maxsize=None)
+def get_conversion_matrix(in_format: BoxFormat, out_format: BoxFormat) -> Matrix:
+    """Return the matrix converting boxes from a format to another one.
+
+    Args:
+        in_format (BoxFormat): Format of the input boxes.
+        out_format (BoxFormat): Format of the output boxes.
+
+    Returns:
+        Matrix: 4x4 matrix `m` such that `out = boxes @ m`.
+    """
+    to_two_corners = _TO_TWO_CORNERS[in_format]
+    from_two_corners = _FROM_TWO_CORNERS[out_format]
+    return tuple(
+        tuple(
+            sum(to_two_corners[i][k] * from_two_corners[k][j] for k in range(4))
+            for j in range(4)
+        )
+        for i in range(4)
+    )
@@ -0,0 +1,20 @@
+from typing import Tuple
+
+from jax import Array
+from jaxtyping import Shaped
+
+from .coordinates import Coordinates
+
+CoordArrayType = Shaped[Array, "batch"]
+
+BoxArrayType = Shaped[Array, "4"]
+BoxesArrayType = Shaped[Array, "batch 4"]
+MaskArrayType = Shaped[Array, "batch height width"]
+OverlapsArrayType = Shaped[Array, "batch ..."]
+
+FourCornersCoordinates = Tuple[
+    Coordinates,
+    Coordinates,
+    Coordinates,
+    Coordinates,
+]
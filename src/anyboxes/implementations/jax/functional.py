@@ -0,0 +1,298 @@
+from __future__ import annotations
+
+import math
+from functools import partial
+from typing import TYPE_CHECKING
+
+from anyboxes._errors import OptionalDependencyImportError
+from anyboxes.implementations.box_format import BoxFormat, get_conversion_matrix
+
+try:
+    import jax
+    import jax.numpy as jnp
+except ModuleNotFoundError:
+    raise OptionalDependencyImportError("jax")
+
+if TYPE_CHECKING:
+    from jaxtyping import Shaped
+
+    from ._typing import (
+        BoxesArrayType,
+        CoordArrayType,
+        MaskArrayType,
+        OverlapsArrayType,
+    )
+
+
+def _to_float(boxes: BoxesArrayType) -> BoxesArrayType:
+    """Convert integer boxes to the default floating point dtype.
+
+    Args:
+        boxes (BoxesArrayType): boxes of size (..., 4).
+
+    Returns:
+        BoxesArrayType: floating point boxes of size (..., 4).
+    """
+    boxes = jnp.asarray(boxes)
+    if jnp.issubdtype(boxes.dtype, jnp.floating):
+        return boxes
+    return boxes.astype(jnp.result_type(float))
+
+
+def _order_corners(boxes: BoxesArrayType) -> BoxesArrayType:
+    """Reorder the corners of packed boxes so that x_1 <= x_3 and y_1 <= y_3.
+
+    Args:
+        boxes (BoxesArrayType): Packed boxes of size (..., 4).
+
+    Returns:
+        BoxesArrayType: Packed boxes of size (..., 4).
+    """
+    return jnp.concatenate(
+        [
+            jnp.minimum(boxes[..., :2], boxes[..., 2:]),
+            jnp.maximum(boxes[..., :2], boxes[..., 2:]),
+        ],
+        axis=-1,
+    )
+
+
+@partial(jax.jit, static_argnames=("in_format", "out_format"))
+def convert_boxes(
+    boxes: BoxesArrayType,
+    in_format: BoxFormat | str,
+    out_format: BoxFormat | str,
+) -> BoxesArrayType:
+    """Convert boxes from a format to another one with a single matrix
+    multiply.
+
+    Args:
+        boxes (BoxesArrayType): boxes of size (..., 4) in `in_format`.
+        in_format (BoxFormat | str): Format of the input boxes.
+        out_format (BoxFormat | str): Format of the output boxes.
+
+    Returns:
+        BoxesArrayType: boxes of size (..., 4) in `out_format`. Integer boxes are
+            converted to the default floating point dtype.
+    """
+    in_format, out_format = BoxFormat(in_format), BoxFormat(out_format)
+    boxes = _to_float(boxes)
+    if in_format == out_format:
+        return boxes
+    matrix = jnp.asarray(get_conversion_matrix(in_format, out_format), boxes.dtype)
+    return boxes @ matrix
+
+
+@jax.jit
+def square_boxes(boxes: BoxesArrayType) -> BoxesArrayType:
+    """Pad packed boxes so that they become squares, around the same center.
+
+    Args:
+        boxes (BoxesArrayType): Packed boxes of size (..., 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+
+    Returns:
+        BoxesArrayType: Packed boxes of size (..., 4).
+    """
+    half_size = jnp.abs(boxes[..., 2:] - boxes[..., :2]).max(axis=-1) / 2
+    center = (boxes[..., :2] + boxes[..., 2:]) / 2
+    return jnp.concatenate(
+        [center - half_size[..., None], center + half_size[..., None]], axis=-1
+    )
+
+
+@jax.jit
+def flip_boxes(boxes: BoxesArrayType, height: float | CoordArrayType) -> BoxesArrayType:
+    """Flip the y axis of packed boxes given an image height.
+
+    Args:
+        boxes (BoxesArrayType): Packed boxes of size (..., 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        height (float | CoordArrayType): height of the image, broadcast against
+            the boxes.
+
+    Returns:
+        BoxesArrayType: Packed boxes of size (..., 4).
+    """
+    height = jnp.asarray(height, boxes.dtype)[..., None]
+    return boxes.at[..., 1::2].set(height - boxes[..., 1::2])
+
+
+def _compute_overlaps(
+    boxes_1: BoxesArrayType,
+    boxes_2: BoxesArrayType,
+    metric: str,
+    eps: float,
+) -> OverlapsArrayType:
+    """Compute an overlap metric between broadcastable arrays of boxes.
+
+    Args:
+        boxes_1 (BoxesArrayType): Packed boxes (x_1, y_1, x_3, y_3).
+        boxes_2 (BoxesArrayType): Packed boxes (x_1, y_1, x_3, y_3).
+        metric (str): One of `iou`, `giou`, `diou` or `ciou`.
+        eps (float): Small value avoiding divisions by zero.
+
+    Returns:
+        OverlapsArrayType: Overlap metric of the broadcast boxes.
+    """
+    boxes_1, boxes_2 = _order_corners(boxes_1), _order_corners(boxes_2)
+    top_left_1, bottom_right_1 = boxes_1[..., :2], boxes_1[..., 2:]
+    top_left_2, bottom_right_2 = boxes_2[..., :2], boxes_2[..., 2:]
+    size_1 = bottom_right_1 - top_left_1
+    size_2 = bottom_right_2 - top_left_2
+
+    inter = jnp.prod(
+        jnp.clip(
+            jnp.minimum(bottom_right_1, bottom_right_2)
+            - jnp.maximum(top_left_1, top_left_2),
+            0,
+        ),
+        axis=-1,
+    )
+    union = size_1.prod(axis=-1) + size_2.prod(axis=-1) - inter
+    iou = inter / jnp.maximum(union, eps)
+    if metric == "iou":
+        return iou
+
+    enclosing = jnp.maximum(bottom_right_1, bottom_right_2) - jnp.minimum(
+        top_left_1, top_left_2
+    )
+    if metric == "giou":
+        enclosing_area = jnp.maximum(enclosing.prod(axis=-1), eps)
+        return iou - (enclosing_area - union) / enclosing_area
+
+    centers_distance = (
+        (((top_left_2 + bottom_right_2) - (top_left_1 + bottom_right_1)) / 2) ** 2
+    ).sum(axis=-1)
+    diagonal = jnp.maximum((enclosing**2).sum(axis=-1), eps)
+    diou = iou - centers_distance / diagonal
+    if metric == "diou":
+        return diou
+
+    v = (4 / math.pi**2) * (
+        jnp.arctan(size_2[..., 0] / jnp.maximum(size_2[..., 1], eps))
+        - jnp.arctan(size_1[..., 0] / jnp.maximum(size_1[..., 1], eps))
+    ) ** 2
+    alpha = v / jnp.maximum(1 - iou + v, eps)
+    return diou - alpha * v
+
+
+@partial(jax.jit, static_argnames=("metric", "pairwise"))
+def compute_overlaps(
+    boxes_1: BoxesArrayType,
+    boxes_2: BoxesArrayType,
+    metric: str = "iou",
+    pairwise: bool = True,
+    eps: float = 1e-7,
+) -> OverlapsArrayType:
+    """Compute an overlap metric between two sets of boxes.
+
+    Args:
+        boxes_1 (BoxesArrayType): Packed boxes of size (n, 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        boxes_2 (BoxesArrayType): Packed boxes of size (m, 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        metric (str): One of `iou`, `giou`, `diou` or `ciou`.
+        pairwise (bool): Compare every box of `boxes_1` with every box of `boxes_2`
+            if True, else compare boxes with the same index.
+        eps (float): Small value avoiding divisions by zero.
+
+    Returns:
+        OverlapsArrayType: Array of size (n, m) in pairwise mode, else (n).
+    """
+    if metric not in ("iou", "giou", "diou", "ciou"):
+        raise ValueError(f"{metric!r} is not a valid overlap metric.")
+    boxes_1, boxes_2 = _to_float(boxes_1), _to_float(boxes_2)
+    if pairwise:
+        boxes_1, boxes_2 = boxes_1[..., :, None, :], boxes_2[..., None, :, :]
+    return _compute_overlaps(boxes_1, boxes_2, metric, eps)
+
+
+def _get_pixel_bounds(
+    boxes: BoxesArrayType, width: int, height: int
+) -> tuple[CoordArrayType, CoordArrayType, CoordArrayType, CoordArrayType]:
+    """Return the pixel bounds of boxes, truncated to integers and clipped to
+    the mask.
+
+    Args:
+        boxes (BoxesArrayType): Packed boxes of size (..., 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        width (int): mask width.
+        height (int): mask height.
+
+    Returns:
+        tuple[CoordArrayType, CoordArrayType, CoordArrayType, CoordArrayType]: x_1, y_1, x_3, y_3.
+    """
+    bounds = boxes.astype(jnp.int32)
+    return (
+        jnp.clip(bounds[..., 0], 0, width),
+        jnp.clip(bounds[..., 1], 0, height),
+        jnp.clip(bounds[..., 2], 0, width),
+        jnp.clip(bounds[..., 3], 0, height),
+    )
+
+
+@partial(jax.jit, static_argnames=("width", "height", "dtype"))
+def build_binary_masks(
+    boxes: BoxesArrayType,
+    width: int,
+    height: int,
+    dtype: jnp.dtype = jnp.uint8,
+) -> MaskArrayType:
+    """Build one mask per box with ones everywhere and zeros inside the box, by
+    broadcasting comparisons against `arange` grids.
+
+    Args:
+        boxes (BoxesArrayType): Packed boxes of size (n, 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        width (int): mask width.
+        height (int): mask height.
+        dtype (jnp.dtype): dtype of the masks.
+
+    Returns:
+        MaskArrayType: masks of size (n, height, width).
+    """
+    x_1, y_1, x_3, y_3 = _get_pixel_bounds(boxes, width, height)
+    cols, rows = jnp.arange(width), jnp.arange(height)
+    outside_cols = (cols < x_1[..., None]) | (cols >= x_3[..., None])
+    outside_rows = (rows < y_1[..., None]) | (rows >= y_3[..., None])
+    return (outside_rows[..., :, None] | outside_cols[..., None, :]).astype(dtype)
+
+
+@partial(jax.jit, static_argnames=("width", "height", "num_images", "dtype"))
+def build_union_binary_masks(
+    boxes: BoxesArrayType,
+    width: int,
+    height: int,
+    image_indices: CoordArrayType | None = None,
+    num_images: int = 1,
+    dtype: jnp.dtype = jnp.uint8,
+) -> Shaped[jax.Array, "image height width"]:  # noqa: F722
+    """Build the union of the masks of all boxes of an image, with ones
+    everywhere and zeros inside any box. The masks are accumulated with a 2D
+    difference array, so no (n, height, width) array is allocated.
+
+    Args:
+        boxes (BoxesArrayType): Packed boxes of size (n, 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        width (int): mask width.
+        height (int): mask height.
+        image_indices (CoordArrayType | None): Index of the image of every box,
+            all boxes belong to a single image if None.
+        num_images (int): Number of images, static under `jax.jit`.
+        dtype (jnp.dtype): dtype of the masks.
+
+    Returns:
+        Shaped[jax.Array, "image height width"]: masks of size (num_images, height, width).
+    """
+    if image_indices is None:
+        image_indices = jnp.zeros(len(boxes), dtype=jnp.int32)
+    x_1, y_1, x_3, y_3 = _get_pixel_bounds(boxes, width, height)
+    valid = ((x_3 > x_1) & (y_3 > y_1)).astype(jnp.int32)
+    diff = jnp.zeros((num_images, height + 1, width + 1), dtype=jnp.int32)
+    diff = diff.at[image_indices, y_1, x_1].add(valid)
+    diff = diff.at[image_indices, y_1, x_3].add(-valid)
+    diff = diff.at[image_indices, y_3, x_1].add(-valid)
+    diff = diff.at[image_indices, y_3, x_3].add(valid)
+    coverage = diff.cumsum(axis=1).cumsum(axis=2)
+    return (coverage[:, :height, :width] == 0).astype(dtype)
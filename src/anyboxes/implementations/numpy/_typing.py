@@ -0,0 +1,19 @@
+from typing import Tuple
+
+from jaxtyping import Shaped
+from numpy import ndarray
+
+from .coordinates import Coordinates
+
+CoordArrayType = Shaped[ndarray, "batch"]
+
+BoxArrayType = Shaped[ndarray, "4"]
+BoxesArrayType = Shaped[ndarray, "batch 4"]
+MaskArrayType = Shaped[ndarray, "batch height width"]
+
+FourCornersCoordinates = Tuple[
+    Coordinates,
+    Coordinates,
+    Coordinates,
+    Coordinates,
+]
@@ -0,0 +1,508 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from anyboxes._errors import MissingToMethodError, OptionalDependencyImportError
+from anyboxes.implementations.box_format import BoxFormat
+from anyboxes.implementations.origin import Origin
+
+from .coordinates import Coordinates, Size
+from .functional import convert_boxes
+from .masks import build_binary_masks, build_union_binary_masks
+
+if TYPE_CHECKING:
+    from jaxtyping import Array
+    from numpy.typing import NDArray
+    from tensorflow import Tensor
+    from torch import Tensor as TorchTensor
+
+    from ._typing import (
+        BoxesArrayType,
+        CoordArrayType,
+        FourCornersCoordinates,
+        MaskArrayType,
+    )
+
+
+class NumpyBoxes:
+    """Represent a collection of bounding boxes with NumPy arrays.
+    Coordinates are represented as follow:
+    1: top-left corner
+    2: top-right corner
+    3: bottom-right corner
+    3: bottom-left corner.
+
+    The boxes are stored in a single packed array of size (n, 4) containing the
+    (x_1, y_1, x_3, y_3) for all boxes. Corners coordinates, center coordinates
+    and size are derived from it on access.
+    The `to` methods are inplace and produce a `boxes_` attribute.
+    """
+
+    def __init__(self, boxes: BoxesArrayType, origin: Origin):
+        """Make a Boxes object. Object instanced is expected by classmethod
+        `from_center`, `from_top_left_corner` or `from_two_corners`.
+
+        Args:
+            boxes (BoxesArrayType): Packed boxes of size (n, 4),
+                containing the (x_1, y_1, x_3, y_3) for all boxes.
+            origin (Origin): Origin of Boxes.
+        """
+        self._boxes = boxes
+        self._origin = origin
+
+    @property
+    def corners_coordinates(self) -> FourCornersCoordinates:
+        """Return all corners coordinates as views of the packed boxes.
+
+        Returns:
+            FourCornersCoordinates: All corners coordinates.
+        """
+        x_1, y_1, x_3, y_3 = self._boxes.T
+        return (
+            Coordinates(x_1, y_1),
+            Coordinates(x_3, y_1),
+            Coordinates(x_3, y_3),
+            Coordinates(x_1, y_3),
+        )
+
+    @property
+    def center_coordinates(self) -> Coordinates:
+        """Return center coordinates computed from the packed boxes.
+
+        Returns:
+            Coordinates: Center coordinates.
+        """
+        x_1, y_1, x_3, y_3 = self._boxes.T
+        return Coordinates((x_1 + x_3) / 2, (y_1 + y_3) / 2)
+
+    @property
+    def size(self) -> Size:
+        """Return size computed from the packed boxes. Size is the absolute
+        extent of the boxes, so it stays positive once the origin has been
+        flipped.
+
+        Returns:
+            Size: Size of Boxes.
+        """
+        w, h = np.abs(self._boxes[:, 2:] - self._boxes[:, :2]).T
+        return Size(w, h)
+
+    def __len__(self) -> int:
+        """Return the number of Boxes.
+
+        Returns:
+            int: Number of Boxes.
+        """
+        return len(self._boxes)
+
+    def __getitem__(self, index: int | slice | NDArray) -> NumpyBoxes:
+        """Return a subset of the Boxes, slices share the storage of the Boxes.
+
+        Args:
+            index (int | slice | NDArray): Index of the boxes to keep.
+
+        Returns:
+            NumpyBoxes: Subset of the Boxes.
+        """
+        return NumpyBoxes(self._boxes[index].reshape(-1, 4), self._origin)
+
+    @property
+    def origin(self) -> str:
+        """Return the value of the origin of the Boxes.
+
+        Returns:
+            str: name of the origin
+        """
+        return self._origin.value
+
+    def flip_origin(self, height: int):
+        """Flip the origin of the Boxes given an image height. Work in place.
+
+        Args:
+            height (int): height of the image.
+
+        Returns:
+            self
+        """
+        if len(self) and height < self.size.h.min():
+            raise ValueError("`width` or `height` must be higher than boxes.")
+
+        self._boxes[:, 1::2] = height - self._boxes[:, 1::2]
+        self._origin = (
+            Origin.BOTTOM_LEFT if self._origin == Origin.TOP_LEFT else Origin.TOP_LEFT
+        )
+        return self
+
+    def __convert_to(self, box_format: BoxFormat) -> BoxesArrayType:
+        """Convert the packed boxes to a given format. Sizes are absolute
+        extents, so they stay positive once the origin has been flipped.
+
+        Args:
+            box_format (BoxFormat): Output format.
+
+        Returns:
+            BoxesArrayType: boxes of size (n, 4) in `box_format`.
+        """
+        boxes = convert_boxes(self._boxes, BoxFormat.TWO_CORNERS, box_format)
+        if box_format != BoxFormat.TWO_CORNERS:
+            np.abs(boxes[:, 2:], out=boxes[:, 2:])
+        return boxes
+
+    @classmethod
+    def from_center(
+        cls, boxes: BoxesArrayType, origin: Origin = Origin.TOP_LEFT
+    ) -> NumpyBoxes:
+        """Generate Boxes from np.ndarray containing center coordinates and
+        size.
+
+        Args:
+            boxes (np.ndarray) : boxes of size (n, 4),
+                containing the (x_c, y_c, w, h) for all boxes
+            origin (Origin): default is `top-left`
+
+        Returns:
+            Boxes : object of class Boxes.
+        """
+        return cls(
+            convert_boxes(boxes, BoxFormat.CENTER, BoxFormat.TWO_CORNERS), origin
+        )
+
+    @classmethod
+    def from_top_left_corner(cls, boxes: BoxesArrayType) -> NumpyBoxes:
+        """Generate Boxes from np.ndarray containing top-left coordinates and
+        size.
+
+        Args:
+            boxes (np.ndarray) : boxes of size (n, 4),
+                containing the (x_1, y_1, w, h) for all boxes
+
+        Returns:
+            Boxes : object of class Boxes
+        """
+        return cls(
+            convert_boxes(boxes, BoxFormat.TOP_LEFT_CORNER, BoxFormat.TWO_CORNERS),
+            Origin.TOP_LEFT,
+        )
+
+    @classmethod
+    def from_bottom_left_corner(cls, boxes: BoxesArrayType) -> NumpyBoxes:
+        """Generate Boxes from np.ndarray containing bottom-left coordinates
+        and size.
+
+        Args:
+            boxes (np.ndarray) : boxes of size (n, 4),
+                containing the (x_4, y_4, w, h) for all boxes
+
+        Returns:
+            Boxes : object of class Boxes
+        """
+        return cls(
+            convert_boxes(boxes, BoxFormat.BOTTOM_LEFT_CORNER, BoxFormat.TWO_CORNERS),
+            Origin.BOTTOM_LEFT,
+        )
+
+    @classmethod
+    def from_two_corners(
+        cls, boxes: BoxesArrayType, origin: Origin = Origin.TOP_LEFT
+    ) -> NumpyBoxes:
+        """Generate Boxes from np.ndarray containing top-left and bottom-
+        right coordinates.
+
+        Args:
+            boxes (np.ndarray) : boxes of size (n, 4),
+                containing the (x_1, y_1, x_3, y_3) for all boxes
+            origin (Origin): default is `top-left`
+
+        Returns:
+            Boxes : object of class Boxes
+        """
+        return cls(
+            convert_boxes(boxes, BoxFormat.TWO_CORNERS, BoxFormat.TWO_CORNERS), origin
+        )
+
+    def to_center(self):
+        """Generate boxes (inplace method) : boxes of size (n, 4),
+        containing the (x_c, y_c, w, h) for all boxes.
+
+        Returns:
+            self
+        """
+        self.boxes_ = self.__convert_to(BoxFormat.CENTER)
+        return self
+
+    def to_top_left_corner(self):
+        """Generate boxes (inplace method) : boxes of size (n, 4),
+        containing the (x_1, y_1, w, h) for all boxes.
+
+        Returns:
+            self
+        """
+        self.boxes_ = self.__convert_to(BoxFormat.TOP_LEFT_CORNER)
+        return self
+
+    def to_bottom_left_corner(self):
+        """Generate boxes (inplace method): boxes of size (n, 4), containing
+        the (x_4, y_4, w, h) for all boxes.
+
+        Returns:
+            self
+        """
+        self.boxes_ = self.__convert_to(BoxFormat.BOTTOM_LEFT_CORNER)
+        return self
+
+    def to_two_corners(self):
+        """Generate boxes (inplace method) : boxes of size (n, 4), containing the (x_1, y_1, x_3, y_3) for all boxes.
+
+        Returns:
+            self
+        """
+        self.boxes_ = self.__convert_to(BoxFormat.TWO_CORNERS)
+        return self
+
+    def square(self):
+        """Pad the box so that they become squares. Works in place.
+
+        Returns:
+            self
+        """
+        self._boxes = self.__compute_squared_boxes()
+        return self
+
+    def squared(self) -> tuple[Size, FourCornersCoordinates]:
+        """Pad the box so that they become squares.
+
+        Returns:
+            size : Size of the Boxes.
+            Boxes : A different Boxes object containing the squared boxes.
+        """
+        squared = NumpyBoxes(self.__compute_squared_boxes(), self._origin)
+        return squared.size, squared.corners_coordinates
+
+    def __compute_squared_boxes(self) -> BoxesArrayType:
+        """Generate packed boxes padded so that they become squares.
+
+        Returns:
+            BoxesArrayType: Packed boxes of size (n, 4).
+        """
+        half_size = np.abs(self._boxes[:, 2:] - self._boxes[:, :2]).max(axis=1) / 2
+        center = (self._boxes[:, :2] + self._boxes[:, 2:]) / 2
+        return np.concatenate(
+            [center - half_size[:, None], center + half_size[:, None]], axis=1
+        )
+
+    def get_binary_mask(
+        self,
+        width: int,
+        height: int,
+        merge: bool = False,
+        image_indices: CoordArrayType | None = None,
+        num_images: int | None = None,
+        dtype: np.dtype = np.uint8,
+    ) -> MaskArrayType:
+        """Build a mask to hide the parts of the image inside the bounding
+        boxes.
+
+        Args:
+            width (int) : desired mask width
+            height (int) : desired mask height
+            merge (bool) : return the union of the masks instead of one mask per box
+            image_indices (CoordArrayType | None) : index of the image of every box,
+                used with `merge` to build one union mask per image
+            num_images (int | None) : number of images, inferred from
+                `image_indices` if None
+            dtype (np.dtype) : dtype of the mask, default is `np.uint8`
+        Returns:
+            np.ndarray : binary array containing the mask (has ones everywhere,
+                with zeroes inside the bounding boxes), size (n_boxes, height, width),
+                (height, width) if `merge` or (num_images, height, width) if `merge`
+                with `image_indices`
+        """
+        size = self.size
+        if len(self) and (width < size.w.min() or height < size.h.min()):
+            raise ValueError("`width` or `height` must be higher than boxes.")
+        if not merge:
+            return build_binary_masks(self._boxes, width, height, dtype)
+        masks = build_union_binary_masks(
+            self._boxes, width, height, image_indices, num_images, dtype
+        )
+        return masks[0] if image_indices is None else masks
+
+    @property
+    def as_dict(self) -> dict[str, dict[str, list[int | float]]]:
+        """Return boxes' data as dictionnary.
+
+        Returns:
+            dict[str, dict[str, np.ndarray]]: dict containing coordinates and size of Boxes.
+        """
+        c_1, c_2, c_3, c_4 = self.corners_coordinates
+        return {
+            "1": c_1.to_dict(),
+            "2": c_2.to_dict(),
+            "3": c_3.to_dict(),
+            "4": c_4.to_dict(),
+            "c": self.center_coordinates.to_dict(),
+            "size": self.size.to_dict(),
+        }
+
+    @property
+    def as_tuple(self):
+        """Return boxes' data as tuple.
+
+        Returns:
+            tuple[CoordArrayType]: tuple containing coordinates and size of Boxes.
+        """
+        c_1, c_2, c_3, c_4 = self.corners_coordinates
+        center_coordinates, size = self.center_coordinates, self.size
+        return (
+            c_1.x.tolist(),
+            c_1.y.tolist(),
+            c_2.x.tolist(),
+            c_2.y.tolist(),
+            c_3.x.tolist(),
+            c_3.y.tolist(),
+            c_4.x.tolist(),
+            c_4.y.tolist(),
+            center_coordinates.x.tolist(),
+            center_coordinates.y.tolist(),
+            size.w.tolist(),
+            size.h.tolist(),
+        )
+
+    def get_numpy(self, copy: bool | None = None) -> NDArray:
+        """Return boxes' data as float32 `np.ndarray`.
+
+        Args:
+            copy (bool | None): always copy if True, return the boxes themselves
+                when they are float32 if None, never copy if False.
+
+        Raises:
+            MissingToMethodError: Raised if no `to` methods has been run.
+            ValueError: Raised if `copy` is False and the boxes aren't float32.
+
+        Returns:
+            NDArray: Return boxes as Numpy array.
+        """
+        if not hasattr(self, "boxes_"):
+            raise MissingToMethodError
+        if copy is False and self.boxes_.dtype != np.float32:
+            raise ValueError("Unable to avoid a copy: boxes must be of dtype float32.")
+        return self.boxes_.astype(np.float32, copy=bool(copy))
+
+    def get_array(self, copy: bool | None = None) -> Array:
+        """Return boxes' data as float32 JAX's `Array`.
+
+        Args:
+            copy (bool | None): always copy if True, share the memory of the boxes
+                when they are float32 if None, never copy if False.
+
+        Raises:
+            OptionalDependencyImportError: Raised if JAX is missing.
+            MissingToMethodError: Raised if no `to` methods has been run.
+
+        Returns:
+            Array: Return boxes as JAX array.
+        """
+        boxes = self.get_numpy(copy)
+        try:
+            import jax.numpy as jnp
+        except ModuleNotFoundError:
+            raise OptionalDependencyImportError("jax")
+
+        return jnp.from_dlpack(boxes)
+
+    def get_tf_tensor(self, copy: bool | None = None) -> Tensor:
+        """Return boxes' data as float32 Tensorflow's `Tensor`.
+
+        Args:
+            copy (bool | None): always copy if True, share the memory of the boxes
+                when they are float32 if None, never copy if False.
+
+        Raises:
+            OptionalDependencyImportError: Raised if Tensorflow is missing.
+            MissingToMethodError: Raised if no `to` methods has been run.
+
+        Returns:
+            Tensor: Return boxes as Tensorflow tensor.
+        """
+        boxes = self.get_numpy(copy)
+        try:
+            import tensorflow as tf
+        except ModuleNotFoundError:
+            raise OptionalDependencyImportError("tensorflow")
+
+        return tf.experimental.dlpack.from_dlpack(boxes.__dlpack__())
+
+    def get_tensor(self, copy: bool | None = None) -> TorchTensor:
+        """Return boxes' data as float32 `torch.Tensor`.
+
+        Args:
+            copy (bool | None): always copy if True, share the memory of the boxes
+                when they are float32 if None, never copy if False.
+
+        Raises:
+            OptionalDependencyImportError: Raised if PyTorch is missing.
+            MissingToMethodError: Raised if no `to` methods has been run.
+
+        Returns:
+            TorchTensor: Return boxes as PyTorch tensor.
+        """
+        boxes = self.get_numpy(copy)
+        try:
+            import torch
+        except ModuleNotFoundError:
+            raise OptionalDependencyImportError("torch")
+
+        return torch.from_numpy(boxes)
+
+    @property
+    def as_numpy(self) -> NDArray:
+        """Return boxes' data as `np.ndarray`.
+
+        Raises:
+            MissingToMethodError: Raised if no `to` methods has been run.
+
+        Returns:
+            NDArray: Return boxes as Numpy array.
+        """
+        return self.get_numpy()
+
+    @property
+    def as_array(self) -> Array:
+        """Return boxes' data as JAX's `Array`.
+
+        Raises:
+            OptionalDependencyImportError: Raised if JAX is missing.
+            MissingToMethodError: Raised if no `to` methods has been run.
+
+        Returns:
+            Array: Return boxes as JAX array.
+        """
+        return self.get_array()
+
+    @property
+    def as_tf_tensor(self) -> Tensor:
+        """Return boxes' data as Tensorflow's `Tensor`.
+
+        Raises:
+            OptionalDependencyImportError: Raised if Tensorflow is missing.
+            MissingToMethodError: Raised if no `to` methods has been run.
+
+        Returns:
+            Tensor: Return boxes as Tensorflow tensor.
+        """
+        return self.get_tf_tensor()
+
+    @property
+    def as_tensor(self) -> TorchTensor:
+        """Return boxes' data as `torch.Tensor`.
+
+        Raises:
+            OptionalDependencyImportError: Raised if PyTorch is missing.
+            MissingToMethodError: Raised if no `to` methods has been run.
+
+        Returns:
+            TorchTensor: Return boxes as PyTorch tensor.
+        """
+        return self.get_tensor()
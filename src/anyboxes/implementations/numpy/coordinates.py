@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._typing import CoordArrayType
+
+
+class Coordinates:
+    """Represent a set of corner coordinates in 2D space."""
+
+    def __init__(self, x: CoordArrayType, y: CoordArrayType):
+        """Make a Coordinates object.
+
+        Args:
+            x (CoordArrayType): np.ndarray containing `x` coordinates.
+            y (CoordArrayType): np.ndarray containing `y` coordinates.
+        """
+        self.x = x
+        self.y = y
+        self.batch_size: int = len(x)
+
+    def to_dict(self) -> dict[str, list[int | float]]:
+        """Return x and y as dict.
+
+        Returns:
+            dict[str, CoordArrayType]: dict containing coordinates arrays.
+        """
+        return {"x": self.x.tolist(), "y": self.y.tolist()}
+
+
+class Size:
+    """Represent size of a bbox in 2D space."""
+
+    def __init__(self, w: CoordArrayType, h: CoordArrayType):
+        """Make a Size object.
+
+        Args:
+            w (CoordArrayType): np.ndarray containing `w` coordinates.
+            h (CoordArrayType): np.ndarray containing `h` coordinates.
+        """
+        self.w = w
+        self.h = h
+        self.batch_size: int = len(w)
+
+    def to_dict(self) -> dict[str, list[int | float]]:
+        """Return w and h as dict.
+
+        Returns:
+            dict[str, CoordArrayType]: dict containing size arrays.
+        """
+        return {"w": self.w.tolist(), "h": self.h.tolist()}
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from anyboxes.implementations.box_format import BoxFormat, get_conversion_matrix
+
+if TYPE_CHECKING:
+    from ._typing import BoxesArrayType
+
+
+@lru_cache(maxsize=None)
+def _get_matrix(
+    in_format: BoxFormat, out_format: BoxFormat, dtype: np.dtype
+) -> np.ndarray:
+    """Return the conversion matrix as an array, it is allocated once per
+    format and dtype.
+
+    Args:
+        in_format (BoxFormat): Format of the input boxes.
+        out_format (BoxFormat): Format of the output boxes.
+        dtype (np.dtype): dtype of the matrix.
+
+    Returns:
+        np.ndarray: Matrix of size (4, 4).
+    """
+    matrix = np.array(get_conversion_matrix(in_format, out_format), dtype=dtype)
+    matrix.flags.writeable = False
+    return matrix
+
+
+def convert_boxes(
+    boxes: BoxesArrayType,
+    in_format: BoxFormat | str,
+    out_format: BoxFormat | str,
+) -> BoxesArrayType:
+    """Convert boxes from a format to another one with a single matrix
+    multiply, no intermediate Boxes object is built.
+
+    Args:
+        boxes (BoxesArrayType): boxes of size (..., 4) in `in_format`.
+        in_format (BoxFormat | str): Format of the input boxes.
+        out_format (BoxFormat | str): Format of the output boxes.
+
+    Returns:
+        BoxesArrayType: New array of boxes of size (..., 4) in `out_format`.
+            Integer boxes are converted to float64.
+    """
+    in_format, out_format = BoxFormat(in_format), BoxFormat(out_format)
+    boxes = np.asarray(boxes)
+    dtype = boxes.dtype if np.issubdtype(boxes.dtype, np.floating) else np.float64
+    if in_format == out_format:
+        return boxes.astype(dtype, copy=True)
+    return boxes.astype(dtype, copy=False) @ _get_matrix(
+        in_format, out_format, np.dtype(dtype)
+    )
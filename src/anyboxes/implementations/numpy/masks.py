@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from jaxtyping import Shaped
+
+    from ._typing import BoxesArrayType, CoordArrayType, MaskArrayType
+
+
+def _get_pixel_bounds(
+    boxes: BoxesArrayType, width: int, height: int
+) -> tuple[CoordArrayType, CoordArrayType, CoordArrayType, CoordArrayType]:
+    """Return the pixel bounds of boxes, truncated to integers and clipped to
+    the mask.
+
+    Args:
+        boxes (BoxesArrayType): Packed boxes of size (n, 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        width (int): mask width.
+        height (int): mask height.
+
+    Returns:
+        tuple[CoordArrayType, CoordArrayType, CoordArrayType, CoordArrayType]: x_1, y_1, x_3, y_3.
+    """
+    x_1, y_1, x_3, y_3 = boxes.astype(np.int64).T
+    return (
+        x_1.clip(0, width),
+        y_1.clip(0, height),
+        x_3.clip(0, width),
+        y_3.clip(0, height),
+    )
+
+
+def build_binary_masks(
+    boxes: BoxesArrayType,
+    width: int,
+    height: int,
+    dtype: np.dtype = np.uint8,
+) -> MaskArrayType:
+    """Build one mask per box with ones everywhere and zeros inside the box, by
+    broadcasting comparisons against `arange` grids.
+
+    Args:
+        boxes (BoxesArrayType): Packed boxes of size (n, 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        width (int): mask width.
+        height (int): mask height.
+        dtype (np.dtype): dtype of the masks.
+
+    Returns:
+        MaskArrayType: masks of size (n, height, width).
+    """
+    x_1, y_1, x_3, y_3 = _get_pixel_bounds(boxes, width, height)
+    cols, rows = np.arange(width), np.arange(height)
+    outside_cols = (cols < x_1[:, None]) | (cols >= x_3[:, None])
+    outside_rows = (rows < y_1[:, None]) | (rows >= y_3[:, None])
+    return (outside_rows[:, :, None] | outside_cols[:, None, :]).astype(dtype)
+
+
+def build_union_binary_masks(
+    boxes: BoxesArrayType,
+    width: int,
+    height: int,
+    image_indices: CoordArrayType | None = None,
+    num_images: int | None = None,
+    dtype: np.dtype = np.uint8,
+) -> Shaped[np.ndarray, "image height width"]:  # noqa: F722
+    """Build the union of the masks of all boxes of an image, with ones
+    everywhere and zeros inside any box. The masks are accumulated with a 2D
+    difference array, so no (n, height, width) array is allocated.
+
+    Args:
+        boxes (BoxesArrayType): Packed boxes of size (n, 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        width (int): mask width.
+        height (int): mask height.
+        image_indices (CoordArrayType | None): Index of the image of every box,
+            all boxes belong to a single image if None.
+        num_images (int | None): Number of images, inferred from `image_indices`
+            if None.
+        dtype (np.dtype): dtype of the masks.
+
+    Returns:
+        Shaped[np.ndarray, "image height width"]: masks of size (num_images, height, width).
+    """
+    if image_indices is None:
+        image_indices = np.zeros(len(boxes), dtype=np.int64)
+        num_images = 1
+    elif num_images is None:
+        num_images = int(image_indices.max()) + 1 if len(image_indices) else 0
+
+    x_1, y_1, x_3, y_3 = _get_pixel_bounds(boxes, width, height)
+    valid = ((x_3 > x_1) & (y_3 > y_1)).astype(np.int32)
+    offsets = image_indices.astype(np.int64) * (height + 1) * (width + 1)
+    indices = np.concatenate(
+        [
+            offsets + y_1 * (width + 1) + x_1,
+            offsets + y_1 * (width + 1) + x_3,
+            offsets + y_3 * (width + 1) + x_1,
+            offsets + y_3 * (width + 1) + x_3,
+        ]
+    )
+    values = np.concatenate([valid, -valid, -valid, valid])
+    diff = np.bincount(
+        indices, weights=values, minlength=num_images * (height + 1) * (width + 1)
+    ).reshape(num_images, height + 1, width + 1)
+    coverage = diff.cumsum(axis=1).cumsum(axis=2)
+    return (coverage[:, :height, :width] == 0).astype(dtype)
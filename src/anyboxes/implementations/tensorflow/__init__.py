@@ -0,0 +1 @@
+"""Boxes package."""
@@ -0,0 +1,19 @@
+from typing import Tuple
+
+from jaxtyping import Shaped
+from tensorflow import Tensor
+
+from .coordinates import Coordinates
+
+CoordTensorType = Shaped[Tensor, "batch"]
+
+BoxTensorType = Shaped[Tensor, "4"]
+BoxesTensorType = Shaped[Tensor, "batch 4"]
+MaskTensorType = Shaped[Tensor, "batch height width"]
+
+FourCornersCoordinates = Tuple[
+    Coordinates,
+    Coordinates,
+    Coordinates,
+    Coordinates,
+]
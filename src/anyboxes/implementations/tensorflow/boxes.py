@@ -0,0 +1,482 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from anyboxes._errors import MissingToMethodError, OptionalDependencyImportError
+from anyboxes.implementations.box_format import BoxFormat
+from anyboxes.implementations.origin import Origin
+
+try:
+    import tensorflow as tf
+except ModuleNotFoundError:
+    raise OptionalDependencyImportError("tensorflow")
+
+from .coordinates import Coordinates, Size
+from .functional import (
+    build_binary_masks,
+    build_union_binary_masks,
+    clip_boxes,
+    convert_boxes,
+    flip_boxes,
+    square_boxes,
+)
+
+if TYPE_CHECKING:
+    from jaxtyping import Array
+    from numpy.typing import NDArray
+    from torch import Tensor as TorchTensor
+
+    from ._typing import (
+        BoxesTensorType,
+        CoordTensorType,
+        FourCornersCoordinates,
+        MaskTensorType,
+    )
+
+
+class TfBoxes:
+    """Represent a collection of bounding boxes with Tensorflow tensors.
+    Coordinates are represented as follow:
+    1: top-left corner
+    2: top-right corner
+    3: bottom-right corner
+    3: bottom-left corner.
+
+    The boxes are stored in a single packed tensor of size (n, 4) containing the
+    (x_1, y_1, x_3, y_3) for all boxes. Corners coordinates, center coordinates
+    and size are derived from it on access.
+    Only Tensorflow operations are used, so Boxes can be built and transformed
+    inside a `tf.function`, in `tf.data` map stages for instance. Tensorflow
+    tensors are immutable, so the methods working in place rebind the packed
+    tensor.
+    The `to` methods are inplace and produce a `boxes_` attribute.
+    """
+
+    def __init__(self, boxes: BoxesTensorType, origin: Origin):
+        """Make a Boxes object. Object instanced is expected by classmethod
+        `from_center`, `from_top_left_corner` or `from_two_corners`.
+
+        Args:
+            boxes (BoxesTensorType): Packed boxes of size (n, 4),
+                containing the (x_1, y_1, x_3, y_3) for all boxes.
+            origin (Origin): Origin of Boxes.
+        """
+        self._boxes = boxes
+        self._origin = origin
+
+    @property
+    def corners_coordinates(self) -> FourCornersCoordinates:
+        """Return all corners coordinates computed from the packed boxes.
+
+        Returns:
+            FourCornersCoordinates: All corners coordinates.
+        """
+        x_1, y_1, x_3, y_3 = tf.unstack(self._boxes, num=4, axis=1)
+        return (
+            Coordinates(x_1, y_1),
+            Coordinates(x_3, y_1),
+            Coordinates(x_3, y_3),
+            Coordinates(x_1, y_3),
+        )
+
+    @property
+    def center_coordinates(self) -> Coordinates:
+        """Return center coordinates computed from the packed boxes.
+
+        Returns:
+            Coordinates: Center coordinates.
+        """
+        x_1, y_1, x_3, y_3 = tf.unstack(self._boxes, num=4, axis=1)
+        return Coordinates((x_1 + x_3) / 2, (y_1 + y_3) / 2)
+
+    @property
+    def size(self) -> Size:
+        """Return size computed from the packed boxes. Size is the absolute
+        extent of the boxes, so it stays positive once the origin has been
+        flipped.
+
+        Returns:
+            Size: Size of Boxes.
+        """
+        w, h = tf.unstack(
+            tf.abs(self._boxes[:, 2:] - self._boxes[:, :2]), num=2, axis=1
+        )
+        return Size(w, h)
+
+    def __len__(self) -> int:
+        """Return the number of Boxes.
+
+        Returns:
+            int: Number of Boxes.
+        """
+        if self._boxes.shape[0] is not None:
+            return self._boxes.shape[0]
+        return int(tf.shape(self._boxes)[0])
+
+    def __getitem__(self, index: int | slice) -> TfBoxes:
+        """Return a subset of the Boxes.
+
+        Args:
+            index (int | slice): Index of the boxes to keep.
+
+        Returns:
+            TfBoxes: Subset of the Boxes.
+        """
+        return TfBoxes(tf.reshape(self._boxes[index], [-1, 4]), self._origin)
+
+    @property
+    def origin(self) -> str:
+        """Return the value of the origin of the Boxes.
+
+        Returns:
+            str: name of the origin
+        """
+        return self._origin.value
+
+    def __check_dimensions(self, dimension: float, sizes: CoordTensorType):
+        """Check that an image dimension is large enough to hold the Boxes.
+        Under `tf.function`, the check is an assertion of the graph.
+
+        Args:
+            dimension (float): width or height of the image.
+            sizes (CoordTensorType): widths or heights of the boxes.
+
+        Raises:
+            ValueError: Raised in eager mode if the image is smaller than a box.
+        """
+        dimension = tf.cast(dimension, sizes.dtype)
+        if tf.executing_eagerly():
+            if dimension < tf.reduce_min(sizes):
+                raise ValueError("`width` or `height` must be higher than boxes.")
+        else:
+            tf.debugging.assert_greater_equal(
+                dimension,
+                tf.reduce_min(sizes),
+                message="`width` or `height` must be higher than boxes.",
+            )
+
+    def flip_origin(self, height: int):
+        """Flip the origin of the Boxes given an image height. Work in place.
+
+        Args:
+            height (int): height of the image.
+
+        Returns:
+            self
+        """
+        self.__check_dimensions(height, self.size.h)
+        self._boxes = flip_boxes(self._boxes, height)
+        self._origin = (
+            Origin.BOTTOM_LEFT if self._origin == Origin.TOP_LEFT else Origin.TOP_LEFT
+        )
+        return self
+
+    def clip_to_image(self, width: int, height: int):
+        """Clip the Boxes to an image. Work in place.
+
+        Args:
+            width (int): width of the image.
+            height (int): height of the image.
+
+        Returns:
+            self
+        """
+        self._boxes = clip_boxes(self._boxes, width, height)
+        return self
+
+    def __convert_to(self, box_format: BoxFormat) -> BoxesTensorType:
+        """Convert the packed boxes to a given format. Sizes are absolute
+        extents, so they stay positive once the origin has been flipped.
+
+        Args:
+            box_format (BoxFormat): Output format.
+
+        Returns:
+            BoxesTensorType: boxes of size (n, 4) in `box_format`.
+        """
+        boxes = convert_boxes(self._boxes, BoxFormat.TWO_CORNERS, box_format)
+        if box_format != BoxFormat.TWO_CORNERS:
+            boxes = tf.concat([boxes[:, :2], tf.abs(boxes[:, 2:])], axis=1)
+        return boxes
+
+    @classmethod
+    def from_center(
+        cls, boxes: BoxesTensorType, origin: Origin = Origin.TOP_LEFT
+    ) -> TfBoxes:
+        """Generate Boxes from tf.Tensor containing center coordinates and
+        size.
+
+        Args:
+            boxes (tf.Tensor) : boxes of size (n, 4),
+                containing the (x_c, y_c, w, h) for all boxes
+            origin (Origin): default is `top-left`
+
+        Returns:
+            Boxes : object of class Boxes.
+        """
+        return cls(
+            convert_boxes(boxes, BoxFormat.CENTER, BoxFormat.TWO_CORNERS), origin
+        )
+
+    @classmethod
+    def from_top_left_corner(cls, boxes: BoxesTensorType) -> TfBoxes:
+        """Generate Boxes from tf.Tensor containing top-left coordinates and
+        size.
+
+        Args:
+            boxes (tf.Tensor) : boxes of size (n, 4),
+                containing the (x_1, y_1, w, h) for all boxes
+
+        Returns:
+            Boxes : object of class Boxes
+        """
+        return cls(
+            convert_boxes(boxes, BoxFormat.TOP_LEFT_CORNER, BoxFormat.TWO_CORNERS),
+            Origin.TOP_LEFT,
+        )
+
+    @classmethod
+    def from_bottom_left_corner(cls, boxes: BoxesTensorType) -> TfBoxes:
+        """Generate Boxes from tf.Tensor containing bottom-left coordinates
+        and size.
+
+        Args:
+            boxes (tf.Tensor) : boxes of size (n, 4),
+                containing the (x_4, y_4, w, h) for all boxes
+
+        Returns:
+            Boxes : object of class Boxes
+        """
+        return cls(
+            convert_boxes(boxes, BoxFormat.BOTTOM_LEFT_CORNER, BoxFormat.TWO_CORNERS),
+            Origin.BOTTOM_LEFT,
+        )
+
+    @classmethod
+    def from_two_corners(
+        cls, boxes: BoxesTensorType, origin: Origin = Origin.TOP_LEFT
+    ) -> TfBoxes:
+        """Generate Boxes from tf.Tensor containing top-left and bottom-
+        right coordinates.
+
+        Args:
+            boxes (tf.Tensor) : boxes of size (n, 4),
+                containing the (x_1, y_1, x_3, y_3) for all boxes
+            origin (Origin): default is `top-left`
+
+        Returns:
+            Boxes : object of class Boxes
+        """
+        return cls(
+            convert_boxes(boxes, BoxFormat.TWO_CORNERS, BoxFormat.TWO_CORNERS), origin
+        )
+
+    def to_center(self):
+        """Generate boxes (inplace method) : boxes of size (n, 4),
+        containing the (x_c, y_c, w, h) for all boxes.
+
+        Returns:
+            self
+        """
+        self.boxes_ = self.__convert_to(BoxFormat.CENTER)
+        return self
+
+    def to_top_left_corner(self):
+        """Generate boxes (inplace method) : boxes of size (n, 4),
+        containing the (x_1, y_1, w, h) for all boxes.
+
+        Returns:
+            self
+        """
+        self.boxes_ = self.__convert_to(BoxFormat.TOP_LEFT_CORNER)
+        return self
+
+    def to_bottom_left_corner(self):
+        """Generate boxes (inplace method): boxes of size (n, 4), containing
+        the (x_4, y_4, w, h) for all boxes.
+
+        Returns:
+            self
+        """
+        self.boxes_ = self.__convert_to(BoxFormat.BOTTOM_LEFT_CORNER)
+        return self
+
+    def to_two_corners(self):
+        """Generate boxes (inplace method) : boxes of size (n, 4), containing the (x_1, y_1, x_3, y_3) for all boxes.
+
+        Returns:
+            self
+        """
+        self.boxes_ = self.__convert_to(BoxFormat.TWO_CORNERS)
+        return self
+
+    def square(self):
+        """Pad the box so that they become squares. Works in place.
+
+        Returns:
+            self
+        """
+        self._boxes = square_boxes(self._boxes)
+        return self
+
+    def squared(self) -> tuple[Size, FourCornersCoordinates]:
+        """Pad the box so that they become squares.
+
+        Returns:
+            size : Size of the Boxes.
+            Boxes : A different Boxes object containing the squared boxes.
+        """
+        squared = TfBoxes(square_boxes(self._boxes), self._origin)
+        return squared.size, squared.corners_coordinates
+
+    def get_binary_mask(
+        self,
+        width: int,
+        height: int,
+        merge: bool = False,
+        image_indices: CoordTensorType | None = None,
+        num_images: int | None = None,
+        dtype: tf.DType = tf.uint8,
+    ) -> MaskTensorType:
+        """Build a mask to hide the parts of the image inside the bounding
+        boxes.
+
+        Args:
+            width (int) : desired mask width
+            height (int) : desired mask height
+            merge (bool) : return the union of the masks instead of one mask per box
+            image_indices (CoordTensorType | None) : index of the image of every box,
+                used with `merge` to build one union mask per image
+            num_images (int | None) : number of images, inferred from
+                `image_indices` if None, which is only possible in eager mode
+            dtype (tf.DType) : dtype of the mask, default is `tf.uint8`
+        Returns:
+            tf.Tensor : binary tensor containing the mask (has ones everywhere,
+                with zeroes inside the bounding boxes), size (n_boxes, height, width),
+                (height, width) if `merge` or (num_images, height, width) if `merge`
+                with `image_indices`
+        """
+        size = self.size
+        self.__check_dimensions(width, size.w)
+        self.__check_dimensions(height, size.h)
+        if not merge:
+            return build_binary_masks(self._boxes, width, height, dtype)
+        if image_indices is None:
+            return build_union_binary_masks(self._boxes, width, height, dtype=dtype)[0]
+        image_indices = tf.convert_to_tensor(image_indices)
+        if num_images is None:
+            num_images = (
+                int(tf.reduce_max(image_indices)) + 1 if tf.size(image_indices) else 0
+            )
+        return build_union_binary_masks(
+            self._boxes, width, height, image_indices, num_images, dtype
+        )
+
+    @property
+    def as_dict(self) -> dict[str, dict[str, list[int | float]]]:
+        """Return boxes' data as dictionnary.
+
+        Returns:
+            dict[str, dict[str, tf.Tensor]]: dict containing coordinates and size of Boxes.
+        """
+        c_1, c_2, c_3, c_4 = self.corners_coordinates
+        return {
+            "1": c_1.to_dict(),
+            "2": c_2.to_dict(),
+            "3": c_3.to_dict(),
+            "4": c_4.to_dict(),
+            "c": self.center_coordinates.to_dict(),
+            "size": self.size.to_dict(),
+        }
+
+    @property
+    def as_tuple(self):
+        """Return boxes' data as tuple.
+
+        Returns:
+            tuple[CoordTensorType]: tuple containing coordinates and size of Boxes.
+        """
+        c_1, c_2, c_3, c_4 = self.corners_coordinates
+        center_coordinates, size = self.center_coordinates, self.size
+        return tuple(
+            tensor.numpy().tolist()
+            for tensor in (
+                c_1.x,
+                c_1.y,
+                c_2.x,
+                c_2.y,
+                c_3.x,
+                c_3.y,
+                c_4.x,
+                c_4.y,
+                center_coordinates.x,
+                center_coordinates.y,
+                size.w,
+                size.h,
+            )
+        )
+
+    @property
+    def as_numpy(self) -> NDArray:
+        """Return boxes' data as `np.ndarray`, only in eager mode.
+
+        Raises:
+            MissingToMethodError: Raised if no `to` methods has been run.
+
+        Returns:
+            NDArray: Return boxes as Numpy array.
+        """
+        return self.as_tf_tensor.numpy()
+
+    @property
+    def as_array(self) -> Array:
+        """Return boxes' data as JAX's `Array`, through DLPack.
+
+        Raises:
+            OptionalDependencyImportError: Raised if JAX is missing.
+            MissingToMethodError: Raised if no `to` methods has been run.
+
+        Returns:
+            Array: Return boxes as JAX array.
+        """
+        boxes = self.as_tf_tensor
+        try:
+            import jax.numpy as jnp
+        except ModuleNotFoundError:
+            raise OptionalDependencyImportError("jax")
+
+        return jnp.from_dlpack(tf.experimental.dlpack.to_dlpack(boxes))
+
+    @property
+    def as_tf_tensor(self) -> tf.Tensor:
+        """Return boxes' data as Tensorflow's `Tensor`.
+
+        Raises:
+            MissingToMethodError: Raised if no `to` methods has been run.
+
+        Returns:
+            tf.Tensor: Return boxes as Tensorflow tensor.
+        """
+        if hasattr(self, "boxes_"):
+            return tf.cast(self.boxes_, tf.float32)
+        else:
+            raise MissingToMethodError
+
+    @property
+    def as_tensor(self) -> TorchTensor:
+        """Return boxes' data as `torch.Tensor`, through DLPack.
+
+        Raises:
+            OptionalDependencyImportError: Raised if PyTorch is missing.
+            MissingToMethodError: Raised if no `to` methods has been run.
+
+        Returns:
+            TorchTensor: Return boxes as PyTorch tensor.
+        """
+        boxes = self.as_tf_tensor
+        try:
+            import torch
+        except ModuleNotFoundError:
+            raise OptionalDependencyImportError("torch")
+
+        return torch.from_dlpack(tf.experimental.dlpack.to_dlpack(boxes))
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ._typing import CoordTensorType
+
+
+class Coordinates:
+    """Represent a set of corner coordinates in 2D space."""
+
+    def __init__(self, x: CoordTensorType, y: CoordTensorType):
+        """Make a Coordinates object.
+
+        Args:
+            x (CoordTensorType): tf.Tensor containing `x` coordinates.
+            y (CoordTensorType): tf.Tensor containing `y` coordinates.
+        """
+        self.x = x
+        self.y = y
+        self.batch_size: int | None = x.shape[0]
+
+    def to_dict(self) -> dict[str, list[int | float]]:
+        """Return x and y as dict.
+
+        Returns:
+            dict[str, CoordTensorType]: dict containing coordinates tensors.
+        """
+        return {"x": self.x.numpy().tolist(), "y": self.y.numpy().tolist()}
+
+
+class Size:
+    """Represent size of a bbox in 2D space."""
+
+    def __init__(self, w: CoordTensorType, h: CoordTensorType):
+        """Make a Size object.
+
+        Args:
+            w (CoordTensorType): tf.Tensor containing `w` coordinates.
+            h (CoordTensorType): tf.Tensor containing `h` coordinates.
+        """
+        self.w = w
+        self.h = h
+        self.batch_size: int | None = w.shape[0]
+
+    def to_dict(self) -> dict[str, list[int | float]]:
+        """Return w and h as dict.
+
+        Returns:
+            dict[str, CoordTensorType]: dict containing size tensors.
+        """
+        return {"w": self.w.numpy().tolist(), "h": self.h.numpy().tolist()}
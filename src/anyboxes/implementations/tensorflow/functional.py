@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from anyboxes._errors import OptionalDependencyImportError
+from anyboxes.implementations.box_format import BoxFormat, get_conversion_matrix
+
+try:
+    import tensorflow as tf
+except ModuleNotFoundError:
+    raise OptionalDependencyImportError("tensorflow")
+
+if TYPE_CHECKING:
+    from jaxtyping import Shaped
+
+    from ._typing import BoxesTensorType, CoordTensorType, MaskTensorType
+
+
+def _to_float(boxes: BoxesTensorType) -> BoxesTensorType:
+    """Convert integer boxes to float32.
+
+    Args:
+        boxes (BoxesTensorType): boxes of size (..., 4).
+
+    Returns:
+        BoxesTensorType: floating point boxes of size (..., 4).
+    """
+    boxes = tf.convert_to_tensor(boxes)
+    if boxes.dtype.is_floating:
+        return boxes
+    return tf.cast(boxes, tf.float32)
+
+
+def convert_boxes(
+    boxes: BoxesTensorType,
+    in_format: BoxFormat | str,
+    out_format: BoxFormat | str,
+) -> BoxesTensorType:
+    """Convert boxes from a format to another one with a single matrix
+    multiply. Only TensorFlow operations are used, so the conversion can be
+    traced by `tf.function`.
+
+    Args:
+        boxes (BoxesTensorType): boxes of size (..., 4) in `in_format`.
+        in_format (BoxFormat | str): Format of the input boxes.
+        out_format (BoxFormat | str): Format of the output boxes.
+
+    Returns:
+        BoxesTensorType: boxes of size (..., 4) in `out_format`. Integer boxes are
+            converted to float32.
+    """
+    in_format, out_format = BoxFormat(in_format), BoxFormat(out_format)
+    boxes = _to_float(boxes)
+    if in_format == out_format:
+        return tf.identity(boxes)
+    matrix = tf.constant(get_conversion_matrix(in_format, out_format), boxes.dtype)
+    return tf.tensordot(boxes, matrix, axes=1)
+
+
+def square_boxes(boxes: BoxesTensorType) -> BoxesTensorType:
+    """Pad packed boxes so that they become squares, around the same center.
+
+    Args:
+        boxes (BoxesTensorType): Packed boxes of size (..., 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+
+    Returns:
+        BoxesTensorType: Packed boxes of size (..., 4).
+    """
+    half_size = tf.reduce_max(tf.abs(boxes[..., 2:] - boxes[..., :2]), axis=-1) / 2
+    center = (boxes[..., :2] + boxes[..., 2:]) / 2
+    return tf.concat(
+        [center - half_size[..., None], center + half_size[..., None]], axis=-1
+    )
+
+
+def flip_boxes(
+    boxes: BoxesTensorType, height: float | CoordTensorType
+) -> BoxesTensorType:
+    """Flip the y axis of packed boxes given an image height.
+
+    Args:
+        boxes (BoxesTensorType): Packed boxes of size (..., 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        height (float | CoordTensorType): height of the image, broadcast against
+            the coordinates of the boxes.
+
+    Returns:
+        BoxesTensorType: Packed boxes of size (..., 4).
+    """
+    height = tf.cast(height, boxes.dtype)
+    x_1, y_1, x_3, y_3 = tf.unstack(boxes, axis=-1)
+    return tf.stack([x_1, height - y_1, x_3, height - y_3], axis=-1)
+
+
+def clip_boxes(boxes: BoxesTensorType, width: float, height: float) -> BoxesTensorType:
+    """Clip packed boxes to an image.
+
+    Args:
+        boxes (BoxesTensorType): Packed boxes of size (..., 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        width (float): width of the image.
+        height (float): height of the image.
+
+    Returns:
+        BoxesTensorType: Packed boxes of size (..., 4).
+    """
+    upper = tf.cast(tf.stack([width, height, width, height]), boxes.dtype)
+    return tf.clip_by_value(boxes, tf.zeros_like(upper), upper)
+
+
+def _get_pixel_bounds(
+    boxes: BoxesTensorType, width: int, height: int
+) -> tuple[CoordTensorType, CoordTensorType, CoordTensorType, CoordTensorType]:
+    """Return the pixel bounds of boxes, truncated to integers and clipped to
+    the mask.
+
+    Args:
+        boxes (BoxesTensorType): Packed boxes of size (..., 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        width (int): mask width.
+        height (int): mask height.
+
+    Returns:
+        tuple[CoordTensorType, CoordTensorType, CoordTensorType, CoordTensorType]: x_1, y_1, x_3, y_3.
+    """
+    x_1, y_1, x_3, y_3 = tf.unstack(tf.cast(boxes, tf.int32), axis=-1)
+    return (
+        tf.clip_by_value(x_1, 0, width),
+        tf.clip_by_value(y_1, 0, height),
+        tf.clip_by_value(x_3, 0, width),
+        tf.clip_by_value(y_3, 0, height),
+    )
+
+
+def build_binary_masks(
+    boxes: BoxesTensorType,
+    width: int,
+    height: int,
+    dtype: tf.DType = tf.uint8,
+) -> MaskTensorType:
+    """Build one mask per box with ones everywhere and zeros inside the box, by
+    broadcasting comparisons against `range` grids.
+
+    Args:
+        boxes (BoxesTensorType): Packed boxes of size (n, 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        width (int): mask width.
+        height (int): mask height.
+        dtype (tf.DType): dtype of the masks.
+
+    Returns:
+        MaskTensorType: masks of size (n, height, width).
+    """
+    x_1, y_1, x_3, y_3 = _get_pixel_bounds(boxes, width, height)
+    cols, rows = tf.range(width), tf.range(height)
+    outside_cols = (cols < x_1[..., None]) | (cols >= x_3[..., None])
+    outside_rows = (rows < y_1[..., None]) | (rows >= y_3[..., None])
+    return tf.cast(outside_rows[..., :, None] | outside_cols[..., None, :], dtype)
+
+
+def build_union_binary_masks(
+    boxes: BoxesTensorType,
+    width: int,
+    height: int,
+    image_indices: CoordTensorType | None = None,
+    num_images: int = 1,
+    dtype: tf.DType = tf.uint8,
+) -> Shaped[tf.Tensor, "image height width"]:  # noqa: F722
+    """Build the union of the masks of all boxes of an image, with ones
+    everywhere and zeros inside any box. The masks are accumulated with a 2D
+    difference array, so no (n, height, width) tensor is allocated.
+
+    Args:
+        boxes (BoxesTensorType): Packed boxes of size (n, 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        width (int): mask width.
+        height (int): mask height.
+        image_indices (CoordTensorType | None): Index of the image of every box,
+            all boxes belong to a single image if None.
+        num_images (int): Number of images.
+        dtype (tf.DType): dtype of the masks.
+
+    Returns:
+        Shaped[tf.Tensor, "image height width"]: masks of size (num_images, height, width).
+    """
+    x_1, y_1, x_3, y_3 = _get_pixel_bounds(boxes, width, height)
+    if image_indices is None:
+        image_indices = tf.zeros_like(x_1)
+    image_indices = tf.cast(image_indices, tf.int32)
+    valid = tf.cast((x_3 > x_1) & (y_3 > y_1), tf.int32)
+    indices = tf.concat(
+        [
+            tf.stack([image_indices, y_1, x_1], axis=1),
+            tf.stack([image_indices, y_1, x_3], axis=1),
+            tf.stack([image_indices, y_3, x_1], axis=1),
+            tf.stack([image_indices, y_3, x_3], axis=1),
+        ],
+        axis=0,
+    )
+    values = tf.concat([valid, -valid, -valid, valid], axis=0)
+    diff = tf.tensor_scatter_nd_add(
+        tf.zeros([num_images, height + 1, width + 1], tf.int32), indices, values
+    )
+    coverage = tf.cumsum(tf.cumsum(diff, axis=1), axis=2)
+    return tf.cast(coverage[:, :height, :width] == 0, dtype)
@@ -10,6 +10,7 @@ CoordTensorType = Shaped[Tensor, "batch"]
 BoxTensorType = Shaped[Tensor, "4"]
 BoxesTensorType = Shaped[Tensor, "batch 4"]
 MaskTensorType = Shaped[Tensor, "batch height width"]
+OverlapsTensorType = Shaped[Tensor, "batch ..."]
 
 ImageTensorType = Shaped[Tensor, "channel height width"]
 BatchImageTensorType = Shaped[Tensor, "batch channel height width"]
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import torch
+
+if TYPE_CHECKING:
+    from ._typing import BoxesTensorType, CoordTensorType
+
+
+def expand_ranges(
+    starts: CoordTensorType, counts: CoordTensorType
+) -> tuple[CoordTensorType, CoordTensorType]:
+    """Expand ranges of positions given by their starts and lengths.
+
+    Args:
+        starts (CoordTensorType): First position of every range.
+        counts (CoordTensorType): Length of every range.
+
+    Returns:
+        tuple[CoordTensorType, CoordTensorType]: Index of the range and position of
+            every element of the ranges.
+    """
+    owners = torch.repeat_interleave(
+        torch.arange(len(starts), device=starts.device), counts
+    )
+    offsets = torch.cumsum(counts, dim=0) - counts
+    positions = torch.arange(len(owners), device=starts.device) + (
+        starts - offsets
+    ).index_select(0, owners)
+    return owners, positions
+
+
+def get_tensor_version(boxes: BoxesTensorType) -> int | None:
+    """Return the version counter of a tensor, incremented by every in place
+    operation on the tensor or its views.
+
+    Args:
+        boxes (BoxesTensorType): Packed boxes.
+
+    Returns:
+        int | None: Version counter, None for inference tensors which don't track it.
+    """
+    if boxes.is_inference():
+        return None
+    return boxes._version
+
+
+def check_height(boxes: BoxesTensorType, height: float | CoordTensorType):
+    """Check that an image height fits the boxes before flipping their origin.
+
+    Args:
+        boxes (BoxesTensorType): Packed boxes of size (n, 4).
+        height (float | CoordTensorType): height of the image, or tensor of size (n)
+            containing the height of the image of every box.
+
+    Raises:
+        ValueError: Raised if `height` is smaller than a box.
+    """
+    heights = (boxes[:, 3] - boxes[:, 1]).abs()
+    height = torch.as_tensor(height, device=boxes.device)
+    if len(boxes) and bool((height < heights).any()):
+        raise ValueError("`width` or `height` must be higher than boxes.")
@@ -0,0 +1,377 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import warnings
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Sequence
+from xml.sax.saxutils import escape, unescape
+
+import numpy as np
+import torch
+
+from anyboxes.implementations.box_format import BoxFormat
+from anyboxes.implementations.origin import Origin
+
+from .batched import BatchedTorchBoxes
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from ._typing import CoordTensorType
+
+# Annotations are parsed straight into packed arrays, a single pass of C-level
+# parsing per file (`json`, `re`, `np.loadtxt`), and written by
+# formatting whole images at once, so that no Python object is built per box
+# beyond what the file format itself requires.
+
+_VOC_COORDINATES = ("xmin", "ymin", "xmax", "ymax")
+_VOC_PART_PATTERN = re.compile(r"<part>.*?</part>", re.DOTALL)
+_VOC_FIELD_PATTERNS = [
+    re.compile(f"<{tag}>([^<]*)</{tag}>") for tag in ("name", *_VOC_COORDINATES)
+]
+_VOC_OBJECT = (
+    "  <object>\n"
+    "    <name>%s</name>\n"
+    "    <bndbox>\n"
+    "      <xmin>%.10g</xmin>\n"
+    "      <ymin>%.10g</ymin>\n"
+    "      <xmax>%.10g</xmax>\n"
+    "      <ymax>%.10g</ymax>\n"
+    "    </bndbox>\n"
+    "  </object>\n"
+)
+_VOC_SIZE = "  <size>\n    <width>%d</width>\n    <height>%d</height>\n  </size>\n"
+_YOLO_LINE = "%d %.6f %.6f %.6f %.6f\n"
+
+
+def _check_origin(boxes: BatchedTorchBoxes):
+    """Check that boxes can be written to an annotation file.
+
+    Args:
+        boxes (BatchedTorchBoxes): boxes to write.
+
+    Raises:
+        ValueError: Raised if the boxes don't have a top-left origin.
+    """
+    if boxes.origin != Origin.TOP_LEFT.value:
+        raise ValueError("Annotation files require boxes with a `top-left` origin.")
+
+
+def _get_image_scale(lengths: Sequence[int], image_sizes: CoordTensorType) -> NDArray:
+    """Return the (w, h, w, h) of the image of every box.
+
+    Args:
+        lengths (Sequence[int]): number of boxes of every image.
+        image_sizes (CoordTensorType): (width, height) of every image, of size
+            (num_images, 2).
+
+    Returns:
+        NDArray: Scales of size (n, 4).
+    """
+    image_sizes = np.asarray(image_sizes, dtype=np.float64)
+    return np.tile(np.repeat(image_sizes, lengths, axis=0), 2)
+
+
+def read_coco(
+    source: str | os.PathLike | dict[str, Any], dtype: torch.dtype | None = None
+) -> tuple[BatchedTorchBoxes, CoordTensorType, list[int]]:
+    """Read the boxes of a COCO dataset, whose `bbox` are in the top-left
+    corner format.
+
+    Args:
+        source (str | os.PathLike | dict[str, Any]): path of a COCO JSON file, or
+            its loaded content.
+        dtype (torch.dtype | None): storage dtype, the default floating point dtype
+            if None.
+
+    Returns:
+        tuple[BatchedTorchBoxes, CoordTensorType, list[int]]: boxes of every image
+            in the order of `images`, their `category_id` and the `id` of every image.
+    """
+    if not isinstance(source, dict):
+        with open(source) as file:
+            source = json.load(file)
+    image_ids = [image["id"] for image in source["images"]]
+    annotations = source["annotations"]
+    n = len(annotations)
+
+    positions = {image_id: index for index, image_id in enumerate(image_ids)}
+    image_indices = np.fromiter(
+        (positions[a["image_id"]] for a in annotations), dtype=np.int64, count=n
+    )
+    labels = np.fromiter((a["category_id"] for a in annotations), np.int64, count=n)
+    bbox = np.fromiter(
+        chain.from_iterable(a["bbox"] for a in annotations), np.float64, count=4 * n
+    ).reshape(n, 4)
+
+    order = np.argsort(image_indices, kind="stable")
+    boxes = BatchedTorchBoxes.from_packed(
+        bbox[order],
+        np.bincount(image_indices, minlength=len(image_ids)),
+        BoxFormat.TOP_LEFT_CORNER,
+        dtype=dtype or torch.get_default_dtype(),
+    )
+    return boxes, torch.from_numpy(labels[order]), image_ids
+
+
+def to_coco(
+    boxes: BatchedTorchBoxes,
+    labels: CoordTensorType,
+    image_ids: Sequence[int] | None = None,
+    image_sizes: CoordTensorType | None = None,
+) -> dict[str, Any]:
+    """Build the content of a COCO JSON file from boxes, converted with
+    `to_top_left_corner`.
+
+    Args:
+        boxes (BatchedTorchBoxes): boxes of a batch of images, with a top-left origin.
+        labels (CoordTensorType): `category_id` of every box, of size (n).
+        image_ids (Sequence[int] | None): `id` of every image, 1 to num_images if None.
+        image_sizes (CoordTensorType | None): (width, height) of every image, of size
+            (num_images, 2), not written if None.
+
+    Raises:
+        ValueError: Raised if the boxes don't have a top-left origin.
+
+    Returns:
+        dict[str, Any]: COCO dataset with `images`, `annotations` and `categories`.
+    """
+    _check_origin(boxes)
+    if image_ids is None:
+        image_ids = range(1, boxes.num_images + 1)
+    images = [{"id": image_id} for image_id in image_ids]
+    if image_sizes is not None:
+        for image, (width, height) in zip(
+            images, torch.as_tensor(image_sizes).tolist()
+        ):
+            image.update(width=width, height=height)
+
+    bbox = boxes.to_top_left_corner(torch.float64).boxes_.tolist()
+    image_ids = [image["id"] for image in images]
+    labels = torch.as_tensor(labels).tolist()
+    annotations = [
+        {
+            "id": index,
+            "image_id": image_ids[image_index],
+            "category_id": label,
+            "bbox": box,
+            "area": box[2] * box[3],
+            "iscrowd": 0,
+        }
+        for index, (box, image_index, label) in enumerate(
+            zip(bbox, boxes.image_indices.tolist(), labels), start=1
+        )
+    ]
+    categories = [{"id": label} for label in sorted(set(labels))]
+    return {"images": images, "annotations": annotations, "categories": categories}
+
+
+def write_coco(
+    path: str | os.PathLike,
+    boxes: BatchedTorchBoxes,
+    labels: CoordTensorType,
+    image_ids: Sequence[int] | None = None,
+    image_sizes: CoordTensorType | None = None,
+):
+    """Write boxes to a COCO JSON file, see `to_coco`.
+
+    Args:
+        path (str | os.PathLike): path of the JSON file.
+        boxes (BatchedTorchBoxes): boxes of a batch of images, with a top-left origin.
+        labels (CoordTensorType): `category_id` of every box, of size (n).
+        image_ids (Sequence[int] | None): `id` of every image, 1 to num_images if None.
+        image_sizes (CoordTensorType | None): (width, height) of every image, of size
+            (num_images, 2), not written if None.
+
+    Raises:
+        ValueError: Raised if the boxes don't have a top-left origin.
+    """
+    # `json.dumps` encodes in a single C call, `json.dump` chunk by chunk in Python.
+    content = json.dumps(to_coco(boxes, labels, image_ids, image_sizes))
+    with open(path, "w") as file:
+        file.write(content)
+
+
+def read_voc(
+    paths: Sequence[str | os.PathLike],
+    classes: Sequence[str] | None = None,
+    dtype: torch.dtype | None = None,
+) -> tuple[BatchedTorchBoxes, CoordTensorType, list[str]]:
+    """Read the boxes of Pascal VOC XML files, one per image, whose `bndbox`
+    are in the two corners format. Coordinates are kept as written. The fields
+    of the objects are extracted with one regular expression per tag rather than
+    by building an XML tree, which is several times faster on these flat files.
+    The `part` of objects are ignored.
+
+    Args:
+        paths (Sequence[str | os.PathLike]): path of the XML file of every image.
+        classes (Sequence[str] | None): names of the classes, in the order of the
+            labels. Built from the files in order of appearance if None.
+        dtype (torch.dtype | None): storage dtype, the default floating point dtype
+            if None.
+
+    Raises:
+        KeyError: Raised if an object's name isn't in `classes`.
+        ValueError: Raised if an object doesn't have a name and a `bndbox`.
+
+    Returns:
+        tuple[BatchedTorchBoxes, CoordTensorType, list[str]]: boxes of every image,
+            their label as an index of the classes, and the classes.
+    """
+    bodies, lengths = [], []
+    for path in paths:
+        with open(path) as file:
+            content = file.read()
+        start = content.find("<object>")
+        lengths.append(0 if start < 0 else content.count("<object>", start))
+        bodies.append(content[start : content.rfind("</object>")] if start >= 0 else "")
+    body = _VOC_PART_PATTERN.sub("", "".join(bodies))
+    columns = [pattern.findall(body) for pattern in _VOC_FIELD_PATTERNS]
+    if any(len(column) != sum(lengths) for column in columns):
+        raise ValueError("Every object must have a name and a bndbox.")
+    names = [unescape(name.strip()) for name in columns[0]]
+
+    classes = list(dict.fromkeys(names) if classes is None else classes)
+    positions = {name: index for index, name in enumerate(classes)}
+    labels = np.fromiter((positions[name] for name in names), np.int64, len(names))
+    boxes = BatchedTorchBoxes.from_packed(
+        np.array(columns[1:], dtype=np.float64).reshape(4, -1).T,
+        lengths,
+        BoxFormat.TWO_CORNERS,
+        dtype=dtype or torch.get_default_dtype(),
+    )
+    return boxes, torch.from_numpy(labels), classes
+
+
+def write_voc(
+    paths: Sequence[str | os.PathLike],
+    boxes: BatchedTorchBoxes,
+    labels: CoordTensorType,
+    classes: Sequence[str],
+    image_sizes: CoordTensorType | None = None,
+):
+    """Write boxes to Pascal VOC XML files, one per image, converted with
+    `to_two_corners`.
+
+    Args:
+        paths (Sequence[str | os.PathLike]): path of the XML file of every image.
+        boxes (BatchedTorchBoxes): boxes of a batch of images, with a top-left origin.
+        labels (CoordTensorType): label of every box as an index of `classes`.
+        classes (Sequence[str]): names of the classes.
+        image_sizes (CoordTensorType | None): (width, height) of every image, of size
+            (num_images, 2), not written if None.
+
+    Raises:
+        ValueError: Raised if the boxes don't have a top-left origin or if there
+            isn't a path per image.
+    """
+    _check_origin(boxes)
+    if len(paths) != boxes.num_images:
+        raise ValueError("`paths` must contain a path per image.")
+    names = [escape(name) for name in classes]
+    rows = [
+        (names[label], *box)
+        for label, box in zip(
+            torch.as_tensor(labels).tolist(),
+            boxes.to_two_corners(torch.float64).boxes_.tolist(),
+        )
+    ]
+    sizes = None if image_sizes is None else torch.as_tensor(image_sizes).tolist()
+    offsets = boxes.offsets
+    for index, path in enumerate(paths):
+        image_rows = rows[offsets[index] : offsets[index + 1]]
+        content = (_VOC_OBJECT * len(image_rows)) % tuple(
+            chain.from_iterable(image_rows)
+        )
+        if sizes is not None:
+            content = _VOC_SIZE % tuple(sizes[index]) + content
+        with open(path, "w") as file:
+            file.write(f"<annotation>\n{content}</annotation>\n")
+
+
+def read_yolo(
+    paths: Sequence[str | os.PathLike],
+    image_sizes: CoordTensorType | None = None,
+    dtype: torch.dtype | None = None,
+) -> tuple[BatchedTorchBoxes, CoordTensorType]:
+    """Read the boxes of YOLO text files, one per image, whose lines contain a
+    class and a box in the center format normalized by the size of the image.
+
+    Args:
+        paths (Sequence[str | os.PathLike]): path of the text file of every image.
+        image_sizes (CoordTensorType | None): (width, height) of every image, of
+            size (num_images, 2). Boxes are kept normalized if None.
+        dtype (torch.dtype | None): storage dtype, the default floating point dtype
+            if None.
+
+    Raises:
+        ValueError: Raised if a file doesn't contain lines of five numbers.
+
+    Returns:
+        tuple[BatchedTorchBoxes, CoordTensorType]: boxes of every image and their class.
+    """
+    chunks = []
+    for path in paths:
+        with warnings.catch_warnings():
+            # Files of images without boxes are empty.
+            warnings.filterwarnings("ignore", "loadtxt: input contained no data")
+            try:
+                values = np.loadtxt(path, ndmin=2)
+            except ValueError as error:
+                raise ValueError(
+                    f"{path} must contain lines of five numbers."
+                ) from error
+        if not values.size:
+            values = values.reshape(0, 5)
+        if values.shape[1] != 5:
+            raise ValueError(f"{path} must contain lines of five numbers.")
+        chunks.append(values)
+    values = np.concatenate(chunks) if chunks else np.empty((0, 5))
+
+    lengths = [len(chunk) for chunk in chunks]
+    centers = values[:, 1:]
+    if image_sizes is not None:
+        centers = centers * _get_image_scale(lengths, image_sizes)
+    boxes = BatchedTorchBoxes.from_packed(
+        centers, lengths, BoxFormat.CENTER, dtype=dtype or torch.get_default_dtype()
+    )
+    return boxes, torch.from_numpy(values[:, 0].astype(np.int64))
+
+
+def write_yolo(
+    paths: Sequence[str | os.PathLike],
+    boxes: BatchedTorchBoxes,
+    labels: CoordTensorType,
+    image_sizes: CoordTensorType | None = None,
+):
+    """Write boxes to YOLO text files, one per image, converted with
+    `to_center`.
+
+    Args:
+        paths (Sequence[str | os.PathLike]): path of the text file of every image.
+        boxes (BatchedTorchBoxes): boxes of a batch of images, with a top-left origin.
+        labels (CoordTensorType): class of every box, of size (n).
+        image_sizes (CoordTensorType | None): (width, height) of every image, of size
+            (num_images, 2), used to normalize the boxes. Boxes are written as they
+            are if None, they must be normalized already.
+
+    Raises:
+        ValueError: Raised if the boxes don't have a top-left origin or if there
+            isn't a path per image.
+    """
+    _check_origin(boxes)
+    if len(paths) != boxes.num_images:
+        raise ValueError("`paths` must contain a path per image.")
+    centers = boxes.to_center(torch.float64).get_numpy(dtype=None)
+    if image_sizes is not None:
+        centers = centers / _get_image_scale(boxes.lengths.tolist(), image_sizes)
+    rows = np.column_stack([np.asarray(torch.as_tensor(labels).cpu()), centers])
+    offsets = boxes.offsets
+    for index, path in enumerate(paths):
+        image_rows = rows[offsets[index] : offsets[index + 1]]
+        with open(path, "w") as file:
+            file.write(
+                (_YOLO_LINE * len(image_rows)) % tuple(image_rows.ravel().tolist())
+            )
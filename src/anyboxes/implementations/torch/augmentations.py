@@ -0,0 +1,628 @@
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Sequence
+
+import torch
+
+from anyboxes.implementations.box_format import BoxFormat
+from anyboxes.implementations.origin import Origin
+
+from .batched import BatchedTorchBoxes
+from .boxes import TorchBoxes
+from .functional import box_sizes, clip_boxes, convert_boxes, transform_boxes
+
+if TYPE_CHECKING:
+    from ._typing import CoordTensorType
+
+# Every transform maps the image coordinates of its input to the image
+# coordinates of its output with a 3x3 affine matrix per image, so that a
+# pipeline is applied to the boxes with a single matrix, the product of the
+# matrices of its transforms. Matrices, image sizes and windows are sampled on
+# CPU in float64, as they are a few numbers per image.
+
+
+def _get_sizes(size: float | CoordTensorType, num_images: int) -> CoordTensorType:
+    """Return an image size per image.
+
+    Args:
+        size (float | CoordTensorType): size of all images, or tensor of size
+            (num_images) containing the size of every image.
+        num_images (int): number of images.
+
+    Raises:
+        ValueError: Raised if there isn't a size per image.
+
+    Returns:
+        CoordTensorType: float64 tensor of size (num_images).
+    """
+    sizes = torch.as_tensor(size, dtype=torch.float64, device="cpu")
+    if not sizes.ndim:
+        return sizes.expand(num_images)
+    if sizes.shape != (num_images,):
+        raise ValueError(
+            f"Image sizes must be a number or a tensor of size {num_images}."
+        )
+    return sizes
+
+
+def _make_matrices(
+    a: float | CoordTensorType,
+    b: float | CoordTensorType,
+    c: float | CoordTensorType,
+    d: float | CoordTensorType,
+    e: float | CoordTensorType,
+    f: float | CoordTensorType,
+    num_images: int,
+) -> CoordTensorType:
+    """Build the affine matrices mapping (x, y) to (a x + b y + c, d x + e y + f).
+
+    Args:
+        a (float | CoordTensorType): coefficient, number or tensor of size (num_images).
+        b (float | CoordTensorType): coefficient, number or tensor of size (num_images).
+        c (float | CoordTensorType): coefficient, number or tensor of size (num_images).
+        d (float | CoordTensorType): coefficient, number or tensor of size (num_images).
+        e (float | CoordTensorType): coefficient, number or tensor of size (num_images).
+        f (float | CoordTensorType): coefficient, number or tensor of size (num_images).
+        num_images (int): number of images.
+
+    Returns:
+        CoordTensorType: float64 tensor of size (num_images, 3, 3).
+    """
+    coefficients = [
+        torch.as_tensor(value, dtype=torch.float64).expand(num_images)
+        for value in (a, b, c, d, e, f, 0.0, 0.0, 1.0)
+    ]
+    return torch.stack(coefficients, dim=1).reshape(num_images, 3, 3)
+
+
+def _uniform(
+    low: float, high: float, num_images: int, generator: torch.Generator | None
+) -> CoordTensorType:
+    """Sample a number per image uniformly in [low, high).
+
+    Args:
+        low (float): lower bound.
+        high (float): upper bound.
+        num_images (int): number of images.
+        generator (torch.Generator | None): CPU generator, the default one if None.
+
+    Returns:
+        CoordTensorType: float64 tensor of size (num_images).
+    """
+    values = torch.rand(num_images, dtype=torch.float64, generator=generator)
+    return values.mul_(high - low).add_(low)
+
+
+def warp_boxes(
+    boxes: TorchBoxes,
+    matrices: CoordTensorType,
+    windows: CoordTensorType,
+    min_area_ratio: float = 0.0,
+) -> tuple[TorchBoxes, CoordTensorType]:
+    """Apply an affine matrix per image to the four corners of the boxes, and
+    keep the axis-aligned boxes enclosing them, clipped to a window per image.
+    Boxes left empty by the clipping, or keeping less than `min_area_ratio` of
+    their area, are removed.
+
+    Args:
+        boxes (TorchBoxes): Boxes with a `top-left` origin, BatchedTorchBoxes for
+            a batch of images.
+        matrices (CoordTensorType): affine matrices of size (num_images, 3, 3), or
+            (3, 3) for TorchBoxes.
+        windows (CoordTensorType): windows of size (num_images, 4), or (4) for
+            TorchBoxes, containing the (x_1, y_1, x_3, y_3) of the region of every
+            output image where boxes are kept, as returned by `Transform.sample`.
+        min_area_ratio (float): smallest fraction of the area of a warped box
+            which must be inside the window, default is 0.
+
+    Raises:
+        ValueError: Raised if the Boxes don't have a `top-left` origin, or if there
+            isn't a matrix and a window per image.
+
+    Returns:
+        tuple[TorchBoxes, CoordTensorType]: Boxes of the same class with the
+            storage dtype of `boxes`, and the indices of the kept boxes in `boxes`.
+    """
+    if boxes._origin != Origin.TOP_LEFT:
+        raise ValueError("Boxes must have a `top-left` origin to be warped.")
+    num_images = boxes.num_images if isinstance(boxes, BatchedTorchBoxes) else 1
+    matrices = torch.as_tensor(matrices, device=boxes.device).reshape(-1, 3, 3)
+    windows = torch.as_tensor(windows, device=boxes.device).reshape(-1, 4)
+    if len(matrices) != num_images or len(windows) != num_images:
+        raise ValueError(
+            f"`matrices` and `windows` must be given for {num_images} images."
+        )
+    if isinstance(boxes, BatchedTorchBoxes):
+        image_indices = boxes.image_indices
+        matrices = matrices.index_select(0, image_indices)
+        windows = windows.index_select(0, image_indices)
+    else:
+        matrices, windows = matrices[0], windows[0]
+
+    warped = transform_boxes(boxes._boxes, matrices)
+    windows = windows.to(warped.dtype)
+    areas = box_sizes(warped).prod(dim=-1)
+    warped = torch.maximum(warped, windows[..., [0, 1, 0, 1]], out=warped)
+    warped = torch.minimum(warped, windows[..., [2, 3, 2, 3]], out=warped)
+    clipped_areas = box_sizes(warped).prod(dim=-1)
+    keep = (clipped_areas > 0) & (clipped_areas >= min_area_ratio * areas)
+    indices = keep.nonzero().squeeze(1)
+    warped = warped.index_select(0, indices)
+    if warped.dtype != boxes._boxes.dtype:
+        warped = convert_boxes(
+            warped, BoxFormat.TWO_CORNERS, BoxFormat.TWO_CORNERS, boxes._boxes.dtype
+        )
+    if isinstance(boxes, BatchedTorchBoxes):
+        lengths = torch.bincount(image_indices[indices], minlength=num_images)
+        return BatchedTorchBoxes(warped, boxes._origin, lengths), indices
+    return TorchBoxes(warped, boxes._origin), indices
+
+
+class Transform(ABC):
+    """Base class of the geometric transforms of images and their boxes.
+
+    A transform samples an affine matrix per image, mapping the coordinates of
+    the input image to the coordinates of the output image, and the size of the
+    output image. Calling a transform warps boxes with `warp_boxes`, which works
+    for any affine matrix, rotations and shears included, by keeping the
+    axis-aligned boxes enclosing the warped corners.
+
+    Boxes are clipped to a window per image, the region of the output image
+    showing the input image. It is the output image intersected with the input
+    image warped by every transform, so that a box cropped out by a transform
+    doesn't come back in the padding added by a later one. Windows are
+    axis-aligned, they enclose the input image once rotated or sheared.
+    """
+
+    @abstractmethod
+    def get_matrices(
+        self,
+        width: CoordTensorType,
+        height: CoordTensorType,
+        generator: torch.Generator | None = None,
+    ) -> tuple[CoordTensorType, CoordTensorType, CoordTensorType]:
+        """Sample the matrices of the transform for a batch of images.
+
+        Args:
+            width (CoordTensorType): float64 tensor of size (num_images) containing
+                the width of every input image.
+            height (CoordTensorType): float64 tensor of size (num_images) containing
+                the height of every input image.
+            generator (torch.Generator | None): CPU generator, the default one if None.
+
+        Returns:
+            tuple[CoordTensorType, CoordTensorType, CoordTensorType]: float64 matrices
+                of size (num_images, 3, 3), width and height of the output images.
+        """
+
+    def get_params(
+        self,
+        width: CoordTensorType,
+        height: CoordTensorType,
+        windows: CoordTensorType,
+        generator: torch.Generator | None = None,
+    ) -> tuple[CoordTensorType, CoordTensorType, CoordTensorType, CoordTensorType]:
+        """Sample the matrices of the transform and warp the windows of the
+        input images.
+
+        Args:
+            width (CoordTensorType): width of every input image.
+            height (CoordTensorType): height of every input image.
+            windows (CoordTensorType): float64 tensor of size (num_images, 4)
+                containing the window of every input image.
+            generator (torch.Generator | None): CPU generator, the default one if None.
+
+        Returns:
+            tuple[CoordTensorType, CoordTensorType, CoordTensorType, CoordTensorType]:
+                matrices, width, height and windows of the output images.
+        """
+        matrices, width, height = self.get_matrices(width, height, generator)
+        windows = clip_boxes(transform_boxes(windows, matrices), width, height)
+        return matrices, width, height, windows
+
+    def sample(
+        self,
+        width: float | CoordTensorType,
+        height: float | CoordTensorType,
+        num_images: int = 1,
+        generator: torch.Generator | None = None,
+    ) -> tuple[CoordTensorType, CoordTensorType, CoordTensorType, CoordTensorType]:
+        """Sample the matrices of the transform, to warp the images with the
+        matrices used for the boxes.
+
+        Args:
+            width (float | CoordTensorType): width of all input images, or tensor of
+                size (num_images) containing the width of every input image.
+            height (float | CoordTensorType): height of all input images, or of
+                every input image.
+            num_images (int): number of images, default is 1.
+            generator (torch.Generator | None): CPU generator, the default one if None.
+
+        Returns:
+            tuple[CoordTensorType, CoordTensorType, CoordTensorType, CoordTensorType]:
+                float64 matrices of size (num_images, 3, 3), width and height of the
+                output images, and windows of size (num_images, 4).
+        """
+        width = _get_sizes(width, num_images)
+        height = _get_sizes(height, num_images)
+        zeros = torch.zeros_like(width)
+        windows = torch.stack([zeros, zeros, width, height], dim=1)
+        return self.get_params(width, height, windows, generator)
+
+    def __call__(
+        self,
+        boxes: TorchBoxes,
+        width: float | CoordTensorType,
+        height: float | CoordTensorType,
+        min_area_ratio: float = 0.0,
+        generator: torch.Generator | None = None,
+    ) -> tuple[TorchBoxes, CoordTensorType]:
+        """Sample the transform and warp boxes with it.
+
+        Args:
+            boxes (TorchBoxes): Boxes with a `top-left` origin, BatchedTorchBoxes for
+                a batch of images.
+            width (float | CoordTensorType): width of all input images, or tensor of
+                size (num_images) containing the width of every input image.
+            height (float | CoordTensorType): height of all input images, or of
+                every input image.
+            min_area_ratio (float): smallest fraction of the area of a warped box
+                which must be inside its window, default is 0.
+            generator (torch.Generator | None): CPU generator, the default one if None.
+
+        Returns:
+            tuple[TorchBoxes, CoordTensorType]: warped Boxes, and the indices of the
+                kept boxes in `boxes`.
+        """
+        num_images = boxes.num_images if isinstance(boxes, BatchedTorchBoxes) else 1
+        matrices, _, _, windows = self.sample(width, height, num_images, generator)
+        return warp_boxes(boxes, matrices, windows, min_area_ratio)
+
+
+class Compose(Transform):
+    """Chain transforms, fused into a single matrix per image."""
+
+    def __init__(self, transforms: Sequence[Transform]):
+        """Make a Compose object.
+
+        Args:
+            transforms (Sequence[Transform]): transforms, applied in order.
+        """
+        self.transforms = list(transforms)
+
+    def get_matrices(
+        self,
+        width: CoordTensorType,
+        height: CoordTensorType,
+        generator: torch.Generator | None = None,
+    ) -> tuple[CoordTensorType, CoordTensorType, CoordTensorType]:
+        """Sample the transforms in order and multiply their matrices.
+
+        Args:
+            width (CoordTensorType): width of every input image.
+            height (CoordTensorType): height of every input image.
+            generator (torch.Generator | None): CPU generator, the default one if None.
+
+        Returns:
+            tuple[CoordTensorType, CoordTensorType, CoordTensorType]: product of the
+                matrices, width and height of the images output by the last
+                transform.
+        """
+        matrices = _make_matrices(1.0, 0.0, 0.0, 0.0, 1.0, 0.0, len(width))
+        for transform in self.transforms:
+            transform_matrices, width, height = transform.get_matrices(
+                width, height, generator
+            )
+            matrices = transform_matrices @ matrices
+        return matrices, width, height
+
+    def get_params(
+        self,
+        width: CoordTensorType,
+        height: CoordTensorType,
+        windows: CoordTensorType,
+        generator: torch.Generator | None = None,
+    ) -> tuple[CoordTensorType, CoordTensorType, CoordTensorType, CoordTensorType]:
+        """Sample the transforms in order and multiply their matrices.
+
+        Args:
+            width (CoordTensorType): width of every input image.
+            height (CoordTensorType): height of every input image.
+            windows (CoordTensorType): window of every input image.
+            generator (torch.Generator | None): CPU generator, the default one if None.
+
+        Returns:
+            tuple[CoordTensorType, CoordTensorType, CoordTensorType, CoordTensorType]:
+                product of the matrices, width, height and windows of the images
+                output by the last transform.
+        """
+        matrices = _make_matrices(1.0, 0.0, 0.0, 0.0, 1.0, 0.0, len(width))
+        for transform in self.transforms:
+            transform_matrices, width, height, windows = transform.get_params(
+                width, height, windows, generator
+            )
+            matrices = transform_matrices @ matrices
+        return matrices, width, height, windows
+
+
+class HorizontalFlip(Transform):
+    """Flip images left to right."""
+
+    def __init__(self, p: float = 0.5):
+        """Make a HorizontalFlip object.
+
+        Args:
+            p (float): probability to flip an image, default is 0.5.
+        """
+        self.p = p
+
+    def get_matrices(
+        self,
+        width: CoordTensorType,
+        height: CoordTensorType,
+        generator: torch.Generator | None = None,
+    ) -> tuple[CoordTensorType, CoordTensorType, CoordTensorType]:
+        """Sample the images to flip, x becomes width - x.
+
+        Args:
+            width (CoordTensorType): width of every input image.
+            height (CoordTensorType): height of every input image.
+            generator (torch.Generator | None): CPU generator, the default one if None.
+
+        Returns:
+            tuple[CoordTensorType, CoordTensorType, CoordTensorType]: matrices, and
+                the unchanged width and height.
+        """
+        flip = torch.rand(len(width), dtype=torch.float64, generator=generator) < self.p
+        matrices = _make_matrices(
+            torch.where(flip, -1.0, 1.0),
+            0.0,
+            torch.where(flip, width, 0.0),
+            0.0,
+            1.0,
+            0.0,
+            len(width),
+        )
+        return matrices, width, height
+
+
+class VerticalFlip(Transform):
+    """Flip images upside down."""
+
+    def __init__(self, p: float = 0.5):
+        """Make a VerticalFlip object.
+
+        Args:
+            p (float): probability to flip an image, default is 0.5.
+        """
+        self.p = p
+
+    def get_matrices(
+        self,
+        width: CoordTensorType,
+        height: CoordTensorType,
+        generator: torch.Generator | None = None,
+    ) -> tuple[CoordTensorType, CoordTensorType, CoordTensorType]:
+        """Sample the images to flip, y becomes height - y.
+
+        Args:
+            width (CoordTensorType): width of every input image.
+            height (CoordTensorType): height of every input image.
+            generator (torch.Generator | None): CPU generator, the default one if None.
+
+        Returns:
+            tuple[CoordTensorType, CoordTensorType, CoordTensorType]: matrices, and
+                the unchanged width and height.
+        """
+        flip = torch.rand(len(width), dtype=torch.float64, generator=generator) < self.p
+        matrices = _make_matrices(
+            1.0,
+            0.0,
+            0.0,
+            0.0,
+            torch.where(flip, -1.0, 1.0),
+            torch.where(flip, height, 0.0),
+            len(width),
+        )
+        return matrices, width, height
+
+
+class RandomCrop(Transform):
+    """Crop a window of a fixed size at a random position of the images, the
+    window being shrunk to the images smaller than it. Pass a `min_area_ratio`
+    to remove the boxes mostly outside of the window.
+    """
+
+    def __init__(self, width: int, height: int):
+        """Make a RandomCrop object.
+
+        Args:
+            width (int): width of the window.
+            height (int): height of the window.
+        """
+        self.width = width
+        self.height = height
+
+    def get_matrices(
+        self,
+        width: CoordTensorType,
+        height: CoordTensorType,
+        generator: torch.Generator | None = None,
+    ) -> tuple[CoordTensorType, CoordTensorType, CoordTensorType]:
+        """Sample the integer position of the window in every image.
+
+        Args:
+            width (CoordTensorType): width of every input image.
+            height (CoordTensorType): height of every input image.
+            generator (torch.Generator | None): CPU generator, the default one if None.
+
+        Returns:
+            tuple[CoordTensorType, CoordTensorType, CoordTensorType]: translations by
+                the opposite of the position of the window, width and height of the
+                windows.
+        """
+        crop_width = width.clamp(max=self.width)
+        crop_height = height.clamp(max=self.height)
+        x = _uniform(0.0, 1.0, len(width), generator).mul_(width - crop_width + 1)
+        y = _uniform(0.0, 1.0, len(width), generator).mul_(height - crop_height + 1)
+        x = x.floor_().minimum(width - crop_width)
+        y = y.floor_().minimum(height - crop_height)
+        matrices = _make_matrices(1.0, 0.0, -x, 0.0, 1.0, -y, len(width))
+        return matrices, crop_width, crop_height
+
+
+class Letterbox(Transform):
+    """Resize images to fit in a fixed size, keeping their aspect ratio, and
+    pad them evenly on both sides of the short axis.
+    """
+
+    def __init__(self, width: int, height: int):
+        """Make a Letterbox object.
+
+        Args:
+            width (int): width of the output images.
+            height (int): height of the output images.
+        """
+        self.width = width
+        self.height = height
+
+    def get_matrices(
+        self,
+        width: CoordTensorType,
+        height: CoordTensorType,
+        generator: torch.Generator | None = None,
+    ) -> tuple[CoordTensorType, CoordTensorType, CoordTensorType]:
+        """Compute the scale and padding of every image.
+
+        Args:
+            width (CoordTensorType): width of every input image.
+            height (CoordTensorType): height of every input image.
+            generator (torch.Generator | None): unused, the transform isn't random.
+
+        Returns:
+            tuple[CoordTensorType, CoordTensorType, CoordTensorType]: matrices, width
+                and height of the output images.
+        """
+        scale = torch.minimum(self.width / width, self.height / height)
+        matrices = _make_matrices(
+            scale,
+            0.0,
+            (self.width - scale * width) / 2,
+            0.0,
+            scale,
+            (self.height - scale * height) / 2,
+            len(width),
+        )
+        return (
+            matrices,
+            torch.full_like(width, self.width),
+            torch.full_like(height, self.height),
+        )
+
+
+class Affine(Transform):
+    """Apply a fixed affine matrix to the images, keeping their size."""
+
+    def __init__(self, matrix: CoordTensorType | Sequence[Sequence[float]]):
+        """Make an Affine object.
+
+        Args:
+            matrix (CoordTensorType | Sequence[Sequence[float]]): affine matrix of
+                size (3, 3) or (2, 3), applied to homogeneous (x, y, 1) coordinates.
+        """
+        matrix = torch.as_tensor(matrix, dtype=torch.float64).reshape(-1, 3)
+        self.matrix = torch.cat([matrix[:2], matrix.new_tensor([[0.0, 0.0, 1.0]])])
+
+    def get_matrices(
+        self,
+        width: CoordTensorType,
+        height: CoordTensorType,
+        generator: torch.Generator | None = None,
+    ) -> tuple[CoordTensorType, CoordTensorType, CoordTensorType]:
+        """Return the matrix for every image.
+
+        Args:
+            width (CoordTensorType): width of every input image.
+            height (CoordTensorType): height of every input image.
+            generator (torch.Generator | None): unused, the transform isn't random.
+
+        Returns:
+            tuple[CoordTensorType, CoordTensorType, CoordTensorType]: matrices, and
+                the unchanged width and height.
+        """
+        return self.matrix.expand(len(width), 3, 3), width, height
+
+
+class RandomAffine(Transform):
+    """Rotate, scale and shear images around their center, then translate
+    them, with random parameters, keeping their size.
+    """
+
+    def __init__(
+        self,
+        degrees: float = 0.0,
+        translate: float = 0.0,
+        scale: tuple[float, float] = (1.0, 1.0),
+        shear: float = 0.0,
+    ):
+        """Make a RandomAffine object.
+
+        Args:
+            degrees (float): largest counterclockwise or clockwise rotation, in
+                degrees, default is 0.
+            translate (float): largest translation along an axis, as a fraction of
+                the image size along this axis, default is 0.
+            scale (tuple[float, float]): range of the scale factor, default is
+                (1, 1).
+            shear (float): largest shear angle along each axis, in degrees, default
+                is 0.
+        """
+        self.degrees = degrees
+        self.translate = translate
+        self.scale = scale
+        self.shear = shear
+
+    def get_matrices(
+        self,
+        width: CoordTensorType,
+        height: CoordTensorType,
+        generator: torch.Generator | None = None,
+    ) -> tuple[CoordTensorType, CoordTensorType, CoordTensorType]:
+        """Sample the rotation, scale, shear and translation of every image.
+
+        Args:
+            width (CoordTensorType): width of every input image.
+            height (CoordTensorType): height of every input image.
+            generator (torch.Generator | None): CPU generator, the default one if None.
+
+        Returns:
+            tuple[CoordTensorType, CoordTensorType, CoordTensorType]: matrices, and
+                the unchanged width and height.
+        """
+        num_images = len(width)
+        angle = _uniform(-self.degrees, self.degrees, num_images, generator)
+        angle = angle.mul_(math.pi / 180)
+        scale = _uniform(*self.scale, num_images, generator)
+        shear_x, shear_y = (
+            _uniform(-self.shear, self.shear, num_images, generator)
+            .mul_(math.pi / 180)
+            .tan_()
+            for _ in range(2)
+        )
+        dx = _uniform(-self.translate, self.translate, num_images, generator) * width
+        dy = _uniform(-self.translate, self.translate, num_images, generator) * height
+
+        # The y axis points down, so that a counterclockwise rotation on screen
+        # maps (x, y) to (x cos + y sin, -x sin + y cos).
+        cos, sin = scale * angle.cos(), scale * angle.sin()
+        centering = _make_matrices(
+            1.0, 0.0, -width / 2, 0.0, 1.0, -height / 2, num_images
+        )
+        rotation = _make_matrices(cos, sin, 0.0, -sin, cos, 0.0, num_images)
+        shearing = _make_matrices(1.0, shear_x, 0.0, shear_y, 1.0, 0.0, num_images)
+        translation = _make_matrices(
+            1.0, 0.0, width / 2 + dx, 0.0, 1.0, height / 2 + dy, num_images
+        )
+        return translation @ shearing @ rotation @ centering, width, height
@@ -0,0 +1,481 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Sequence
+
+import torch
+
+from anyboxes._errors import MissingToMethodError
+from anyboxes.implementations.box_format import BoxFormat
+from anyboxes.implementations.origin import Origin
+
+from ._utils import check_height
+from .boxes import TorchBoxes
+from .functional import convert_boxes, flip_boxes
+from .interop import to_torch
+from .nms import SoftNMSMethod
+
+if TYPE_CHECKING:
+    from jaxtyping import Shaped
+
+    from ._typing import (
+        BatchImageTensorType,
+        BoxesTensorType,
+        CoordTensorType,
+        ImageTensorType,
+        MaskTensorType,
+    )
+
+
+class BatchedTorchBoxes(TorchBoxes):
+    """Represent the bounding boxes of a batch of images, with a different
+    number of boxes per image.
+
+    The boxes of all images are stored in a single packed tensor of size (n, 4),
+    image after image, so that conversions, `square`, `flip_origin` and masks
+    run once over all images. `lengths[i]` is the number of boxes of the image
+    `i` and `offsets[i]` the position of its first box in the packed tensor.
+    """
+
+    def __init__(
+        self,
+        boxes: BoxesTensorType,
+        origin: Origin,
+        lengths: CoordTensorType | None = None,
+    ):
+        """Make a BatchedTorchBoxes object. Object instanced is expected by
+        classmethod `from_packed` or `from_list`.
+
+        Args:
+            boxes (BoxesTensorType): Packed boxes of size (n, 4),
+                containing the (x_1, y_1, x_3, y_3) for all boxes.
+            origin (Origin): Origin of Boxes.
+            lengths (CoordTensorType | None): Number of boxes of every image, all
+                boxes belong to a single image if None.
+
+        Raises:
+            ValueError: Raised if the lengths don't sum to the number of boxes.
+        """
+        super().__init__(boxes, origin)
+        if lengths is None:
+            lengths = torch.tensor([len(boxes)])
+        lengths = torch.as_tensor(lengths, dtype=torch.long, device=boxes.device)
+        if int(lengths.sum()) != len(boxes):
+            raise ValueError("`lengths` must sum to the number of boxes.")
+        self._lengths = lengths
+        self._offsets = torch.cat(
+            [lengths.new_zeros(1), torch.cumsum(lengths, dim=0)]
+        ).tolist()
+
+    @property
+    def num_images(self) -> int:
+        """Return the number of images of the batch.
+
+        Returns:
+            int: Number of images.
+        """
+        return len(self._lengths)
+
+    @property
+    def lengths(self) -> CoordTensorType:
+        """Return the number of boxes of every image.
+
+        Returns:
+            CoordTensorType: Tensor of size (num_images).
+        """
+        return self._lengths
+
+    @property
+    def offsets(self) -> list[int]:
+        """Return the position of the first box of every image in the packed
+        boxes, followed by the total number of boxes.
+
+        Returns:
+            list[int]: List of size num_images + 1.
+        """
+        return self._offsets
+
+    @property
+    def image_indices(self) -> CoordTensorType:
+        """Return the index of the image of every box.
+
+        Returns:
+            CoordTensorType: Tensor of size (n).
+        """
+        return torch.repeat_interleave(
+            torch.arange(self.num_images, device=self.device), self._lengths
+        )
+
+    @classmethod
+    def from_packed(
+        cls,
+        boxes: BoxesTensorType,
+        lengths: CoordTensorType | Sequence[int],
+        box_format: BoxFormat | str = BoxFormat.TWO_CORNERS,
+        origin: Origin = Origin.TOP_LEFT,
+        dtype: torch.dtype | None = None,
+    ) -> BatchedTorchBoxes:
+        """Generate BatchedTorchBoxes from the packed boxes of all images.
+
+        Args:
+            boxes (BoxesTensorType): boxes of size (n, 4) in `box_format`, image
+                after image, as a tensor or a NumPy, JAX or Tensorflow array.
+            lengths (CoordTensorType | Sequence[int]): number of boxes of every image.
+            box_format (BoxFormat | str): format of the boxes, default is `two-corners`.
+            origin (Origin): default is `top-left`
+            dtype (torch.dtype | None): storage dtype, the dtype of floating point
+                boxes and the default floating point dtype for integer boxes if None.
+
+        Returns:
+            BatchedTorchBoxes: object of class BatchedTorchBoxes.
+        """
+        return cls(
+            convert_boxes(to_torch(boxes), box_format, BoxFormat.TWO_CORNERS, dtype),
+            origin,
+            torch.as_tensor(lengths),
+        )
+
+    @classmethod
+    def from_list(
+        cls,
+        boxes: Sequence[BoxesTensorType],
+        box_format: BoxFormat | str = BoxFormat.TWO_CORNERS,
+        origin: Origin = Origin.TOP_LEFT,
+        dtype: torch.dtype | None = None,
+    ) -> BatchedTorchBoxes:
+        """Generate BatchedTorchBoxes from one tensor of boxes per image.
+
+        Args:
+            boxes (Sequence[BoxesTensorType]): boxes of size (n_i, 4) in `box_format`
+                for every image, as tensors or NumPy, JAX or Tensorflow arrays.
+            box_format (BoxFormat | str): format of the boxes, default is `two-corners`.
+            origin (Origin): default is `top-left`
+            dtype (torch.dtype | None): storage dtype, the dtype of floating point
+                boxes and the default floating point dtype for integer boxes if None.
+
+        Returns:
+            BatchedTorchBoxes: object of class BatchedTorchBoxes.
+        """
+        return cls.from_packed(
+            torch.cat([to_torch(b).reshape(-1, 4) for b in boxes]),
+            [len(b) for b in boxes],
+            box_format,
+            origin,
+            dtype,
+        )
+
+    def get_image(self, index: int | slice) -> TorchBoxes | BatchedTorchBoxes:
+        """Return the boxes of an image, or of a range of images, sharing the
+        storage of the packed boxes.
+
+        Args:
+            index (int | slice): index of the image, or slice of images with step 1.
+
+        Returns:
+            TorchBoxes | BatchedTorchBoxes: boxes of the image, or of the images if
+                `index` is a slice.
+        """
+        if isinstance(index, slice):
+            start, stop, _ = index.indices(self.num_images)
+            stop = max(start, stop)
+            return BatchedTorchBoxes(
+                self._boxes[self._offsets[start] : self._offsets[stop]],
+                self._origin,
+                self._lengths[start:stop],
+            )
+        index = range(self.num_images)[index]
+        return TorchBoxes(
+            self._boxes[self._offsets[index] : self._offsets[index + 1]], self._origin
+        )
+
+    def split(self) -> list[TorchBoxes]:
+        """Return the boxes of every image, sharing the storage of the packed
+        boxes.
+
+        Returns:
+            list[TorchBoxes]: boxes of every image.
+        """
+        return [
+            TorchBoxes(boxes, self._origin)
+            for boxes in self._boxes.split(self._lengths.tolist())
+        ]
+
+    def _with_boxes(self, boxes: BoxesTensorType, origin: Origin) -> BatchedTorchBoxes:
+        """Return Boxes of the same batch of images holding other packed boxes.
+
+        Args:
+            boxes (BoxesTensorType): Packed boxes of size (n, 4).
+            origin (Origin): Origin of the Boxes.
+
+        Returns:
+            BatchedTorchBoxes: Boxes sharing the memory of `boxes`.
+        """
+        return BatchedTorchBoxes(boxes, origin, self._lengths)
+
+    def __get_box_values(
+        self, values: float | CoordTensorType
+    ) -> float | CoordTensorType:
+        """Expand a value per image to a value per box.
+
+        Args:
+            values (float | CoordTensorType): number, or tensor of size
+                (num_images).
+
+        Returns:
+            float | CoordTensorType: number, or tensor of size (n).
+        """
+        if isinstance(values, (int, float)):
+            return values
+        values = torch.as_tensor(values, device=self.device)
+        if not values.ndim:
+            return values.item()
+        return values.index_select(0, self.image_indices)
+
+    def flip_origin(
+        self, height: int | CoordTensorType, out: BoxesTensorType | None = None
+    ):
+        """Flip the origin of the Boxes given the height of every image. Work
+        in place, without allocating new packed boxes.
+
+        Args:
+            height (int | CoordTensorType): height of all images, or tensor of size
+                (num_images) containing the height of every image.
+            out (BoxesTensorType | None): preallocated tensor of the size and dtype
+                of the packed boxes receiving the flipped boxes, the Boxes are left
+                unchanged. Work in place if None.
+
+        Returns:
+            self, or new Boxes holding `out`.
+        """
+        height = self.__get_box_values(height)
+        check_height(self._boxes, height)
+        flip_boxes(self._boxes, height, out=self._get_out(out))
+        origin = (
+            Origin.BOTTOM_LEFT if self._origin == Origin.TOP_LEFT else Origin.TOP_LEFT
+        )
+        return self._updated(out, origin)
+
+    def resize_to_image(
+        self,
+        width: float | CoordTensorType,
+        height: float | CoordTensorType,
+        new_width: float | CoordTensorType,
+        new_height: float | CoordTensorType,
+        out: BoxesTensorType | None = None,
+    ):
+        """Map the Boxes of every image to the same image resized. Work in
+        place, without allocating new packed boxes.
+
+        Args:
+            width (float | CoordTensorType): width of all images, or tensor of size
+                (num_images) containing the width of every image.
+            height (float | CoordTensorType): height of all images, or of every image.
+            new_width (float | CoordTensorType): width of all resized images, or of
+                every resized image.
+            new_height (float | CoordTensorType): height of all resized images, or of
+                every resized image.
+            out (BoxesTensorType | None): preallocated tensor of the size and dtype
+                of the packed boxes receiving the resized boxes, the Boxes are left
+                unchanged. Work in place if None.
+
+        Returns:
+            self, or new Boxes holding `out`.
+        """
+        return self.scale(
+            self.__get_box_values(new_width) / self.__get_box_values(width),
+            self.__get_box_values(new_height) / self.__get_box_values(height),
+            out,
+        )
+
+    def clip_to_image(
+        self,
+        width: float | CoordTensorType,
+        height: float | CoordTensorType,
+        out: BoxesTensorType | None = None,
+    ):
+        """Clip the Boxes to their image. Work in place, without allocating
+        new packed boxes.
+
+        Args:
+            width (float | CoordTensorType): width of all images, or tensor of size
+                (num_images) containing the width of every image.
+            height (float | CoordTensorType): height of all images, or of every image.
+            out (BoxesTensorType | None): preallocated tensor of the size and dtype
+                of the packed boxes receiving the clipped boxes, the Boxes are left
+                unchanged. Work in place if None.
+
+        Returns:
+            self, or new Boxes holding `out`.
+        """
+        return super().clip_to_image(
+            self.__get_box_values(width), self.__get_box_values(height), out
+        )
+
+    def get_binary_mask(
+        self,
+        width: int,
+        height: int,
+        merge: bool = False,
+        image_indices: CoordTensorType | None = None,
+        num_images: int | None = None,
+        dtype: torch.dtype = torch.uint8,
+    ) -> MaskTensorType:
+        """Build a mask to hide the parts of the images inside the bounding
+        boxes. Merged masks are built per image of the batch.
+
+        Args:
+            width (int) : desired mask width
+            height (int) : desired mask height
+            merge (bool) : return the union of the masks of every image instead of
+                one mask per box
+            image_indices (CoordTensorType | None) : index of the image of every box,
+                the images of the batch if None
+            num_images (int | None) : number of images, the size of the batch if None
+            dtype (torch.dtype) : dtype of the mask, default is `torch.uint8`
+        Returns:
+            torch.Tensor : binary tensor containing the mask (has ones everywhere,
+                with zeroes inside the bounding boxes), size (n_boxes, height, width),
+                or (num_images, height, width) if `merge`
+        """
+        if merge and image_indices is None:
+            image_indices, num_images = self.image_indices, self.num_images
+        return super().get_binary_mask(
+            width, height, merge, image_indices, num_images, dtype
+        )
+
+    def crop_from(
+        self,
+        image: ImageTensorType | BatchImageTensorType,
+        output_size: int | tuple[int, int],
+        offsets: Sequence[int] | None = None,
+        sampling_ratio: int = 1,
+    ) -> BatchImageTensorType:
+        """Crop the Boxes out of their image of the batch, and resize the crops
+        to a fixed size by bilinear interpolation, as `roi_align`. All crops are
+        sampled at once, without a loop over the boxes.
+
+        Args:
+            image (ImageTensorType | BatchImageTensorType): batch of images of size
+                (num_images, channel, height, width).
+            output_size (int | tuple[int, int]): (height, width) of the crops, or
+                side of square crops.
+            offsets (Sequence[int] | None): position of the first box of every image
+                in the Boxes, followed by the number of Boxes, the offsets of the
+                batch if None.
+            sampling_ratio (int): number of bilinear samples averaged per output
+                pixel along each axis, default is 1.
+
+        Returns:
+            BatchImageTensorType: crops of size (n, channel, *output_size).
+        """
+        if offsets is None:
+            offsets = self.offsets
+        return super().crop_from(image, output_size, offsets, sampling_ratio)
+
+    def __get_image_classes(self, classes: CoordTensorType | None) -> CoordTensorType:
+        """Combine the image of every box with its class, so that boxes of
+        different images never suppress each other.
+
+        Args:
+            classes (CoordTensorType | None): classes of size (n), or None.
+
+        Returns:
+            CoordTensorType: combined classes of size (n).
+        """
+        image_indices = self.image_indices
+        if classes is None or not len(classes):
+            return image_indices
+        classes = classes.to(torch.long)
+        return image_indices * (int(classes.max()) + 1) + classes
+
+    def nms(
+        self,
+        scores: CoordTensorType,
+        iou_threshold: float = 0.5,
+        classes: CoordTensorType | None = None,
+        top_k: int | None = None,
+    ) -> CoordTensorType:
+        """Perform non-maximum suppression independently on every image.
+
+        Args:
+            scores (CoordTensorType): scores of size (n).
+            iou_threshold (float): boxes overlapping a better box with an IoU
+                higher than this threshold are discarded.
+            classes (CoordTensorType | None): classes of size (n), boxes of
+                different classes never suppress each other.
+            top_k (int | None): number of best boxes of the batch kept before
+                suppression.
+
+        Returns:
+            CoordTensorType: indices of the kept boxes in the packed boxes, sorted by
+                decreasing score.
+        """
+        return super().nms(
+            scores, iou_threshold, self.__get_image_classes(classes), top_k
+        )
+
+    def soft_nms(
+        self,
+        scores: CoordTensorType,
+        sigma: float = 0.5,
+        method: SoftNMSMethod | str = SoftNMSMethod.GAUSSIAN,
+        iou_threshold: float = 0.3,
+        score_threshold: float = 1e-3,
+        classes: CoordTensorType | None = None,
+        top_k: int | None = None,
+    ) -> tuple[CoordTensorType, CoordTensorType]:
+        """Perform soft non-maximum suppression independently on every image.
+
+        Args:
+            scores (CoordTensorType): scores of size (n).
+            sigma (float): spread of the gaussian decay.
+            method (SoftNMSMethod | str): `linear` or `gaussian` decay.
+            iou_threshold (float): IoU above which scores are decayed with the
+                linear decay.
+            score_threshold (float): boxes whose score falls below this threshold
+                are discarded.
+            classes (CoordTensorType | None): classes of size (n), boxes of
+                different classes never decay each other.
+            top_k (int | None): number of best boxes of the batch kept before
+                suppression.
+
+        Returns:
+            tuple[CoordTensorType, CoordTensorType]: indices of the kept boxes in the
+                packed boxes and their decayed scores, sorted by decreasing decayed score.
+        """
+        return super().soft_nms(
+            scores,
+            sigma,
+            method,
+            iou_threshold,
+            score_threshold,
+            self.__get_image_classes(classes),
+            top_k,
+        )
+
+    @property
+    def padding_mask(self) -> Shaped[torch.Tensor, "image box"]:  # noqa: F722
+        """Return which entries of the padded tensor hold a box.
+
+        Returns:
+            Shaped[torch.Tensor, "image box"]: boolean tensor of size (num_images, max_n).
+        """
+        max_length = int(self._lengths.max()) if self.num_images else 0
+        return torch.arange(max_length, device=self.device) < self._lengths[:, None]
+
+    @property
+    def as_padded_tensor(self) -> Shaped[torch.Tensor, "image box 4"]:  # noqa: F722
+        """Return boxes' data as a dense `torch.Tensor`, padded with zeros.
+
+        Raises:
+            MissingToMethodError: Raised if no `to` methods has been run.
+
+        Returns:
+            Shaped[torch.Tensor, "image box 4"]: boxes of size (num_images, max_n, 4),
+                see `padding_mask` for the entries holding a box.
+        """
+        if not hasattr(self, "boxes_"):
+            raise MissingToMethodError
+        padding_mask = self.padding_mask
+        padded = self.boxes_.new_zeros(*padding_mask.shape, 4)
+        padded[padding_mask] = self.boxes_
+        return padded
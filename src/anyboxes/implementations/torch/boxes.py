@@ -1,13 +1,31 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Sequence
 
 import torch
 
-from anyboxes._errors import MissingToMethodError, OptionalDependencyImportError
+from anyboxes._errors import MissingToMethodError
+from anyboxes.implementations.box_format import BoxFormat
 from anyboxes.implementations.origin import Origin
 
+from ._utils import check_height, get_tensor_version
 from .coordinates import Coordinates, Size
+from .crops import crop_and_resize
+from .functional import (
+    box_centers,
+    box_sizes,
+    clip_boxes,
+    convert_boxes,
+    flip_boxes,
+    scale_boxes,
+    square_boxes,
+    translate_boxes,
+)
+from .interop import is_immutable, prepare_export, to_jax, to_tf, to_torch
+from .masks import LazyBinaryMasks, build_binary_masks, build_union_binary_masks
+from .nms import SoftNMSMethod, nms, soft_nms
+from .overlaps import OverlapMetric, compute_overlaps
+from .spatial_index import GridIndex
 
 if TYPE_CHECKING:
     from jaxtyping import Array, Shaped
@@ -15,11 +33,14 @@ if TYPE_CHECKING:
     from tensorflow import Tensor
 
     from ._typing import (
+        BatchImageTensorType,
         BoxesTensorType,
         BoxTensorType,
         CoordTensorType,
         FourCornersCoordinates,
+        ImageTensorType,
         MaskTensorType,
+        OverlapsTensorType,
     )
 
 
@@ -30,37 +51,185 @@ class TorchBoxes:
     3: bottom-right corner
     3: bottom-left corner.
 
-    The boxes will all be stored as it has been given.
-    The `to` methods are inplace and produce a `boxes_` attribute.
+    The boxes are stored in a single packed tensor of size (n, 4) containing the
+    (x_1, y_1, x_3, y_3) for all boxes. Corners coordinates, center coordinates
+    and size are derived from it on access.
+    The `to` methods are inplace and produce a `boxes_` attribute. Their outputs
+    and the Python exports are cached until the boxes are modified, so they must
+    not be modified in place.
     """
 
-    def __init__(
-        self,
-        corners_coordinates: FourCornersCoordinates,
-        center_coordinates: Coordinates,
-        size: Size,
-        origin: Origin,
-        device: torch.device,
-    ):
+    def __init__(self, boxes: BoxesTensorType, origin: Origin):
         """Make a Boxes object. Object instanced is expected by classmethod
         `from_center`, `from_top_left_corner` or `from_two_corners`.
 
         Args:
-            corners_coordinates (FourCornersCoordinates): All corners coordinates.
-            center_coordinates (Coordinates): Center coordinates.
-            size (Size): Size of Boxes.
+            boxes (BoxesTensorType): Packed boxes of size (n, 4),
+                containing the (x_1, y_1, x_3, y_3) for all boxes.
             origin (Origin): Origin of Boxes.
-            device (torch.device): PyTorch device.
+
+        Raises:
+            ValueError: Raised if the boxes aren't of size (n, 4).
+        """
+        if boxes.ndim != 2 or boxes.shape[1] != 4:
+            raise ValueError(
+                "Boxes must be of size (n, 4), got a tensor of size"
+                f" {tuple(boxes.shape)}."
+            )
+        self._boxes = boxes
+        self._origin = origin
+        self._len = boxes.shape[0]
+        self._version = 0
+        self._cache: dict[Hashable, tuple[Any, int | None]] = {}
+        self._cache_version = get_tensor_version(boxes)
+
+    def _mutated(self):
+        """Record that the packed boxes have been modified in place, so that
+        objects derived from them, such as spatial indexes, are rebuilt and
+        cached representations are dropped.
+        """
+        self._version += 1
+        self._cache.clear()
+
+    def _get_cached(self, key: Hashable, compute: Callable[[], Any]) -> Any:
+        """Return a representation derived from the packed boxes, computed on
+        first access. The cache is dropped by `_mutated`, and when the version
+        counter of the packed tensor changes, which happens when the boxes are
+        modified in place through a view, such as a slice of the Boxes. A cached
+        tensor is also recomputed once it has been modified in place. Inference
+        tensors don't have a version counter, so only `_mutated` drops the cache
+        of Boxes built under `torch.inference_mode`.
+
+        Args:
+            key (Hashable): Key of the representation.
+            compute (Callable[[], Any]): Function computing the representation.
+
+        Returns:
+            Any: Cached representation.
+        """
+        version = get_tensor_version(self._boxes)
+        if self._cache_version != version:
+            self._cache.clear()
+            self._cache_version = version
+        if key in self._cache:
+            value, value_version = self._cache[key]
+            if not isinstance(value, torch.Tensor):
+                return value
+            if get_tensor_version(value) == value_version:
+                return value
+        value = compute()
+        value_version = (
+            get_tensor_version(value) if isinstance(value, torch.Tensor) else None
+        )
+        self._cache[key] = (value, value_version)
+        return value
+
+    def _with_boxes(self, boxes: BoxesTensorType, origin: Origin) -> TorchBoxes:
+        """Return Boxes of the same kind holding other packed boxes.
+
+        Args:
+            boxes (BoxesTensorType): Packed boxes of size (n, 4).
+            origin (Origin): Origin of the Boxes.
+
+        Returns:
+            TorchBoxes: Boxes sharing the memory of `boxes`.
+        """
+        return TorchBoxes(boxes, origin)
+
+    def _get_out(self, out: BoxesTensorType | None) -> BoxesTensorType:
+        """Return the tensor receiving the result of a mutator.
+
+        Args:
+            out (BoxesTensorType | None): Preallocated tensor, or None to work in
+                place.
+
+        Raises:
+            ValueError: Raised if `out` doesn't have the size and dtype of the
+                packed boxes.
+
+        Returns:
+            BoxesTensorType: `out`, or the packed boxes if None.
+        """
+        if out is None:
+            return self._boxes
+        if out.shape != self._boxes.shape or out.dtype != self._boxes.dtype:
+            raise ValueError(
+                f"`out` must be of size {tuple(self._boxes.shape)} and dtype"
+                f" {self._boxes.dtype}."
+            )
+        return out
+
+    def _updated(
+        self, out: BoxesTensorType | None, origin: Origin | None = None
+    ) -> TorchBoxes:
+        """Finish a mutator that wrote its result to `_get_out(out)`.
+
+        Args:
+            out (BoxesTensorType | None): Preallocated tensor, or None if the
+                Boxes were modified in place.
+            origin (Origin | None): Origin of the result, the origin of the
+                Boxes if None.
+
+        Returns:
+            TorchBoxes: self if `out` is None, new Boxes holding `out` otherwise.
         """
-        self.corners_coordinates = corners_coordinates
-        self.center_coordinates = center_coordinates
-        self.size = size
+        origin = self._origin if origin is None else origin
+        if out is not None:
+            return self._with_boxes(out, origin)
         self._origin = origin
-        self.device = device
+        self._mutated()
+        return self
+
+    @property
+    def device(self) -> torch.device:
+        """Return the device on which the Boxes are stored.
+
+        Returns:
+            torch.device: PyTorch device.
+        """
+        return self._boxes.device
+
+    @property
+    def corners_coordinates(self) -> FourCornersCoordinates:
+        """Return all corners coordinates as views of the packed boxes.
+
+        Returns:
+            FourCornersCoordinates: All corners coordinates.
+        """
+        x_1, y_1, x_3, y_3 = self._boxes.unbind(dim=1)
+        return (
+            Coordinates(x_1, y_1, self.device),
+            Coordinates(x_3, y_1, self.device),
+            Coordinates(x_3, y_3, self.device),
+            Coordinates(x_1, y_3, self.device),
+        )
+
+    @property
+    def center_coordinates(self) -> Coordinates:
+        """Return center coordinates computed from the packed boxes.
+
+        Returns:
+            Coordinates: Center coordinates.
+        """
+        x_c, y_c = box_centers(self._boxes).unbind(dim=1)
+        return Coordinates(x_c, y_c, self.device)
+
+    @property
+    def size(self) -> Size:
+        """Return size computed from the packed boxes. Size is the absolute
+        extent of the boxes, so it stays positive once the origin has been
+        flipped.
+
+        Returns:
+            Size: Size of Boxes.
+        """
+        w, h = box_sizes(self._boxes).unbind(dim=1)
+        return Size(w, h, self.device)
 
     @property
     def dimensions(self) -> Shaped[torch.Tensor, "5"]:  # noqa
-        """Return dimensions of FourCornersCoordinates and center_coordinates.
+        """Return dimensions of FourCornersCoordinates and center_coordinates,
+        as a debugging aid. They are always equal to the number of Boxes.
 
         Returns:
             TensorType[5]: Dimensions of FourCornersCoordinates and center_coordinates.
@@ -77,18 +246,23 @@ class TorchBoxes:
         )
 
     def __len__(self) -> int:
-        """Return the number of Boxes.
-
-        Raises:
-            RuntimeError: Some bboxes dimension aren't the same.
+        """Return the number of Boxes, validated at construction.
 
         Returns:
             int: Number of Boxes.
         """
-        dimensions = torch.unique(self.dimensions)
-        if len(dimensions) != 1:
-            raise RuntimeError("Not same boxes dimension!")
-        return dimensions.item()
+        return self._len
+
+    def __getitem__(self, index: int | slice | torch.Tensor) -> TorchBoxes:
+        """Return a subset of the Boxes, slices share the storage of the Boxes.
+
+        Args:
+            index (int | slice | torch.Tensor): Index of the boxes to keep.
+
+        Returns:
+            TorchBoxes: Subset of the Boxes.
+        """
+        return TorchBoxes(self._boxes[index].reshape(-1, 4), self._origin)
 
     @property
     def origin(self) -> str:
@@ -99,425 +273,371 @@ class TorchBoxes:
         """
         return self._origin.value
 
-    def flip_origin(self, height: int):
-        """Flip the origin of the Boxes given an image height. Work in place.
+    def flip_origin(self, height: int, out: BoxesTensorType | None = None):
+        """Flip the origin of the Boxes given an image height. Work in place,
+        without allocating new packed boxes.
 
         Args:
             height (int): height of the image.
+            out (BoxesTensorType | None): preallocated tensor of the size and dtype
+                of the packed boxes receiving the flipped boxes, the Boxes are left
+                unchanged. Work in place if None.
 
         Returns:
-            self
+            self, or new Boxes holding `out`.
         """
-        if height < self.size.h.min():
-            raise ValueError("`width` or `height` must be higher than boxes.")
-
-        for i, _ in enumerate(self.corners_coordinates):
-            self.corners_coordinates[i].y = height - self.corners_coordinates[i].y
-        self._origin = (
+        check_height(self._boxes, height)
+        flip_boxes(self._boxes, height, out=self._get_out(out))
+        origin = (
             Origin.BOTTOM_LEFT if self._origin == Origin.TOP_LEFT else Origin.TOP_LEFT
         )
-        return self
-
-    @staticmethod
-    def __recast_tensor(
-        tensor: Shaped[torch.Tensor, "batch 1"]  # noqa: F722
-    ) -> CoordTensorType:
-        """Recast torch.Tensor to 1 dimension in order to handle batch size
-        cases.
-
-        Args:
-            tensor (TensorType["batch", 1]): Tensor split from Boxes tensor
-
-        Returns:
-            CoordTensorType: Tensor of 1 dimension.
-        """
-        tensor = tensor.squeeze()
-        return tensor.unsqueeze(0) if tensor.dim() == 0 else tensor
-
-    @staticmethod
-    def __extract_coordinates_from_tensors(
-        boxes: BoxesTensorType,
-    ) -> tuple[CoordTensorType, CoordTensorType, CoordTensorType, CoordTensorType,]:
-        """Extract coordinates from `torch.Tensor`.
-
-        Args:
-            boxes (BoxesTensorType): Bounding boxes of shape (b, 4).
-
-        Returns:
-            Tuple[CoordTensorType, CoordTensorType, CoordTensorType, CoordTensorType,]: Tuple of coordinates.
-        """
-        x_1, x_2, x_3, x_4 = map(
-            TorchBoxes.__recast_tensor, torch.tensor_split(boxes, 4, dim=1)
-        )
-        return x_1, x_2, x_3, x_4
+        return self._updated(out, origin)
 
-    @staticmethod
-    def _extract_coordinates_from_tensor(
-        boxes: BoxTensorType,
-    ) -> tuple[CoordTensorType, CoordTensorType, CoordTensorType, CoordTensorType,]:
-        """Extract coordinates from `torch.Tensor`.
+    def translate(
+        self,
+        dx: float | CoordTensorType,
+        dy: float | CoordTensorType,
+        out: BoxesTensorType | None = None,
+    ):
+        """Translate the Boxes. Work in place, without allocating new packed
+        boxes.
 
         Args:
-            boxes (BoxesTensorType): Bounding box of shape (4).
+            dx (float | CoordTensorType): offset along x, or tensor of size (n)
+                containing the offset of every box.
+            dy (float | CoordTensorType): offset along y, or tensor of size (n)
+                containing the offset of every box.
+            out (BoxesTensorType | None): preallocated tensor of the size and dtype
+                of the packed boxes receiving the translated boxes, the Boxes are
+                left unchanged. Work in place if None.
 
         Returns:
-            Tuple[CoordTensorType, CoordTensorType, CoordTensorType, CoordTensorType,]: Tuple of coordinates.
+            self, or new Boxes holding `out`.
         """
-        x_1, x_2, x_3, x_4 = map(
-            TorchBoxes.__recast_tensor, torch.tensor_split(boxes.unsqueeze(0), 4, dim=1)
-        )
-        return x_1, x_2, x_3, x_4
+        translate_boxes(self._boxes, dx, dy, out=self._get_out(out))
+        return self._updated(out)
 
-    @staticmethod
-    def __compute_corners_from_center(
-        center_coordinates: Coordinates, size: Size, device: torch.device
-    ) -> FourCornersCoordinates:
-        """Generate corners coordinates given center coordinates and size.
+    def scale(
+        self,
+        sx: float | CoordTensorType,
+        sy: float | CoordTensorType,
+        out: BoxesTensorType | None = None,
+    ):
+        """Scale the Boxes around the origin of the coordinates. Work in place,
+        without allocating new packed boxes.
 
         Args:
-            center_coordinates (Coordinates): Center coordinates.
-            size (Size): Size of Boxes.
-            device (torch.device): PyTorch device.
+            sx (float | CoordTensorType): factor along x, or tensor of size (n)
+                containing the factor of every box.
+            sy (float | CoordTensorType): factor along y, or tensor of size (n)
+                containing the factor of every box.
+            out (BoxesTensorType | None): preallocated tensor of the size and dtype
+                of the packed boxes receiving the scaled boxes, the Boxes are left
+                unchanged. Work in place if None.
 
         Returns:
-            FourCornersCoordinates: All corners coordinates.
+            self, or new Boxes holding `out`.
         """
-        x_c, y_c = (center_coordinates.x, center_coordinates.y)
-        w, h = (
-            size.w,
-            size.h,
-        )
-        x_1, x_2 = x_c - w / 2, x_c + w / 2
-        x_3, x_4 = x_c + w / 2, x_c - w / 2
-        y_1, y_2 = y_c - h / 2, y_c - h / 2
-        y_3, y_4 = y_c + h / 2, y_c + h / 2
-        return (
-            Coordinates(x_1, y_1, device),
-            Coordinates(x_2, y_2, device),
-            Coordinates(x_3, y_3, device),
-            Coordinates(x_4, y_4, device),
-        )
+        scale_boxes(self._boxes, sx, sy, out=self._get_out(out))
+        return self._updated(out)
 
-    @staticmethod
-    def __compute_corners_from_top_left_corner_and_size(
-        top_left_corner: Coordinates, size: Size, device: torch.device
-    ) -> FourCornersCoordinates:
-        """Generate corners coordinates from top-left corner and size.
+    def resize_to_image(
+        self,
+        width: float,
+        height: float,
+        new_width: float,
+        new_height: float,
+        out: BoxesTensorType | None = None,
+    ):
+        """Map the Boxes of an image to the same image resized. Work in place,
+        without allocating new packed boxes.
 
         Args:
-            top_left_corner (Coordinates): Top-left corner.
-            size (Size): Size of Boxes.
-            device (torch.device): PyTorch device.
+            width (float): width of the image.
+            height (float): height of the image.
+            new_width (float): width of the resized image.
+            new_height (float): height of the resized image.
+            out (BoxesTensorType | None): preallocated tensor of the size and dtype
+                of the packed boxes receiving the resized boxes, the Boxes are left
+                unchanged. Work in place if None.
 
         Returns:
-            FourCornersCoordinates: All corners coordinates.
+            self, or new Boxes holding `out`.
         """
-        x_1, y_1 = (
-            top_left_corner.x,
-            top_left_corner.y,
-        )
-        w, h = size.w, size.h
-        x_2, y_2 = x_1 + w, y_1
-        x_3, y_3 = x_1 + w, y_1 + h
-        x_4, y_4 = x_1, y_1 + h
-        return (
-            Coordinates(x_1, y_1, device),
-            Coordinates(x_2, y_2, device),
-            Coordinates(x_3, y_3, device),
-            Coordinates(x_4, y_4, device),
-        )
+        return self.scale(new_width / width, new_height / height, out)
 
-    @staticmethod
-    def __compute_corners_from_bottom_left_corner(
-        bottom_left_corner: Coordinates, size: Size, device: torch.device
-    ) -> FourCornersCoordinates:
-        """Generate corners coordinates from bottom-left corner.
+    def clip_to_image(
+        self, width: float, height: float, out: BoxesTensorType | None = None
+    ):
+        """Clip the Boxes to an image. Work in place, without allocating new
+        packed boxes.
 
         Args:
-            bottom_left_corner (Coordinates): Bottom-left corner.
-            size (Size): Size of Boxes.
-            device (torch.device): PyTorch device.
+            width (float): width of the image.
+            height (float): height of the image.
+            out (BoxesTensorType | None): preallocated tensor of the size and dtype
+                of the packed boxes receiving the clipped boxes, the Boxes are left
+                unchanged. Work in place if None.
 
         Returns:
-            FourCornersCoordinates: All corners coordinates.
+            self, or new Boxes holding `out`.
         """
-        x_4, y_4 = bottom_left_corner.x, bottom_left_corner.y
-        w, h = size.w, size.h
-        x_1, y_1 = x_4, y_4 - h
-        x_2, y_2 = x_4 + w, y_4 - h
-        x_3, y_3 = x_4 + w, y_4
-        return (
-            Coordinates(x_1, y_1, device),
-            Coordinates(x_2, y_2, device),
-            Coordinates(x_3, y_3, device),
-            Coordinates(x_4, y_4, device),
-        )
+        clip_boxes(self._boxes, width, height, out=self._get_out(out))
+        return self._updated(out)
 
     @staticmethod
-    def __compute_corners_from_two_corners(
-        top_left_corner: Coordinates,
-        bottom_right_corner: Coordinates,
-        device: torch.device,
-    ) -> FourCornersCoordinates:
-        """Generate corners coordinates from two corners.
+    def _extract_coordinates_from_tensor(
+        boxes: BoxTensorType,
+    ) -> tuple[CoordTensorType, CoordTensorType, CoordTensorType, CoordTensorType,]:
+        """Extract coordinates from `torch.Tensor`.
 
         Args:
-            top_left_corner (Coordinates): Top-left corner.
-            bottom_right_corner (Coordinates): Bottom-right corner.
-            device (torch.device): PyTorch device.
+            boxes (BoxesTensorType): Bounding box of shape (4).
 
         Returns:
-            FourCornersCoordinates: All corners coordinates.
+            Tuple[CoordTensorType, CoordTensorType, CoordTensorType, CoordTensorType,]: Tuple of coordinates.
         """
-        return (
-            top_left_corner,
-            Coordinates(bottom_right_corner.x, top_left_corner.y, device),
-            bottom_right_corner,
-            Coordinates(top_left_corner.x, bottom_right_corner.y, device),
-        )
+        x_1, x_2, x_3, x_4 = boxes.unsqueeze(0).unbind(dim=1)
+        return x_1, x_2, x_3, x_4
 
-    @staticmethod
-    def __compute_size_from_two_corners(
-        top_left_corner: Coordinates,
-        bottom_right_corner: Coordinates,
-        device: torch.device,
-    ) -> Size:
-        """Generate size from two corners.
+    def __convert_to(
+        self, box_format: BoxFormat, dtype: torch.dtype | None
+    ) -> BoxesTensorType:
+        """Convert the packed boxes to a given format. Sizes are absolute
+        extents, so they stay positive once the origin has been flipped.
 
         Args:
-            top_left_corner (Coordinates): Top-left corner.
-            bottom_right_corner (Coordinates): Bottom-right corner.
-            device (torch.device): PyTorch device.
+            box_format (BoxFormat): Output format.
+            dtype (torch.dtype | None): Output dtype.
 
         Returns:
-            size (Size): Size of BBoxes.
+            BoxesTensorType: boxes of size (n, 4) in `box_format`.
         """
-        return Size(
-            bottom_right_corner.x - top_left_corner.x,
-            bottom_right_corner.y - top_left_corner.y,
-            device,
+        return self._get_cached(
+            ("boxes", box_format, dtype),
+            lambda: self.__compute_boxes(box_format, dtype),
         )
 
-    @staticmethod
-    def __compute_center_from_corners(
-        corners_coordinates: FourCornersCoordinates, device: torch.device
-    ) -> Coordinates:
-        """Generate center coordinates given corners coordinates.
+    def __compute_boxes(
+        self, box_format: BoxFormat, dtype: torch.dtype | None
+    ) -> BoxesTensorType:
+        """Compute the packed boxes in a given format.
 
         Args:
-            corners_coordinates (FourCornersCoordinates): All corners coordinates.
-            device (torch.device): PyTorch device.
+            box_format (BoxFormat): Output format.
+            dtype (torch.dtype | None): Output dtype.
 
         Returns:
-            Coordinates: Center coordinates.
+            BoxesTensorType: boxes of size (n, 4) in `box_format`.
         """
-        c_1, c_2, c_3, c_4 = corners_coordinates
-        x_c = (c_1.x + c_2.x) / 2
-        y_c = (c_1.y + c_3.y) / 2
-        return Coordinates(x_c, y_c, device)
+        boxes = convert_boxes(self._boxes, BoxFormat.TWO_CORNERS, box_format, dtype)
+        if box_format != BoxFormat.TWO_CORNERS:
+            boxes[:, 2:].abs_()
+        return boxes
 
     @classmethod
     def from_center(
-        cls, boxes: BoxesTensorType, origin: Origin = Origin.TOP_LEFT
+        cls,
+        boxes: BoxesTensorType,
+        origin: Origin = Origin.TOP_LEFT,
+        dtype: torch.dtype | None = None,
     ) -> TorchBoxes:
         """Generate Boxes from torch.Tensor containing center coordinates and
         size.
 
         Args:
-            boxes (torch.Tensor) : boxes of size (n, 4),
+            boxes (torch.Tensor | NDArray | Array | Tensor) : boxes of size (n, 4),
                 containing the (x_c, y_c, w, h) for all boxes
             origin (Origin): default is `top-left`
+            dtype (torch.dtype | None): storage dtype, such as `torch.float16` or
+                `torch.int32`, integer boxes are rounded to the nearest integer. The
+                dtype of floating point boxes and the default floating point dtype
+                for integer boxes if None.
 
         Returns:
             Boxes : object of class Boxes.
         """
-        x_c, y_c, w, h = TorchBoxes.__extract_coordinates_from_tensors(boxes)
-        device = boxes.device
-        center_coordinates = Coordinates(x_c, y_c, device)
-        size = Size(w, h, device)
-        corners_coordinates = TorchBoxes.__compute_corners_from_center(
-            center_coordinates, size, device
-        )
         return cls(
-            corners_coordinates,
-            center_coordinates,
-            size,
+            convert_boxes(
+                to_torch(boxes), BoxFormat.CENTER, BoxFormat.TWO_CORNERS, dtype
+            ),
             origin,
-            device,
         )
 
     @classmethod
-    def from_top_left_corner(cls, boxes: BoxesTensorType) -> TorchBoxes:
+    def from_top_left_corner(
+        cls, boxes: BoxesTensorType, dtype: torch.dtype | None = None
+    ) -> TorchBoxes:
         """Generate Boxes from torch.Tensor containing top-left coordinates and
         size.
 
         Args:
-            boxes (torch.Tensor) : boxes of size (n, 4),
+            boxes (torch.Tensor | NDArray | Array | Tensor) : boxes of size (n, 4),
                 containing the (x_1, y_1, w, h) for all boxes
+            dtype (torch.dtype | None): storage dtype, such as `torch.float16` or
+                `torch.int32`, integer boxes are rounded to the nearest integer. The
+                dtype of floating point boxes and the default floating point dtype
+                for integer boxes if None.
 
         Returns:
             Boxes : object of class Boxes
         """
-        x_1, y_1, w, h = TorchBoxes.__extract_coordinates_from_tensors(boxes)
-        device = boxes.device
-        size = Size(w, h, device)
-        corners_coordinates = (
-            TorchBoxes.__compute_corners_from_top_left_corner_and_size(
-                Coordinates(x_1, y_1, device), size, device
-            )
-        )
-        center_coordinates = TorchBoxes.__compute_center_from_corners(
-            corners_coordinates, device
-        )
         return cls(
-            corners_coordinates,
-            center_coordinates,
-            size,
+            convert_boxes(
+                to_torch(boxes), BoxFormat.TOP_LEFT_CORNER, BoxFormat.TWO_CORNERS, dtype
+            ),
             Origin.TOP_LEFT,
-            device,
         )
 
     @classmethod
-    def from_bottom_left_corner(cls, boxes: BoxesTensorType) -> TorchBoxes:
+    def from_bottom_left_corner(
+        cls, boxes: BoxesTensorType, dtype: torch.dtype | None = None
+    ) -> TorchBoxes:
         """Generate Boxes from torch.Tensor containing bottom-left coordinates
         and size.
 
         Args:
-            boxes (torch.Tensor) : boxes of size (n, 4),
+            boxes (torch.Tensor | NDArray | Array | Tensor) : boxes of size (n, 4),
                 containing the (x_4, y_4, w, h) for all boxes
+            dtype (torch.dtype | None): storage dtype, such as `torch.float16` or
+                `torch.int32`, integer boxes are rounded to the nearest integer. The
+                dtype of floating point boxes and the default floating point dtype
+                for integer boxes if None.
 
         Returns:
             Boxes : object of class Boxes
         """
-        x_4, y_4, w, h = TorchBoxes.__extract_coordinates_from_tensors(boxes)
-        device = boxes.device
-        size = Size(w, h, device)
-        corners_coordinates = TorchBoxes.__compute_corners_from_bottom_left_corner(
-            Coordinates(x_4, y_4, device), size, device
-        )
-        center_coordinates = TorchBoxes.__compute_center_from_corners(
-            corners_coordinates, device
-        )
         return cls(
-            corners_coordinates,
-            center_coordinates,
-            size,
+            convert_boxes(
+                to_torch(boxes),
+                BoxFormat.BOTTOM_LEFT_CORNER,
+                BoxFormat.TWO_CORNERS,
+                dtype,
+            ),
             Origin.BOTTOM_LEFT,
-            device,
         )
 
     @classmethod
     def from_two_corners(
-        cls, boxes: BoxesTensorType, origin: Origin = Origin.TOP_LEFT
+        cls,
+        boxes: BoxesTensorType,
+        origin: Origin = Origin.TOP_LEFT,
+        copy: bool | None = True,
+        dtype: torch.dtype | None = None,
     ) -> TorchBoxes:
         """Generate Boxes from torch.Tensor containing top-left and bottom-
         right coordinates.
 
         Args:
-            boxes (torch.Tensor) : boxes of size (n, 4),
+            boxes (torch.Tensor | NDArray | Array | Tensor) : boxes of size (n, 4),
                 containing the (x_1, y_1, x_3, y_3) for all boxes
             origin (Origin): default is `top-left`
+            copy (bool | None): always copy `boxes` if True (default), only copy
+                them if `dtype` doesn't match or if they are immutable JAX or
+                Tensorflow arrays if None, never copy if False. Without a copy, in
+                place methods modify the memory of `boxes`.
+            dtype (torch.dtype | None): storage dtype, such as `torch.float16` or
+                `torch.int32`, integer boxes are rounded to the nearest integer. The
+                dtype of floating point boxes and the default floating point dtype
+                for integer boxes if None.
+
+        Raises:
+            ValueError: Raised if `copy` is False and the boxes don't have the
+                storage dtype or are immutable.
 
         Returns:
             Boxes : object of class Boxes
         """
-        x_1, y_1, x_3, y_3 = TorchBoxes.__extract_coordinates_from_tensors(boxes)
-        device = boxes.device
-        c_1, c_3 = Coordinates(x_1, y_1, device), Coordinates(x_3, y_3, device)
-        size = TorchBoxes.__compute_size_from_two_corners(c_1, c_3, device)
-        corners_coordinates = TorchBoxes.__compute_corners_from_two_corners(
-            c_1, c_3, device
-        )
-        center_coordinates = TorchBoxes.__compute_center_from_corners(
-            corners_coordinates, device
-        )
-        return cls(
-            corners_coordinates,
-            center_coordinates,
-            size,
-            origin,
-            device,
-        )
+        immutable = is_immutable(boxes)
+        boxes = to_torch(boxes)
+        if dtype is None:
+            dtype = (
+                boxes.dtype if boxes.is_floating_point() else torch.get_default_dtype()
+            )
+        if copy or immutable or boxes.dtype != dtype:
+            if copy is False:
+                raise ValueError(
+                    "Unable to avoid a copy: boxes must be mutable and of dtype"
+                    f" {dtype}."
+                )
+            boxes = convert_boxes(
+                boxes, BoxFormat.TWO_CORNERS, BoxFormat.TWO_CORNERS, dtype
+            )
+        return cls(boxes, origin)
 
-    def to_center(self):
+    def to_center(self, dtype: torch.dtype | None = None):
         """Generate boxes (inplace method) : boxes of size (n, 4),
         containing the (x_c, y_c, w, h) for all boxes.
 
+        Args:
+            dtype (torch.dtype | None): dtype of `boxes_`, rounded to the nearest
+                integer for integer dtypes. The storage dtype for floating point
+                Boxes and the default floating point dtype for integer Boxes if None.
+
         Returns:
             self
         """
-        self.boxes_ = torch.stack(
-            [
-                self.center_coordinates.x,
-                self.center_coordinates.y,
-                self.size.w,
-                self.size.h,
-            ],
-            dim=1,
-        ).to(self.device)
+        self.boxes_ = self.__convert_to(BoxFormat.CENTER, dtype)
         return self
 
-    def to_top_left_corner(self):
+    def to_top_left_corner(self, dtype: torch.dtype | None = None):
         """Generate boxes (inplace method) : boxes of size (n, 4),
         containing the (x_1, y_1, w, h) for all boxes.
 
+        Args:
+            dtype (torch.dtype | None): dtype of `boxes_`, rounded to the nearest
+                integer for integer dtypes. The storage dtype for floating point
+                Boxes and the default floating point dtype for integer Boxes if None.
+
         Returns:
             self
         """
-        self.boxes_ = torch.stack(
-            [
-                self.corners_coordinates[0].x,
-                self.corners_coordinates[0].y,
-                self.size.w,
-                self.size.h,
-            ],
-            dim=1,
-        ).to(self.device)
+        self.boxes_ = self.__convert_to(BoxFormat.TOP_LEFT_CORNER, dtype)
         return self
 
-    def to_bottom_left_corner(self):
+    def to_bottom_left_corner(self, dtype: torch.dtype | None = None):
         """Generate boxes (inplace method): boxes of size (n, 4), containing
         the (x_4, y_4, w, h) for all boxes.
 
+        Args:
+            dtype (torch.dtype | None): dtype of `boxes_`, rounded to the nearest
+                integer for integer dtypes. The storage dtype for floating point
+                Boxes and the default floating point dtype for integer Boxes if None.
+
         Returns:
             self
         """
-        self.boxes_ = torch.stack(
-            [
-                self.corners_coordinates[3].x,
-                self.corners_coordinates[3].y,
-                self.size.w,
-                self.size.h,
-            ],
-            dim=1,
-        ).to(self.device)
+        self.boxes_ = self.__convert_to(BoxFormat.BOTTOM_LEFT_CORNER, dtype)
         return self
 
-    def to_two_corners(self):
+    def to_two_corners(self, dtype: torch.dtype | None = None):
         """Generate boxes (inplace method) : boxes of size (n, 4), containing the (x_1, y_1, x_3, y_3) for all boxes.
 
+        Args:
+            dtype (torch.dtype | None): dtype of `boxes_`, rounded to the nearest
+                integer for integer dtypes. The storage dtype for floating point
+                Boxes and the default floating point dtype for integer Boxes if None.
+
         Returns:
             self
         """
-        self.boxes_ = torch.stack(
-            [
-                self.corners_coordinates[0].x,
-                self.corners_coordinates[0].y,
-                self.corners_coordinates[2].x,
-                self.corners_coordinates[2].y,
-            ],
-            dim=1,
-        ).to(self.device)
+        self.boxes_ = self.__convert_to(BoxFormat.TWO_CORNERS, dtype)
         return self
 
-    def square(self):
-        """Pad the box so that they become squares. Works in place.
+    def square(self, out: BoxesTensorType | None = None):
+        """Pad the box so that they become squares. Works in place, without
+        allocating new packed boxes.
+
+        Args:
+            out (BoxesTensorType | None): preallocated tensor of the size and dtype
+                of the packed boxes receiving the squared boxes, the Boxes are left
+                unchanged. Work in place if None.
 
         Returns:
-            self
+            self, or new Boxes holding `out`.
         """
-        self.size, self.corners_coordinates = self.squared()
-        return self
+        square_boxes(self._boxes, out=self._get_out(out))
+        return self._updated(out)
 
     def squared(self) -> tuple[Size, FourCornersCoordinates]:
         """Pad the box so that they become squares.
@@ -526,80 +646,355 @@ class TorchBoxes:
             size : Size of the Boxes.
             Boxes : A different Boxes object containing the squared boxes.
         """
-        max_w_h, _ = torch.stack((self.size.w, self.size.h)).max(dim=0)
-        size = Size(max_w_h, max_w_h, self.device)
-        return size, TorchBoxes.__compute_corners_from_center(
-            self.center_coordinates, size, self.device
-        )
+        squared = TorchBoxes(square_boxes(self._boxes), self._origin)
+        return squared.size, squared.corners_coordinates
+
+    def __check_mask_dimensions(self, width: int, height: int):
+        """Check that a mask is large enough to hold the Boxes.
+
+        Args:
+            width (int) : desired mask width
+            height (int) : desired mask height
+
+        Raises:
+            ValueError: Raised if the mask is smaller than a box.
+        """
+        size = self.size
+        if len(self) and (width < size.w.min() or height < size.h.min()):
+            raise ValueError("`width` or `height` must be higher than boxes.")
 
-    def get_binary_mask(self, width: int, height: int) -> MaskTensorType:
+    def get_binary_mask(
+        self,
+        width: int,
+        height: int,
+        merge: bool = False,
+        image_indices: CoordTensorType | None = None,
+        num_images: int | None = None,
+        dtype: torch.dtype = torch.uint8,
+    ) -> MaskTensorType:
         """Build a mask to hide the parts of the image inside the bounding
         boxes.
 
         Args:
             width (int) : desired mask width
             height (int) : desired mask height
+            merge (bool) : return the union of the masks instead of one mask per box
+            image_indices (CoordTensorType | None) : index of the image of every box,
+                used with `merge` to build one union mask per image
+            num_images (int | None) : number of images, inferred from
+                `image_indices` if None
+            dtype (torch.dtype) : dtype of the mask, default is `torch.uint8`
         Returns:
             torch.Tensor : binary tensor or binary array, containing the mask
-                (has ones everywhere, with zeroes inside the bounding boxes), size (n_boxes, height, width)
+                (has ones everywhere, with zeroes inside the bounding boxes), size (n_boxes, height, width),
+                (height, width) if `merge` or (num_images, height, width) if `merge` with `image_indices`
         """
-        if width < self.size.w.min() or height < self.size.h.min():
-            raise ValueError("`width` or `height` must be higher than boxes.")
+        self.__check_mask_dimensions(width, height)
+        if not merge:
+            return build_binary_masks(self._boxes, width, height, dtype)
+        masks = build_union_binary_masks(
+            self._boxes, width, height, image_indices, num_images, dtype
+        )
+        return masks[0] if image_indices is None else masks
+
+    def get_lazy_binary_mask(self, width: int, height: int) -> LazyBinaryMasks:
+        """Build masks to hide the parts of the image inside the bounding boxes
+        without materializing them. The masks can be converted to a dense
+        tensor, optionally cropped to a sub-window, to COCO run-length
+        encoding or to per-row spans.
+
+        Args:
+            width (int) : desired mask width
+            height (int) : desired mask height
+        Returns:
+            LazyBinaryMasks : masks with ones everywhere and zeroes inside the bounding boxes
+        """
+        self.__check_mask_dimensions(width, height)
+        return LazyBinaryMasks.from_boxes(self._boxes, width, height)
+
+    def crop_from(
+        self,
+        image: ImageTensorType | BatchImageTensorType,
+        output_size: int | tuple[int, int],
+        offsets: Sequence[int] | None = None,
+        sampling_ratio: int = 1,
+    ) -> BatchImageTensorType:
+        """Crop the Boxes out of an image, or a batch of images, and resize the
+        crops to a fixed size by bilinear interpolation, as `roi_align`. All
+        crops are sampled at once, without a loop over the boxes.
+
+        Args:
+            image (ImageTensorType | BatchImageTensorType): image of size (channel,
+                height, width), or batch of images of size (num_images, channel,
+                height, width).
+            output_size (int | tuple[int, int]): (height, width) of the crops, or
+                side of square crops.
+            offsets (Sequence[int] | None): position of the first box of every image
+                in the Boxes, followed by the number of Boxes, for a batch of
+                images. All Boxes belong to the first image if None.
+            sampling_ratio (int): number of bilinear samples averaged per output
+                pixel along each axis, default is 1.
+
+        Returns:
+            BatchImageTensorType: crops of size (n, channel, *output_size), with the
+                dtype of floating point images, the default floating point dtype for
+                integer images.
+        """
+        if isinstance(output_size, int):
+            output_size = (output_size, output_size)
+        images = image if image.ndim == 4 else image.unsqueeze(0)
+        boxes = self._boxes
+        if self._origin == Origin.BOTTOM_LEFT:
+            boxes = flip_boxes(boxes, images.shape[2])
+        return crop_and_resize(images, boxes, output_size, offsets, sampling_ratio)
+
+    def iou(
+        self,
+        other: TorchBoxes,
+        pairwise: bool = True,
+        chunk_size: int | None = None,
+    ) -> OverlapsTensorType:
+        """Compute the intersection over union with other Boxes.
+
+        Args:
+            other (TorchBoxes): Boxes to compare with.
+            pairwise (bool): compare every pair of boxes if True, else compare
+                boxes with the same index.
+            chunk_size (int | None): number of boxes processed at once in pairwise
+                mode, to bound memory usage.
+
+        Returns:
+            OverlapsTensorType: tensor of size (n, m) in pairwise mode, else (n).
+        """
+        return compute_overlaps(
+            self._boxes, other._boxes, OverlapMetric.IOU, pairwise, chunk_size
+        )
+
+    def giou(
+        self,
+        other: TorchBoxes,
+        pairwise: bool = True,
+        chunk_size: int | None = None,
+    ) -> OverlapsTensorType:
+        """Compute the generalized intersection over union with other Boxes.
+
+        Args:
+            other (TorchBoxes): Boxes to compare with.
+            pairwise (bool): compare every pair of boxes if True, else compare
+                boxes with the same index.
+            chunk_size (int | None): number of boxes processed at once in pairwise
+                mode, to bound memory usage.
+
+        Returns:
+            OverlapsTensorType: tensor of size (n, m) in pairwise mode, else (n).
+        """
+        return compute_overlaps(
+            self._boxes, other._boxes, OverlapMetric.GIOU, pairwise, chunk_size
+        )
+
+    def diou(
+        self,
+        other: TorchBoxes,
+        pairwise: bool = True,
+        chunk_size: int | None = None,
+    ) -> OverlapsTensorType:
+        """Compute the distance intersection over union with other Boxes.
+
+        Args:
+            other (TorchBoxes): Boxes to compare with.
+            pairwise (bool): compare every pair of boxes if True, else compare
+                boxes with the same index.
+            chunk_size (int | None): number of boxes processed at once in pairwise
+                mode, to bound memory usage.
+
+        Returns:
+            OverlapsTensorType: tensor of size (n, m) in pairwise mode, else (n).
+        """
+        return compute_overlaps(
+            self._boxes, other._boxes, OverlapMetric.DIOU, pairwise, chunk_size
+        )
+
+    def ciou(
+        self,
+        other: TorchBoxes,
+        pairwise: bool = True,
+        chunk_size: int | None = None,
+    ) -> OverlapsTensorType:
+        """Compute the complete intersection over union with other Boxes.
+
+        Args:
+            other (TorchBoxes): Boxes to compare with.
+            pairwise (bool): compare every pair of boxes if True, else compare
+                boxes with the same index.
+            chunk_size (int | None): number of boxes processed at once in pairwise
+                mode, to bound memory usage.
+
+        Returns:
+            OverlapsTensorType: tensor of size (n, m) in pairwise mode, else (n).
+        """
+        return compute_overlaps(
+            self._boxes, other._boxes, OverlapMetric.CIOU, pairwise, chunk_size
+        )
+
+    def nms(
+        self,
+        scores: CoordTensorType,
+        iou_threshold: float = 0.5,
+        classes: CoordTensorType | None = None,
+        top_k: int | None = None,
+    ) -> CoordTensorType:
+        """Perform non-maximum suppression on the Boxes.
+
+        Args:
+            scores (CoordTensorType): scores of size (n).
+            iou_threshold (float): boxes overlapping a better box with an IoU
+                higher than this threshold are discarded.
+            classes (CoordTensorType | None): classes of size (n), boxes of
+                different classes never suppress each other.
+            top_k (int | None): number of best boxes kept before suppression.
+
+        Returns:
+            CoordTensorType: indices of the kept boxes, sorted by decreasing score.
+        """
+        return nms(self._boxes, scores, iou_threshold, classes, top_k)
+
+    def soft_nms(
+        self,
+        scores: CoordTensorType,
+        sigma: float = 0.5,
+        method: SoftNMSMethod | str = SoftNMSMethod.GAUSSIAN,
+        iou_threshold: float = 0.3,
+        score_threshold: float = 1e-3,
+        classes: CoordTensorType | None = None,
+        top_k: int | None = None,
+    ) -> tuple[CoordTensorType, CoordTensorType]:
+        """Perform soft non-maximum suppression on the Boxes.
 
-        masks = torch.ones(len(self), height, width, device=self.device)
+        Args:
+            scores (CoordTensorType): scores of size (n).
+            sigma (float): spread of the gaussian decay.
+            method (SoftNMSMethod | str): `linear` or `gaussian` decay.
+            iou_threshold (float): IoU above which scores are decayed with the
+                linear decay.
+            score_threshold (float): boxes whose score falls below this threshold
+                are discarded.
+            classes (CoordTensorType | None): classes of size (n), boxes of
+                different classes never decay each other.
+            top_k (int | None): number of best boxes kept before suppression.
+
+        Returns:
+            tuple[CoordTensorType, CoordTensorType]: indices of the kept boxes and
+                their decayed scores, sorted by decreasing decayed score.
+        """
+        return soft_nms(
+            self._boxes,
+            scores,
+            sigma,
+            method,
+            iou_threshold,
+            score_threshold,
+            classes,
+            top_k,
+        )
+
+    def build_spatial_index(self, cell_size: float | None = None) -> GridIndex:
+        """Build a spatial index over the Boxes, to query the boxes intersecting
+        a window, containing a point or nearest to a point. The index follows
+        the in place mutations of the Boxes and is rebuilt on the next query.
+
+        Args:
+            cell_size (float | None): side of the cells of the grid, inferred from
+                the size of the boxes if None.
+
+        Returns:
+            GridIndex: spatial index over the Boxes.
+        """
+        return GridIndex(self, cell_size).build()
+
+    def __compute_lists(self) -> dict[str, list[int | float]]:
+        """Convert the corners, centers and sizes of the Boxes to Python lists,
+        with one device synchronization per tensor.
 
-        for i, mask in enumerate(masks):
-            y_1 = int(self.corners_coordinates[0].y[i].to(torch.int).item())
-            y_3 = int(self.corners_coordinates[2].y[i].to(torch.int).item())
-            x_1 = int(self.corners_coordinates[0].x[i].to(torch.int).item())
-            x_3 = int(self.corners_coordinates[2].x[i].to(torch.int).item())
-            mask[
-                y_1:y_3,
-                x_1:x_3,
-            ] = 0
-        return masks.to(torch.int)
+        Returns:
+            dict[str, list[int | float]]: Lists of coordinates, keyed by name.
+        """
+        x_1, y_1, x_3, y_3 = self._boxes.T.tolist()
+        x_c, y_c = box_centers(self._boxes).T.tolist()
+        w, h = box_sizes(self._boxes).T.tolist()
+        return {
+            "x_1": x_1,
+            "y_1": y_1,
+            "x_3": x_3,
+            "y_3": y_3,
+            "x_c": x_c,
+            "y_c": y_c,
+            "w": w,
+            "h": h,
+        }
 
     @property
     def as_dict(self) -> dict[str, dict[str, list[int | float]]]:
-        """Return boxes' data as dictionnary.
+        """Return boxes' data as dictionnary. The dictionnary is cached until
+        the Boxes are modified.
 
         Returns:
             dict[str, dict[str, torch.Tensor]]: dict containing coordinates and size of Boxes.
         """
-        return {
-            "1": self.corners_coordinates[0].to_dict(),
-            "2": self.corners_coordinates[1].to_dict(),
-            "3": self.corners_coordinates[2].to_dict(),
-            "4": self.corners_coordinates[3].to_dict(),
-            "c": self.center_coordinates.to_dict(),
-            "size": self.size.to_dict(),
-        }
+        lists = self._get_cached("lists", self.__compute_lists)
+        return self._get_cached(
+            "dict",
+            lambda: {
+                "1": {"x": lists["x_1"], "y": lists["y_1"]},
+                "2": {"x": lists["x_3"], "y": lists["y_1"]},
+                "3": {"x": lists["x_3"], "y": lists["y_3"]},
+                "4": {"x": lists["x_1"], "y": lists["y_3"]},
+                "c": {"x": lists["x_c"], "y": lists["y_c"]},
+                "size": {"w": lists["w"], "h": lists["h"]},
+            },
+        )
 
     @property
     def as_tuple(self):
-        """Return boxes' data as tuple.
+        """Return boxes' data as tuple. The tuple is cached until the Boxes are
+        modified.
 
         Returns:
             tuple[CoordTensorType]: tuple containing coordinates and size of Boxes.
         """
-        return (
-            self.corners_coordinates[0].x.tolist(),
-            self.corners_coordinates[0].y.tolist(),
-            self.corners_coordinates[1].x.tolist(),
-            self.corners_coordinates[1].y.tolist(),
-            self.corners_coordinates[2].x.tolist(),
-            self.corners_coordinates[2].y.tolist(),
-            self.corners_coordinates[3].x.tolist(),
-            self.corners_coordinates[3].y.tolist(),
-            self.center_coordinates.x.tolist(),
-            self.center_coordinates.y.tolist(),
-            self.size.w.tolist(),
-            self.size.h.tolist(),
+        lists = self._get_cached("lists", self.__compute_lists)
+        return self._get_cached(
+            "tuple",
+            lambda: tuple(
+                lists[name]
+                for name in (
+                    "x_1",
+                    "y_1",
+                    "x_3",
+                    "y_1",
+                    "x_3",
+                    "y_3",
+                    "x_1",
+                    "y_3",
+                    "x_c",
+                    "y_c",
+                    "w",
+                    "h",
+                )
+            ),
         )
 
-    @property
-    def as_numpy(self) -> NDArray:
-        """Return boxes' data as `np.ndarray`.
+    def get_numpy(
+        self, copy: bool | None = None, dtype: torch.dtype | None = torch.float
+    ) -> NDArray:
+        """Return boxes' data as `np.ndarray`. An array sharing the memory of
+        `boxes_` is read-only, as `boxes_` is cached.
+
+        Args:
+            copy (bool | None): always copy if True, share the memory of the boxes
+                when they are contiguous, of dtype `dtype` and on CPU if None, never
+                copy if False.
+            dtype (torch.dtype | None): dtype of the export, default is float32. The
+                dtype of `boxes_` if None.
 
         Raises:
             MissingToMethodError: Raised if no `to` methods has been run.
@@ -608,13 +1003,25 @@ class TorchBoxes:
             NDArray: Return boxes as Numpy array.
         """
         if hasattr(self, "boxes_"):
-            return self.boxes_.to(torch.float).detach().cpu().numpy()
+            boxes = prepare_export(self.boxes_, dtype, copy=copy)
+            array = boxes.numpy()
+            if boxes.data_ptr() == self.boxes_.data_ptr():
+                array.flags.writeable = False
+            return array
         else:
             raise MissingToMethodError
 
-    @property
-    def as_array(self) -> Array:
-        """Return boxes' data as JAX's `Array`.
+    def get_array(
+        self, copy: bool | None = None, dtype: torch.dtype | None = torch.float
+    ) -> Array:
+        """Return boxes' data as JAX's `Array`, through DLPack.
+
+        Args:
+            copy (bool | None): always copy if True, share the memory of the boxes
+                when they are contiguous, of dtype `dtype` and on CPU if None, never
+                copy if False.
+            dtype (torch.dtype | None): dtype of the export, default is float32. The
+                dtype of `boxes_` if None.
 
         Raises:
             OptionalDependencyImportError: Raised if JAX is missing.
@@ -624,39 +1031,104 @@ class TorchBoxes:
             Array: Return boxes as JAX array.
         """
         if hasattr(self, "boxes_"):
-            try:
-                import jax.numpy as jnp
-            except ModuleNotFoundError:
-                raise OptionalDependencyImportError("jax")
-
-            return jnp.array(self.boxes_.to(torch.float).detach().cpu())
+            return to_jax(self.boxes_, copy, dtype)
         else:
             raise MissingToMethodError
 
-    @property
-    def as_tf_tensor(self) -> Tensor:
-        """Return boxes' data as Tensorflow's `Tensor`.
+    def get_tf_tensor(
+        self, copy: bool | None = None, dtype: torch.dtype | None = torch.float
+    ) -> Tensor:
+        """Return boxes' data as Tensorflow's `Tensor`, through DLPack.
+
+        Args:
+            copy (bool | None): always copy if True, share the memory of the boxes
+                when they are contiguous, of dtype `dtype` and on CPU if None, never
+                copy if False.
+            dtype (torch.dtype | None): dtype of the export, default is float32. The
+                dtype of `boxes_` if None.
 
         Raises:
             OptionalDependencyImportError: Raised if Tensorflow is missing.
             MissingToMethodError: Raised if no `to` methods has been run.
 
         Returns:
-            Array: Return boxes as Tensorflow tensor.
+            Tensor: Return boxes as Tensorflow tensor.
         """
         if hasattr(self, "boxes_"):
-            try:
-                import tensorflow as tf
-            except ModuleNotFoundError:
-                raise OptionalDependencyImportError("tensorflow")
+            return to_tf(self.boxes_, copy, dtype)
+        else:
+            raise MissingToMethodError
+
+    def get_tensor(
+        self, copy: bool | None = None, dtype: torch.dtype | None = torch.float
+    ) -> BoxesTensorType:
+        """Return boxes' data as `torch.Tensor`, on the device of the
+        Boxes. Without a copy, the tensor is the cached `boxes_`, so it must not
+        be modified in place, pass `copy=True` to get a tensor to modify.
+
+        Args:
+            copy (bool | None): always copy if True, return the boxes themselves
+                when they are contiguous and of dtype `dtype` if None, never copy if
+                False.
+            dtype (torch.dtype | None): dtype of the export, default is float32. The
+                dtype of `boxes_` if None.
+
+        Raises:
+            MissingToMethodError: Raised if no `to` methods has been run.
 
-            return tf.convert_to_tensor(self.boxes_.to(torch.float).detach().cpu())
+        Returns:
+            BoxesTensorType: Return boxes as PyTorch tensor.
+        """
+        if hasattr(self, "boxes_"):
+            return prepare_export(self.boxes_, dtype, self.device, copy)
         else:
             raise MissingToMethodError
 
+    @property
+    def as_numpy(self) -> NDArray:
+        """Return boxes' data as `np.ndarray`, sharing memory with the boxes
+        when possible, in which case the array is read-only.
+
+        Raises:
+            MissingToMethodError: Raised if no `to` methods has been run.
+
+        Returns:
+            NDArray: Return boxes as Numpy array.
+        """
+        return self.get_numpy()
+
+    @property
+    def as_array(self) -> Array:
+        """Return boxes' data as JAX's `Array`, sharing memory with the boxes
+        when possible.
+
+        Raises:
+            OptionalDependencyImportError: Raised if JAX is missing.
+            MissingToMethodError: Raised if no `to` methods has been run.
+
+        Returns:
+            Array: Return boxes as JAX array.
+        """
+        return self.get_array()
+
+    @property
+    def as_tf_tensor(self) -> Tensor:
+        """Return boxes' data as Tensorflow's `Tensor`, sharing memory with the
+        boxes when possible.
+
+        Raises:
+            OptionalDependencyImportError: Raised if Tensorflow is missing.
+            MissingToMethodError: Raised if no `to` methods has been run.
+
+        Returns:
+            Array: Return boxes as Tensorflow tensor.
+        """
+        return self.get_tf_tensor()
+
     @property
     def as_tensor(self) -> BoxesTensorType:
-        """Return boxes' data as `torch.Tensor`.
+        """Return boxes' data as `torch.Tensor`. It is the cached `boxes_`
+        when possible, so it must not be modified in place.
 
         Raises:
             MissingToMethodError: Raised if no `to` methods has been run.
@@ -664,7 +1136,4 @@ class TorchBoxes:
         Returns:
             BboxesTensor: Return bboxes as PyTorch tensor.
         """
-        if hasattr(self, "boxes_"):
-            return self.boxes_.to(torch.float)
-        else:
-            raise MissingToMethodError
+        return self.get_tensor()
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Sequence
+
+import torch
+from torch.nn.functional import avg_pool2d, grid_sample
+
+if TYPE_CHECKING:
+    from ._typing import BatchImageTensorType, BoxesTensorType, CoordTensorType
+
+
+def _get_samples(
+    starts: CoordTensorType, ends: CoordTensorType, num_samples: int, length: int
+) -> CoordTensorType:
+    """Return evenly spaced samples along an axis of the boxes, normalized
+    for `grid_sample`.
+
+    Samples are at the centers of `num_samples` equal bins of every box. Pixel
+    `i` covers [i, i + 1), so that the normalized coordinates are -1 and 1 at the
+    borders of the image with `align_corners=False`.
+
+    Args:
+        starts (CoordTensorType): lower coordinates of the boxes along the axis.
+        ends (CoordTensorType): upper coordinates of the boxes along the axis.
+        num_samples (int): number of samples per box.
+        length (int): number of pixels of the image along the axis.
+
+    Returns:
+        CoordTensorType: normalized coordinates of size (n, num_samples).
+    """
+    steps = torch.arange(num_samples, dtype=starts.dtype, device=starts.device)
+    steps = steps.add_(0.5).div_(num_samples)
+    samples = torch.addcmul(starts[:, None], (ends - starts)[:, None], steps)
+    return samples.mul_(2 / length).sub_(1)
+
+
+def crop_and_resize(
+    images: BatchImageTensorType,
+    boxes: BoxesTensorType,
+    output_size: tuple[int, int],
+    offsets: Sequence[int] | None = None,
+    sampling_ratio: int = 1,
+) -> BatchImageTensorType:
+    """Crop the boxes out of images and resize the crops to a fixed size, by
+    bilinear interpolation as `roi_align`. The sampling grids of all boxes are
+    laid out in a grid per image, so that a single `grid_sample` call gathers
+    all crops, the images being neither cropped nor repeated per box.
+
+    Every output pixel is the mean of `sampling_ratio` x `sampling_ratio`
+    bilinear samples evenly spaced in its bin of the box, pixels outside of the
+    images being zeros.
+
+    Args:
+        images (BatchImageTensorType): images of size (num_images, channel, height,
+            width).
+        boxes (BoxesTensorType): Packed boxes of size (n, 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes, in pixels with a
+            `top-left` origin, image after image.
+        output_size (tuple[int, int]): (height, width) of the crops.
+        offsets (Sequence[int] | None): position of the first box of every image in
+            the packed boxes, followed by the number of boxes. All boxes belong to
+            the first image if None.
+        sampling_ratio (int): number of samples per output pixel along each axis,
+            default is 1.
+
+    Raises:
+        ValueError: Raised if there are more offsets than images, or if they don't
+            start at 0, decrease or don't end with the number of boxes.
+
+    Returns:
+        BatchImageTensorType: crops of size (n, channel, *output_size), with the
+            dtype of floating point images, the default floating point dtype for
+            integer images.
+    """
+    num_images, channels, height, width = images.shape
+    if offsets is None:
+        offsets = [0, len(boxes)]
+    lengths = [end - start for start, end in zip(offsets[:-1], offsets[1:])]
+    if (
+        len(offsets) > num_images + 1
+        or offsets[0] != 0
+        or offsets[-1] != len(boxes)
+        or min(lengths, default=0) < 0
+    ):
+        raise ValueError(
+            "`offsets` must contain at most an offset per image, starting at 0 and"
+            " never decreasing, followed by the number of boxes."
+        )
+    max_length = max(lengths, default=0)
+    images = images[: len(lengths)]
+    if not images.is_floating_point():
+        images = images.to(torch.get_default_dtype())
+    output_height, output_width = output_size
+    grid_height = output_height * sampling_ratio
+    grid_width = output_width * sampling_ratio
+
+    x_1, y_1, x_3, y_3 = boxes.to(images.dtype).unbind(dim=1)
+    cols = _get_samples(x_1, x_3, grid_width, width)
+    rows = _get_samples(y_1, y_3, grid_height, height)
+    # Grids of size (n, grid_height, grid_width, 2) containing the (x, y) of the
+    # samples, stacked per image and padded to the image with the most boxes.
+    grids = torch.stack(
+        [
+            cols[:, None, :].expand(-1, grid_height, -1),
+            rows[:, :, None].expand(-1, -1, grid_width),
+        ],
+        dim=-1,
+    )
+    if len(lengths) > 1:
+        image_grids = grids.new_zeros(len(lengths), max_length, *grids.shape[1:])
+        for image_grid, start, length in zip(image_grids, offsets, lengths):
+            image_grid[:length] = grids[start : start + length]
+        grids = image_grids
+    grids = grids.reshape(len(lengths), max_length * grid_height, grid_width, 2)
+
+    crops = grid_sample(images, grids, mode="bilinear", align_corners=False)
+    crops = crops.view(len(lengths), channels, max_length, grid_height, grid_width)
+    crops = crops.transpose(1, 2)
+    if len(lengths) > 1:
+        crops = torch.cat(
+            [image_crops[:length] for image_crops, length in zip(crops, lengths)]
+        )
+    else:
+        crops = crops[0]
+    if sampling_ratio > 1:
+        crops = avg_pool2d(crops, sampling_ratio)
+    return crops
@@ -0,0 +1,606 @@
+from __future__ import annotations
+
+import torch
+
+from anyboxes.implementations.box_format import BoxFormat, get_conversion_matrix
+
+# The functions of this module only take tensors, numbers and strings, so that they
+# can be compiled with `torch.jit.script` and traced by `torch.compile` without graph
+# breaks. Annotations are plain `torch.Tensor` for TorchScript, and the formats are
+# the string values of `BoxFormat`.
+
+_MATRICES: dict[
+    tuple[BoxFormat, BoxFormat, torch.dtype, torch.device], torch.Tensor
+] = {}
+
+
+@torch.jit.unused
+def _normalize_format(box_format: str) -> str:
+    """Return the string value of a box format, in eager mode.
+
+    Args:
+        box_format (str): Box format, `BoxFormat` members are accepted.
+
+    Raises:
+        ValueError: Raised if the format doesn't exist.
+
+    Returns:
+        str: Value of the box format.
+    """
+    return BoxFormat(box_format).value
+
+
+def _get_format(box_format: str) -> str:
+    """Return the string value of a box format.
+
+    Args:
+        box_format (str): Box format.
+
+    Returns:
+        str: Value of the box format.
+    """
+    if torch.jit.is_scripting():
+        return box_format
+    return _normalize_format(box_format)
+
+
+@torch.jit.unused
+def _get_default_float_dtype() -> torch.dtype:
+    """Return the default floating point dtype, in eager mode.
+
+    Returns:
+        torch.dtype: Default floating point dtype.
+    """
+    return torch.get_default_dtype()
+
+
+def _get_float_dtype(boxes: torch.Tensor) -> torch.dtype:
+    """Return the dtype of floating point boxes, the default floating point
+    dtype for integer boxes, float32 under TorchScript.
+
+    Args:
+        boxes (torch.Tensor): boxes of size (..., 4).
+
+    Returns:
+        torch.dtype: Floating point dtype.
+    """
+    if boxes.is_floating_point():
+        return boxes.dtype
+    if torch.jit.is_scripting():
+        return torch.float32
+    return _get_default_float_dtype()
+
+
+def _is_floating(dtype: torch.dtype) -> bool:
+    """Return whether a dtype is a floating point dtype.
+
+    Args:
+        dtype (torch.dtype): dtype.
+
+    Returns:
+        bool: True if `dtype` is a floating point dtype.
+    """
+    return dtype in (torch.float16, torch.bfloat16, torch.float32, torch.float64)
+
+
+def _is_wide(dtype: torch.dtype) -> bool:
+    """Return whether a dtype has values that float32 can't represent exactly,
+    and so must be computed in float64.
+
+    Args:
+        dtype (torch.dtype): dtype.
+
+    Returns:
+        bool: True for float64, int32 and int64.
+    """
+    return dtype in (torch.float64, torch.int32, torch.int64)
+
+
+def _get_compute_dtype(dtype: torch.dtype, out_dtype: torch.dtype) -> torch.dtype:
+    """Return the dtype in which boxes are computed. Half precision and integer
+    boxes are computed in floating point, so that sums of coordinates don't
+    overflow and halves of sizes aren't rounded.
+
+    Args:
+        dtype (torch.dtype): dtype of the input boxes.
+        out_dtype (torch.dtype): dtype of the output boxes.
+
+    Returns:
+        torch.dtype: float64 if any of the dtypes is float64, int32 or int64, as
+            float32 only holds integers up to 2^24 exactly, float32 otherwise.
+    """
+    if _is_wide(dtype) or _is_wide(out_dtype):
+        return torch.float64
+    return torch.float32
+
+
+def _cast(boxes: torch.Tensor, dtype: torch.dtype, copy: bool = False) -> torch.Tensor:
+    """Cast boxes to a dtype, rounding them to the nearest integer for integer
+    dtypes. Halves are rounded up rather than to even, so that the rounded size
+    of a box doesn't depend on the parity of its coordinates.
+
+    Args:
+        boxes (torch.Tensor): boxes of size (..., 4).
+        dtype (torch.dtype): Output dtype.
+        copy (bool): Always return a new tensor if True.
+
+    Returns:
+        torch.Tensor: boxes of size (..., 4) and dtype `dtype`.
+    """
+    if boxes.is_floating_point() and not _is_floating(dtype):
+        return torch.floor(boxes + 0.5).to(dtype)
+    return boxes.to(dtype, copy=copy)
+
+
+def _get_matrix(
+    in_format: BoxFormat,
+    out_format: BoxFormat,
+    dtype: torch.dtype,
+    device: torch.device,
+) -> torch.Tensor:
+    """Return the conversion matrix as a tensor, it is allocated once per format,
+    dtype and device.
+
+    Args:
+        in_format (BoxFormat): Format of the input boxes.
+        out_format (BoxFormat): Format of the output boxes.
+        dtype (torch.dtype): dtype of the matrix.
+        device (torch.device): device of the matrix.
+
+    Returns:
+        torch.Tensor: Matrix of size (4, 4).
+    """
+    key = (in_format, out_format, dtype, device)
+    if key not in _MATRICES:
+        _MATRICES[key] = torch.tensor(
+            get_conversion_matrix(in_format, out_format), dtype=dtype, device=device
+        )
+    return _MATRICES[key]
+
+
+def to_two_corners(boxes: torch.Tensor, box_format: str) -> torch.Tensor:
+    """Convert boxes from a format to the two corners format with elementwise
+    operations.
+
+    Args:
+        boxes (torch.Tensor): floating point boxes of size (..., 4) in `box_format`.
+        box_format (str): Format of the input boxes.
+
+    Raises:
+        ValueError: Raised if the format doesn't exist.
+
+    Returns:
+        torch.Tensor: New tensor of boxes of size (..., 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+    """
+    corner, size = boxes[..., :2], boxes[..., 2:]
+    if box_format == "two-corners":
+        return boxes.clone()
+    if box_format == "top-left-corner":
+        return torch.cat([corner, corner + size], dim=-1)
+    if box_format == "center":
+        half_size = size / 2
+        return torch.cat([corner - half_size, corner + half_size], dim=-1)
+    if box_format == "bottom-left-corner":
+        x_4, y_4, w, h = boxes.unbind(dim=-1)
+        return torch.stack([x_4, y_4 - h, x_4 + w, y_4], dim=-1)
+    raise ValueError("Unknown box format: " + box_format)
+
+
+def from_two_corners(boxes: torch.Tensor, box_format: str) -> torch.Tensor:
+    """Convert boxes from the two corners format to a format with elementwise
+    operations.
+
+    Args:
+        boxes (torch.Tensor): floating point boxes of size (..., 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        box_format (str): Format of the output boxes.
+
+    Raises:
+        ValueError: Raised if the format doesn't exist.
+
+    Returns:
+        torch.Tensor: New tensor of boxes of size (..., 4) in `box_format`.
+    """
+    top_left, bottom_right = boxes[..., :2], boxes[..., 2:]
+    if box_format == "two-corners":
+        return boxes.clone()
+    if box_format == "top-left-corner":
+        return torch.cat([top_left, bottom_right - top_left], dim=-1)
+    if box_format == "center":
+        return torch.cat(
+            [(top_left + bottom_right) / 2, bottom_right - top_left], dim=-1
+        )
+    if box_format == "bottom-left-corner":
+        x_1, y_1, x_3, y_3 = boxes.unbind(dim=-1)
+        return torch.stack([x_1, y_3, x_3 - x_1, y_3 - y_1], dim=-1)
+    raise ValueError("Unknown box format: " + box_format)
+
+
+@torch.jit.unused
+def _convert_boxes_eagerly(
+    boxes: torch.Tensor, in_format: str, out_format: str
+) -> torch.Tensor:
+    """Convert boxes with a single matrix multiply, which is faster than
+    elementwise operations in eager mode. Elementwise operations are used when
+    traced by `torch.compile`, as they are fused in a single kernel.
+
+    Args:
+        boxes (torch.Tensor): floating point boxes of size (..., 4) in `in_format`.
+        in_format (str): Format of the input boxes.
+        out_format (str): Format of the output boxes.
+
+    Returns:
+        torch.Tensor: New tensor of boxes of size (..., 4) in `out_format`.
+    """
+    if torch.compiler.is_compiling():
+        return from_two_corners(to_two_corners(boxes, in_format), out_format)
+    matrix = _get_matrix(
+        BoxFormat(in_format), BoxFormat(out_format), boxes.dtype, boxes.device
+    )
+    return boxes @ matrix
+
+
+def convert_boxes(
+    boxes: torch.Tensor,
+    in_format: str,
+    out_format: str,
+    dtype: torch.dtype | None = None,
+) -> torch.Tensor:
+    """Convert boxes from a format to another one, no intermediate Boxes object
+    is built. Half precision and integer boxes are converted in float32.
+
+    Args:
+        boxes (torch.Tensor): boxes of size (..., 4) in `in_format`.
+        in_format (str): Format of the input boxes, `BoxFormat` members are
+            accepted in eager mode.
+        out_format (str): Format of the output boxes, `BoxFormat` members are
+            accepted in eager mode.
+        dtype (torch.dtype | None): dtype of the output boxes, rounded to the
+            nearest integer for integer dtypes. The dtype of floating point boxes
+            and the default floating point dtype for integer boxes if None.
+
+    Raises:
+        ValueError: Raised if a format doesn't exist or if the boxes aren't of
+            size (..., 4).
+
+    Returns:
+        torch.Tensor: New tensor of boxes of size (..., 4) in `out_format`.
+    """
+    if boxes.shape[-1] != 4:
+        raise ValueError("Boxes must be of size (..., 4).")
+    in_format, out_format = _get_format(in_format), _get_format(out_format)
+    if dtype is None:
+        dtype = _get_float_dtype(boxes)
+    if in_format == out_format:
+        return _cast(boxes, dtype, copy=True)
+    boxes = boxes.to(_get_compute_dtype(boxes.dtype, dtype))
+    if torch.jit.is_scripting():
+        converted = from_two_corners(to_two_corners(boxes, in_format), out_format)
+    else:
+        converted = _convert_boxes_eagerly(boxes, in_format, out_format)
+    return _cast(converted, dtype)
+
+
+def box_centers(boxes: torch.Tensor) -> torch.Tensor:
+    """Compute the centers of packed boxes. Coordinates are summed in float32
+    for half precision and integer boxes, so that they don't overflow.
+
+    Args:
+        boxes (torch.Tensor): Packed boxes of size (..., 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+
+    Returns:
+        torch.Tensor: Centers of size (..., 2), containing the (x_c, y_c) for all boxes,
+            with the dtype of floating point boxes, float32 for integer boxes.
+    """
+    dtype = _get_float_dtype(boxes)
+    boxes = boxes.to(_get_compute_dtype(boxes.dtype, dtype))
+    return ((boxes[..., :2] + boxes[..., 2:]) / 2).to(dtype)
+
+
+def box_sizes(boxes: torch.Tensor) -> torch.Tensor:
+    """Compute the sizes of packed boxes, as absolute extents.
+
+    Args:
+        boxes (torch.Tensor): Packed boxes of size (..., 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+
+    Returns:
+        torch.Tensor: Sizes of size (..., 2), containing the (w, h) for all boxes.
+    """
+    return (boxes[..., 2:] - boxes[..., :2]).abs()
+
+
+def _prepare(
+    boxes: torch.Tensor, out: torch.Tensor | None, native: bool = False
+) -> torch.Tensor:
+    """Return the buffer in which an operation is computed in place, holding
+    the boxes. float32 and float64 boxes, and boxes of operations computed
+    natively, are computed straight in `out`, other dtypes in a buffer of the
+    compute dtype.
+
+    Args:
+        boxes (torch.Tensor): boxes of size (..., 4).
+        out (torch.Tensor | None): tensor receiving the result, may be `boxes`
+            itself. A new tensor if None.
+        native (bool): compute the operation in the dtype of the boxes if True.
+
+    Returns:
+        torch.Tensor: buffer holding the boxes.
+    """
+    if not native and boxes.dtype != torch.float32 and boxes.dtype != torch.float64:
+        return boxes.to(_get_compute_dtype(boxes.dtype, boxes.dtype))
+    if out is None:
+        return boxes.clone()
+    if not out.is_set_to(boxes):
+        out.copy_(boxes)
+    return out
+
+
+def _finish(
+    result: torch.Tensor, dtype: torch.dtype, out: torch.Tensor | None
+) -> torch.Tensor:
+    """Return the result of an operation computed in the buffer of `_prepare`,
+    cast back to the dtype of the boxes.
+
+    Args:
+        result (torch.Tensor): buffer returned by `_prepare`.
+        dtype (torch.dtype): dtype of the boxes.
+        out (torch.Tensor | None): tensor receiving the result, a new tensor if None.
+
+    Returns:
+        torch.Tensor: `out` if given, a new tensor otherwise.
+    """
+    if result.dtype == dtype:
+        return result
+    result = _cast(result, dtype)
+    if out is None:
+        return result
+    return out.copy_(result)
+
+
+def _is_integral(boxes: torch.Tensor, value: float | torch.Tensor) -> bool:
+    """Return whether an operation between integer boxes and a value can be
+    computed exactly in the dtype of the boxes.
+
+    Args:
+        boxes (torch.Tensor): boxes of size (..., 4).
+        value (float | torch.Tensor): number, or tensor of size (...).
+
+    Returns:
+        bool: True if the boxes are integers and the value is an integer, or a
+            tensor of integers.
+    """
+    if boxes.is_floating_point():
+        return False
+    if isinstance(value, torch.Tensor):
+        return not value.is_floating_point()
+    return isinstance(value, int)
+
+
+def _expand(value: torch.Tensor, values: torch.Tensor) -> torch.Tensor:
+    """Prepare a tensor of one value per box to be broadcast over an axis of
+    the packed boxes.
+
+    Args:
+        value (torch.Tensor): values of size (...).
+        values (torch.Tensor): coordinates of an axis, of size (..., 2).
+
+    Returns:
+        torch.Tensor: values of size (..., 1) and the dtype of `values`.
+    """
+    return value.to(values.dtype).unsqueeze(-1)
+
+
+def _add_(values: torch.Tensor, other: float | torch.Tensor) -> torch.Tensor:
+    """Add a number or a value per box to the coordinates of an axis, in
+    place.
+
+    Args:
+        values (torch.Tensor): coordinates of an axis, of size (..., 2).
+        other (float | torch.Tensor): number, or tensor of size (...).
+
+    Returns:
+        torch.Tensor: `values`.
+    """
+    if isinstance(other, torch.Tensor):
+        return values.add_(_expand(other, values))
+    return values.add_(other)
+
+
+def _mul_(values: torch.Tensor, other: float | torch.Tensor) -> torch.Tensor:
+    """Multiply the coordinates of an axis by a number or a value per box, in
+    place.
+
+    Args:
+        values (torch.Tensor): coordinates of an axis, of size (..., 2).
+        other (float | torch.Tensor): number, or tensor of size (...).
+
+    Returns:
+        torch.Tensor: `values`.
+    """
+    if isinstance(other, torch.Tensor):
+        return values.mul_(_expand(other, values))
+    return values.mul_(other)
+
+
+def _clamp_max_(values: torch.Tensor, upper: float | torch.Tensor) -> torch.Tensor:
+    """Clamp the coordinates of an axis to an upper bound, in place.
+
+    Args:
+        values (torch.Tensor): coordinates of an axis, of size (..., 2).
+        upper (float | torch.Tensor): number, or tensor of size (...).
+
+    Returns:
+        torch.Tensor: `values`.
+    """
+    if isinstance(upper, torch.Tensor):
+        return torch.minimum(values, _expand(upper, values), out=values)
+    return values.clamp_(max=upper)
+
+
+def square_boxes(boxes: torch.Tensor, out: torch.Tensor | None = None) -> torch.Tensor:
+    """Pad packed boxes so that they become squares, around the same center.
+    Integer boxes are rounded to the nearest integer.
+
+    Args:
+        boxes (torch.Tensor): Packed boxes of size (..., 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        out (torch.Tensor | None): tensor of the size and dtype of `boxes`
+            receiving the result, may be `boxes` itself.
+
+    Returns:
+        torch.Tensor: `out`, or a new tensor of packed boxes of size (..., 4) with
+            the dtype of `boxes` if None.
+    """
+    result = _prepare(boxes, out)
+    top_left, bottom_right = result[..., :2], result[..., 2:]
+    # Twice the centers and the largest sides, so that no intermediate is halved.
+    centers = top_left + bottom_right
+    sides = (bottom_right - top_left).abs_().amax(dim=-1, keepdim=True)
+    top_left.copy_(centers).sub_(sides)
+    bottom_right.copy_(centers).add_(sides)
+    return _finish(result.div_(2), boxes.dtype, out)
+
+
+def flip_boxes(
+    boxes: torch.Tensor,
+    height: float | torch.Tensor,
+    out: torch.Tensor | None = None,
+) -> torch.Tensor:
+    """Flip the y axis of packed boxes given an image height.
+
+    Args:
+        boxes (torch.Tensor): Packed boxes of size (..., 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        height (float | torch.Tensor): height of the image, or tensor of size (...)
+            containing the height of the image of every box.
+        out (torch.Tensor | None): tensor of the size and dtype of `boxes`
+            receiving the result, may be `boxes` itself.
+
+    Returns:
+        torch.Tensor: `out`, or a new tensor of packed boxes of size (..., 4) with
+            the dtype of `boxes` if None.
+    """
+    result = _prepare(boxes, out)
+    _add_(result[..., 1::2].neg_(), height)
+    return _finish(result, boxes.dtype, out)
+
+
+def translate_boxes(
+    boxes: torch.Tensor,
+    dx: float | torch.Tensor,
+    dy: float | torch.Tensor,
+    out: torch.Tensor | None = None,
+) -> torch.Tensor:
+    """Translate packed boxes.
+
+    Args:
+        boxes (torch.Tensor): Packed boxes of size (..., 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        dx (float | torch.Tensor): offset along x, or tensor of size (...)
+            containing the offset of every box.
+        dy (float | torch.Tensor): offset along y, or tensor of size (...)
+            containing the offset of every box.
+        out (torch.Tensor | None): tensor of the size and dtype of `boxes`
+            receiving the result, may be `boxes` itself.
+
+    Returns:
+        torch.Tensor: `out`, or a new tensor of packed boxes of size (..., 4) with
+            the dtype of `boxes` if None.
+    """
+    # Integer offsets are added to integer boxes natively, without rounding.
+    native = _is_integral(boxes, dx) and _is_integral(boxes, dy)
+    result = _prepare(boxes, out, native)
+    _add_(result[..., 0::2], dx)
+    _add_(result[..., 1::2], dy)
+    return _finish(result, boxes.dtype, out)
+
+
+def scale_boxes(
+    boxes: torch.Tensor,
+    sx: float | torch.Tensor,
+    sy: float | torch.Tensor,
+    out: torch.Tensor | None = None,
+) -> torch.Tensor:
+    """Scale packed boxes around the origin of the coordinates.
+
+    Args:
+        boxes (torch.Tensor): Packed boxes of size (..., 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        sx (float | torch.Tensor): factor along x, or tensor of size (...)
+            containing the factor of every box.
+        sy (float | torch.Tensor): factor along y, or tensor of size (...)
+            containing the factor of every box.
+        out (torch.Tensor | None): tensor of the size and dtype of `boxes`
+            receiving the result, may be `boxes` itself.
+
+    Returns:
+        torch.Tensor: `out`, or a new tensor of packed boxes of size (..., 4) with
+            the dtype of `boxes` if None.
+    """
+    result = _prepare(boxes, out)
+    _mul_(result[..., 0::2], sx)
+    _mul_(result[..., 1::2], sy)
+    return _finish(result, boxes.dtype, out)
+
+
+def clip_boxes(
+    boxes: torch.Tensor,
+    width: float | torch.Tensor,
+    height: float | torch.Tensor,
+    out: torch.Tensor | None = None,
+) -> torch.Tensor:
+    """Clip packed boxes to the image, [0, width] along x and [0, height]
+    along y.
+
+    Args:
+        boxes (torch.Tensor): Packed boxes of size (..., 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        width (float | torch.Tensor): width of the image, or tensor of size (...)
+            containing the width of the image of every box.
+        height (float | torch.Tensor): height of the image, or tensor of size (...)
+            containing the height of the image of every box.
+        out (torch.Tensor | None): tensor of the size and dtype of `boxes`
+            receiving the result, may be `boxes` itself.
+
+    Returns:
+        torch.Tensor: `out`, or a new tensor of packed boxes of size (..., 4) with
+            the dtype of `boxes` if None.
+    """
+    # Integer boxes are clipped to integer bounds natively, without rounding.
+    native = _is_integral(boxes, width) and _is_integral(boxes, height)
+    result = _prepare(boxes, out, native).clamp_(min=0)
+    _clamp_max_(result[..., 0::2], width)
+    _clamp_max_(result[..., 1::2], height)
+    return _finish(result, boxes.dtype, out)
+
+
+def transform_boxes(boxes: torch.Tensor, matrix: torch.Tensor) -> torch.Tensor:
+    """Apply an affine transform to the four corners of packed boxes, and
+    return the axis-aligned boxes enclosing the transformed corners.
+
+    Args:
+        boxes (torch.Tensor): Packed boxes of size (n, 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        matrix (torch.Tensor): affine matrix of size (3, 3) applied to
+            homogeneous (x, y, 1) coordinates, or tensor of size (n, 3, 3)
+            containing the matrix of every box.
+
+    Returns:
+        torch.Tensor: Packed boxes of size (n, 4) with the dtype of floating point
+            boxes, float32 for integer boxes.
+    """
+    dtype = _get_float_dtype(boxes)
+    boxes = boxes.to(dtype)
+    matrix = matrix.to(dtype)
+    # The corners are all the pairs of an x in (x_1, x_3) and a y in (y_1, y_3),
+    # so the extrema of a transformed coordinate over the four corners are the
+    # sums of the extrema of its x and y terms, of size (n, 2, 2).
+    x_terms = boxes[..., 0::2].unsqueeze(-2) * matrix[..., :2, 0:1]
+    y_terms = boxes[..., 1::2].unsqueeze(-2) * matrix[..., :2, 1:2]
+    x_min, x_max = torch.aminmax(x_terms, dim=-1)
+    y_min, y_max = torch.aminmax(y_terms, dim=-1)
+    shift = matrix[..., :2, 2]
+    return torch.cat([x_min + y_min + shift, x_max + y_max + shift], dim=-1)
@@ -0,0 +1,310 @@
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Callable, Iterator
+
+import torch
+from torch.overrides import TorchFunctionMode
+from torch.profiler import record_function
+from torch.utils._pytree import tree_leaves
+
+from .batched import BatchedTorchBoxes
+from .boxes import TorchBoxes
+
+# Instrumentation replaces the public methods and properties of the instrumented
+# classes with wrappers when it is enabled, and restores the original attributes
+# when it is disabled, so that it costs nothing while disabled.
+
+# Functions which read device memory from the host, and so wait for the device.
+_SYNC_FUNCTIONS = {
+    "item",
+    "tolist",
+    "numpy",
+    "__bool__",
+    "__int__",
+    "__float__",
+    "__index__",
+    "nonzero",
+    "argwhere",
+    "equal",
+    "masked_select",
+    "unique",
+    "unique_consecutive",
+}
+_COPY_FUNCTIONS = {"to", "cpu", "cuda", "copy_"}
+_INDEX_FUNCTIONS = {"__getitem__", "__setitem__"}
+
+_STATS: dict[str, _MethodStats] = {}
+_ORIGINALS: list[tuple[type, str, Any]] = []
+_LOCAL = threading.local()
+
+
+class _Counters:
+    """Counters of the tensor operations run during a call."""
+
+    def __init__(self):
+        """Make zeroed counters."""
+        self.allocated_bytes = 0
+        self.tensors = 0
+        self.syncs = 0
+
+
+class _MethodStats:
+    """Accumulated statistics of the calls of a method."""
+
+    def __init__(self):
+        """Make empty statistics."""
+        self.calls = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.counters = _Counters()
+
+    def add(self, elapsed: float, counters: _Counters):
+        """Record a call.
+
+        Args:
+            elapsed (float): wall time of the call in seconds.
+            counters (_Counters): counters of the call.
+        """
+        self.calls += 1
+        self.total_time += elapsed
+        self.max_time = max(self.max_time, elapsed)
+        self.counters.allocated_bytes += counters.allocated_bytes
+        self.counters.tensors += counters.tensors
+        self.counters.syncs += counters.syncs
+
+    def to_dict(self) -> dict[str, int | float]:
+        """Return the statistics as dict.
+
+        Returns:
+            dict[str, int | float]: statistics, times are in seconds.
+        """
+        return {
+            "calls": self.calls,
+            "total_time": self.total_time,
+            "mean_time": self.total_time / self.calls,
+            "max_time": self.max_time,
+            "allocated_bytes": self.counters.allocated_bytes,
+            "tensors": self.counters.tensors,
+            "syncs": self.counters.syncs,
+        }
+
+
+def _get_stack() -> list[_Counters]:
+    """Return the counters of the instrumented calls running in this thread,
+    from the outermost to the innermost.
+
+    Returns:
+        list[_Counters]: counters of the running calls.
+    """
+    if not hasattr(_LOCAL, "stack"):
+        _LOCAL.stack = []
+    return _LOCAL.stack
+
+
+def _is_sync(name: str, args: tuple, out: Any) -> bool:
+    """Return whether a function waits for the device.
+
+    Args:
+        name (str): name of the torch function.
+        args (tuple): positional arguments of the function.
+        out (Any): outputs of the function.
+
+    Returns:
+        bool: True for functions reading device memory from the host, as boolean
+            mask indexing, and for copies between the host and a device.
+    """
+    if name in _SYNC_FUNCTIONS:
+        return True
+    if name in _INDEX_FUNCTIONS:
+        return any(
+            isinstance(index, torch.Tensor) and index.dtype == torch.bool
+            for index in tree_leaves(args[1:])
+        )
+    if name in _COPY_FUNCTIONS:
+        tensors = [t for t in tree_leaves((args, out)) if isinstance(t, torch.Tensor)]
+        device_types = {tensor.device.type for tensor in tensors}
+        return "cpu" in device_types and len(device_types) > 1
+    return False
+
+
+class _CountingMode(TorchFunctionMode):
+    """Function mode counting the new tensors returned by torch functions, their
+    bytes and the synchronizations of the functions, for every running
+    instrumented call.
+
+    A function mode rather than a dispatch mode, as entering a dispatch mode
+    after importing Tensorflow crashes the interpreter.
+    """
+
+    def __torch_function__(self, func, types, args=(), kwargs=None):
+        """Run a function and update the counters of the running calls."""
+        out = func(*args, **(kwargs or {}))
+        input_storages = {
+            tensor.untyped_storage().data_ptr()
+            for tensor in tree_leaves((args, kwargs))
+            if isinstance(tensor, torch.Tensor)
+        }
+        tensors, allocated_bytes = 0, 0
+        for tensor in tree_leaves(out):
+            if not isinstance(tensor, torch.Tensor):
+                continue
+            storage = tensor.untyped_storage()
+            # Views and in place operations reuse the storage of an input.
+            if storage.data_ptr() not in input_storages:
+                input_storages.add(storage.data_ptr())
+                tensors += 1
+                allocated_bytes += storage.nbytes()
+        sync = _is_sync(getattr(func, "__name__", ""), args, out)
+        for counters in _get_stack():
+            counters.tensors += tensors
+            counters.allocated_bytes += allocated_bytes
+            counters.syncs += sync
+        return out
+
+
+def _instrument(function: Callable, name: str) -> Callable:
+    """Wrap a function to record its calls under a name.
+
+    Args:
+        function (Callable): function to wrap.
+        name (str): name of the function in the statistics and profiler traces.
+
+    Returns:
+        Callable: wrapped function.
+    """
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        stack = _get_stack()
+        counters = _Counters()
+        # Nested calls are counted by the mode of the outermost call.
+        mode = nullcontext() if stack else _CountingMode()
+        stack.append(counters)
+        start = time.perf_counter()
+        try:
+            with record_function(name), mode:
+                return function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            stack.pop()
+            _STATS.setdefault(name, _MethodStats()).add(elapsed, counters)
+
+    return wrapper
+
+
+def is_instrumentation_enabled() -> bool:
+    """Return whether instrumentation is enabled.
+
+    Returns:
+        bool: True if the methods are instrumented.
+    """
+    return bool(_ORIGINALS)
+
+
+def enable_instrumentation(classes: tuple[type, ...] = (TorchBoxes, BatchedTorchBoxes)):
+    """Instrument the public methods and properties of classes. Every call
+    records its wall time, the tensors allocated by its operations and their
+    bytes, and its host-device synchronizations, and runs in a
+    `torch.profiler.record_function` range named after the method. Calls are
+    recorded under the class that defines the method. Wall times of operations
+    on accelerators only cover their launch unless they synchronize. Tensors
+    are counted from the outputs of the torch functions called by the methods,
+    so temporaries allocated inside a torch function aren't counted.
+
+    Args:
+        classes (tuple[type, ...]): classes to instrument, default is `TorchBoxes`
+            and `BatchedTorchBoxes`.
+    """
+    if is_instrumentation_enabled():
+        return
+    for cls in classes:
+        for attribute_name, attribute in list(vars(cls).items()):
+            if attribute_name.startswith("_"):
+                continue
+            name = f"{cls.__name__}.{attribute_name}"
+            if isinstance(attribute, property):
+                wrapped = property(
+                    _instrument(attribute.fget, name),
+                    attribute.fset,
+                    attribute.fdel,
+                    attribute.__doc__,
+                )
+            elif isinstance(attribute, classmethod):
+                wrapped = classmethod(_instrument(attribute.__func__, name))
+            elif callable(attribute):
+                wrapped = _instrument(attribute, name)
+            else:
+                continue
+            _ORIGINALS.append((cls, attribute_name, attribute))
+            setattr(cls, attribute_name, wrapped)
+
+
+def disable_instrumentation():
+    """Restore the original methods and properties, statistics are kept."""
+    while _ORIGINALS:
+        cls, attribute_name, attribute = _ORIGINALS.pop()
+        setattr(cls, attribute_name, attribute)
+
+
+@contextmanager
+def instrumented(
+    classes: tuple[type, ...] = (TorchBoxes, BatchedTorchBoxes)
+) -> Iterator[None]:
+    """Enable instrumentation inside a `with` block.
+
+    Args:
+        classes (tuple[type, ...]): classes to instrument, default is `TorchBoxes`
+            and `BatchedTorchBoxes`.
+
+    Yields:
+        None: instrumentation is enabled in the block.
+    """
+    enabled = is_instrumentation_enabled()
+    enable_instrumentation(classes)
+    try:
+        yield
+    finally:
+        if not enabled:
+            disable_instrumentation()
+
+
+def reset_summary():
+    """Clear the recorded statistics."""
+    _STATS.clear()
+
+
+def get_summary() -> dict[str, dict[str, int | float]]:
+    """Return the statistics of every called method.
+
+    Returns:
+        dict[str, dict[str, int | float]]: for every method, the number of
+            `calls`, their `total_time`, `mean_time` and `max_time` in seconds, and
+            the `allocated_bytes`, `tensors` and `syncs` of all calls, nested calls
+            included.
+    """
+    return {name: stats.to_dict() for name, stats in _STATS.items()}
+
+
+def format_summary() -> str:
+    """Format the statistics as a table, sorted by decreasing total time.
+
+    Returns:
+        str: table with a line per method.
+    """
+    lines = [
+        f"{'method':<36} {'calls':>8} {'total ms':>10} {'mean us':>10}"
+        f" {'max us':>10} {'MiB':>10} {'tensors':>8} {'syncs':>6}"
+    ]
+    summary = sorted(get_summary().items(), key=lambda item: -item[1]["total_time"])
+    for name, stats in summary:
+        lines.append(
+            f"{name:<36} {stats['calls']:>8} {stats['total_time'] * 1e3:>10.3f}"
+            f" {stats['mean_time'] * 1e6:>10.1f} {stats['max_time'] * 1e6:>10.1f}"
+            f" {stats['allocated_bytes'] / 2**20:>10.3f} {stats['tensors']:>8}"
+            f" {stats['syncs']:>6}"
+        )
+    return "\n".join(lines)
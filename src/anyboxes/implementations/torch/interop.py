@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import torch
+
+from anyboxes._errors import OptionalDependencyImportError
+
+if TYPE_CHECKING:
+    from jaxtyping import Array
+    from numpy.typing import NDArray
+    from tensorflow import Tensor
+
+    from ._typing import BoxesTensorType
+
+
+def to_torch(boxes: Any) -> BoxesTensorType:
+    """Convert an array of boxes to a `torch.Tensor`, sharing its memory
+    whenever possible. NumPy arrays go through the buffer protocol, JAX and
+    Tensorflow arrays through DLPack, the tensors of the latter must not be
+    modified in place, as the arrays are immutable.
+
+    Args:
+        boxes (Any): `torch.Tensor`, NumPy, JAX or Tensorflow array, or nested sequence.
+
+    Returns:
+        BoxesTensorType: Tensor of boxes.
+    """
+    if isinstance(boxes, torch.Tensor):
+        return boxes
+    module = type(boxes).__module__
+    if module.startswith("numpy"):
+        # Tensors can't be read-only nor have negative strides, so such arrays
+        # are copied.
+        if not boxes.flags.writeable or any(stride < 0 for stride in boxes.strides):
+            boxes = boxes.copy()
+        return torch.from_numpy(boxes)
+    if module.startswith("tensorflow"):
+        import tensorflow as tf
+
+        return torch.from_dlpack(tf.experimental.dlpack.to_dlpack(boxes))
+    if hasattr(boxes, "__dlpack__"):
+        return torch.from_dlpack(boxes)
+    return torch.as_tensor(boxes)
+
+
+def is_immutable(boxes: Any) -> bool:
+    """Return whether an array is immutable, its memory shared through DLPack
+    must not be modified.
+
+    Args:
+        boxes (Any): `torch.Tensor`, NumPy, JAX or Tensorflow array, or nested sequence.
+
+    Returns:
+        bool: True for JAX and Tensorflow arrays.
+    """
+    return type(boxes).__module__.startswith(("jax", "tensorflow"))
+
+
+def prepare_export(
+    boxes: BoxesTensorType,
+    dtype: torch.dtype | None = torch.float,
+    device: torch.device | str = "cpu",
+    copy: bool | None = None,
+) -> BoxesTensorType:
+    """Prepare a tensor to be shared with another framework. The tensor is
+    copied only if its dtype, device or memory layout doesn't match.
+
+    Args:
+        boxes (BoxesTensorType): Tensor to export.
+        dtype (torch.dtype | None): Expected dtype, the dtype of `boxes` if None.
+        device (torch.device | str): Expected device.
+        copy (bool | None): Always copy if True, copy only if needed if None and
+            never copy if False.
+
+    Raises:
+        ValueError: Raised if `copy` is False and a copy is needed.
+
+    Returns:
+        BoxesTensorType: Contiguous tensor with the expected dtype and device.
+    """
+    boxes = boxes.detach()
+    dtype = boxes.dtype if dtype is None else dtype
+    matching = (
+        boxes.dtype == dtype
+        and boxes.device == torch.device(device)
+        and boxes.is_contiguous()
+    )
+    if copy is False and not matching:
+        raise ValueError(
+            "Unable to avoid a copy: boxes must be contiguous, of dtype"
+            f" {dtype} and on device {device}."
+        )
+    if copy or not matching:
+        return boxes.to(device, dtype, memory_format=torch.contiguous_format, copy=True)
+    return boxes
+
+
+def to_numpy(
+    boxes: BoxesTensorType,
+    copy: bool | None = None,
+    dtype: torch.dtype | None = torch.float,
+) -> NDArray:
+    """Export a tensor as a NumPy array.
+
+    Args:
+        boxes (BoxesTensorType): Tensor to export.
+        copy (bool | None): Always copy if True, copy only if needed if None and
+            never copy if False.
+        dtype (torch.dtype | None): dtype of the export, default is float32. The
+            dtype of `boxes` if None.
+
+    Returns:
+        NDArray: Array sharing the memory of `boxes` unless a copy was made.
+    """
+    return prepare_export(boxes, dtype, copy=copy).numpy()
+
+
+def to_jax(
+    boxes: BoxesTensorType,
+    copy: bool | None = None,
+    dtype: torch.dtype | None = torch.float,
+) -> Array:
+    """Export a tensor as a JAX array, through DLPack.
+
+    Args:
+        boxes (BoxesTensorType): Tensor to export.
+        copy (bool | None): Always copy if True, copy only if needed if None and
+            never copy if False.
+        dtype (torch.dtype | None): dtype of the export, default is float32. The
+            dtype of `boxes` if None.
+
+    Raises:
+        OptionalDependencyImportError: Raised if JAX is missing.
+
+    Returns:
+        Array: Array sharing the memory of `boxes` unless a copy was made.
+    """
+    try:
+        import jax.numpy as jnp
+    except ModuleNotFoundError:
+        raise OptionalDependencyImportError("jax")
+
+    return jnp.from_dlpack(prepare_export(boxes, dtype, copy=copy))
+
+
+def to_tf(
+    boxes: BoxesTensorType,
+    copy: bool | None = None,
+    dtype: torch.dtype | None = torch.float,
+) -> Tensor:
+    """Export a tensor as a Tensorflow tensor, through DLPack.
+
+    Args:
+        boxes (BoxesTensorType): Tensor to export.
+        copy (bool | None): Always copy if True, copy only if needed if None and
+            never copy if False.
+        dtype (torch.dtype | None): dtype of the export, default is float32. The
+            dtype of `boxes` if None.
+
+    Raises:
+        OptionalDependencyImportError: Raised if Tensorflow is missing.
+
+    Returns:
+        Tensor: Tensor sharing the memory of `boxes` unless a copy was made.
+    """
+    try:
+        import tensorflow as tf
+    except ModuleNotFoundError:
+        raise OptionalDependencyImportError("tensorflow")
+
+    return tf.experimental.dlpack.from_dlpack(
+        torch.utils.dlpack.to_dlpack(prepare_export(boxes, dtype, copy=copy))
+    )
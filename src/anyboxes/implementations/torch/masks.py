@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import torch
+
+if TYPE_CHECKING:
+    from jaxtyping import Shaped
+
+    from ._typing import BoxesTensorType, CoordTensorType, MaskTensorType
+
+
+def _get_pixel_bounds(
+    boxes: BoxesTensorType, width: int, height: int
+) -> tuple[CoordTensorType, CoordTensorType, CoordTensorType, CoordTensorType]:
+    """Return the pixel bounds of boxes, truncated to integers and clipped to
+    the mask.
+
+    Args:
+        boxes (BoxesTensorType): Packed boxes of size (n, 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        width (int): mask width.
+        height (int): mask height.
+
+    Returns:
+        tuple[CoordTensorType, CoordTensorType, CoordTensorType, CoordTensorType]: x_1, y_1, x_3, y_3.
+    """
+    x_1, y_1, x_3, y_3 = boxes.to(torch.long).unbind(dim=1)
+    return (
+        x_1.clamp(0, width),
+        y_1.clamp(0, height),
+        x_3.clamp(0, width),
+        y_3.clamp(0, height),
+    )
+
+
+def _build_masks_from_bounds(
+    bounds: BoxesTensorType,
+    cols: CoordTensorType,
+    rows: CoordTensorType,
+    dtype: torch.dtype,
+) -> MaskTensorType:
+    """Build one mask per box with ones everywhere and zeros inside the box, by
+    broadcasting comparisons against pixel grids.
+
+    Args:
+        bounds (BoxesTensorType): Integer pixel bounds of size (n, 4).
+        cols (CoordTensorType): Pixel columns of the mask.
+        rows (CoordTensorType): Pixel rows of the mask.
+        dtype (torch.dtype): dtype of the masks.
+
+    Returns:
+        MaskTensorType: masks of size (n, len(rows), len(cols)).
+    """
+    x_1, y_1, x_3, y_3 = bounds.unbind(dim=1)
+    outside_cols = ((cols < x_1[:, None]) | (cols >= x_3[:, None])).to(dtype)
+    outside_rows = ((rows < y_1[:, None]) | (rows >= y_3[:, None])).to(dtype)
+    return torch.maximum(outside_rows[:, :, None], outside_cols[:, None, :])
+
+
+class LazyBinaryMasks:
+    """Represent the binary masks of a collection of boxes, with ones
+    everywhere and zeros inside the boxes, without materializing them. Every
+    mask is a rectangle, so only the pixel bounds of the boxes are stored and
+    dense, run-length encoded or per-row representations are built on demand.
+    """
+
+    def __init__(self, bounds: BoxesTensorType, width: int, height: int):
+        """Make a LazyBinaryMasks object. Object instanced is expected by
+        classmethod `from_boxes`.
+
+        Args:
+            bounds (BoxesTensorType): Integer pixel bounds of size (n, 4),
+                containing the (x_1, y_1, x_3, y_3) clipped to the masks.
+            width (int): mask width.
+            height (int): mask height.
+        """
+        self.bounds = bounds
+        self.width = width
+        self.height = height
+
+    @classmethod
+    def from_boxes(
+        cls, boxes: BoxesTensorType, width: int, height: int
+    ) -> LazyBinaryMasks:
+        """Generate LazyBinaryMasks from packed boxes.
+
+        Args:
+            boxes (BoxesTensorType): Packed boxes of size (n, 4),
+                containing the (x_1, y_1, x_3, y_3) for all boxes.
+            width (int): mask width.
+            height (int): mask height.
+
+        Returns:
+            LazyBinaryMasks: object of class LazyBinaryMasks.
+        """
+        return cls(
+            torch.stack(_get_pixel_bounds(boxes, width, height), dim=1), width, height
+        )
+
+    def __len__(self) -> int:
+        """Return the number of masks.
+
+        Returns:
+            int: Number of masks.
+        """
+        return len(self.bounds)
+
+    def __getitem__(self, index: int | slice | torch.Tensor) -> LazyBinaryMasks:
+        """Return a subset of the masks.
+
+        Args:
+            index (int | slice | torch.Tensor): Index of the masks to keep.
+
+        Returns:
+            LazyBinaryMasks: Subset of the masks.
+        """
+        return LazyBinaryMasks(
+            self.bounds[index].reshape(-1, 4), self.width, self.height
+        )
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        """Return the shape of the dense masks.
+
+        Returns:
+            tuple[int, int, int]: (n_boxes, height, width).
+        """
+        return len(self), self.height, self.width
+
+    @property
+    def areas(self) -> CoordTensorType:
+        """Return the number of zeros of every mask.
+
+        Returns:
+            CoordTensorType: Areas of the boxes inside the masks.
+        """
+        return (self.bounds[:, 2:] - self.bounds[:, :2]).clamp(min=0).prod(dim=1)
+
+    def to_dense(
+        self,
+        window: tuple[int, int, int, int] | None = None,
+        dtype: torch.dtype = torch.uint8,
+    ) -> MaskTensorType:
+        """Materialize the masks as a dense tensor.
+
+        Args:
+            window (tuple[int, int, int, int] | None): Sub-window (x_1, y_1, x_3, y_3)
+                of the masks to materialize, the whole masks if None.
+            dtype (torch.dtype): dtype of the masks.
+
+        Returns:
+            MaskTensorType: masks of size (n, height, width), or cropped to `window`.
+        """
+        x_1, y_1, x_3, y_3 = window or (0, 0, self.width, self.height)
+        device = self.bounds.device
+        cols = torch.arange(max(x_1, 0), min(x_3, self.width), device=device)
+        rows = torch.arange(max(y_1, 0), min(y_3, self.height), device=device)
+        return _build_masks_from_bounds(self.bounds, cols, rows, dtype)
+
+    def to_spans(self) -> Shaped[torch.Tensor, "span 4"]:  # noqa: F722
+        """Return the zeros of the masks as per-row spans.
+
+        Returns:
+            Shaped[torch.Tensor, "span 4"]: spans of size (n_spans, 4), containing the
+                (box_index, row, x_start, x_end) of every row inside a box, `x_end` excluded.
+        """
+        x_1, y_1, x_3, y_3 = self.bounds.unbind(dim=1)
+        num_rows = torch.where(x_3 > x_1, (y_3 - y_1).clamp(min=0), 0)
+        box_indices = torch.repeat_interleave(
+            torch.arange(len(self), device=self.bounds.device), num_rows
+        )
+        first_span = torch.cumsum(num_rows, dim=0) - num_rows
+        rows = (
+            torch.arange(len(box_indices), device=self.bounds.device)
+            - first_span[box_indices]
+            + y_1[box_indices]
+        )
+        return torch.stack(
+            [box_indices, rows, x_1[box_indices], x_3[box_indices]], dim=1
+        )
+
+    def to_rle(self) -> list[dict[str, list[int]]]:
+        """Encode the masks with the uncompressed COCO run-length encoding.
+        Pixels are read in column-major order and counts alternate between
+        runs of zeros and runs of ones, starting with zeros.
+
+        Returns:
+            list[dict[str, list[int]]]: One `{"size": [height, width], "counts": [...]}` per mask.
+        """
+        height, width = self.height, self.width
+        rles = []
+        for x_1, y_1, x_3, y_3 in self.bounds.tolist():
+            box_w, box_h = x_3 - x_1, y_3 - y_1
+            if box_w <= 0 or box_h <= 0:
+                counts = [0, height * width]
+            elif box_h == height:
+                counts = [0, x_1 * height, box_w * height, (width - x_3) * height]
+            else:
+                counts = (
+                    [0, x_1 * height + y_1]
+                    + [box_h, height - box_h] * (box_w - 1)
+                    + [box_h, (width - x_3 + 1) * height - y_3]
+                )
+            if counts[1] == 0 and len(counts) > 2:
+                counts = counts[2:]
+            if counts[-1] == 0:
+                counts = counts[:-1]
+            rles.append({"size": [height, width], "counts": counts})
+        return rles
+
+
+def build_binary_masks(
+    boxes: BoxesTensorType,
+    width: int,
+    height: int,
+    dtype: torch.dtype = torch.uint8,
+) -> MaskTensorType:
+    """Build one mask per box with ones everywhere and zeros inside the box, by
+    broadcasting comparisons against `arange` grids.
+
+    Args:
+        boxes (BoxesTensorType): Packed boxes of size (n, 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        width (int): mask width.
+        height (int): mask height.
+        dtype (torch.dtype): dtype of the masks.
+
+    Returns:
+        MaskTensorType: masks of size (n, height, width).
+    """
+    return LazyBinaryMasks.from_boxes(boxes, width, height).to_dense(dtype=dtype)
+
+
+def build_union_binary_masks(
+    boxes: BoxesTensorType,
+    width: int,
+    height: int,
+    image_indices: CoordTensorType | None = None,
+    num_images: int | None = None,
+    dtype: torch.dtype = torch.uint8,
+) -> Shaped[torch.Tensor, "image height width"]:  # noqa: F722
+    """Build the union of the masks of all boxes of an image, with ones
+    everywhere and zeros inside any box. The masks are accumulated with a 2D
+    difference array, so no (n, height, width) tensor is allocated.
+
+    Args:
+        boxes (BoxesTensorType): Packed boxes of size (n, 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        width (int): mask width.
+        height (int): mask height.
+        image_indices (CoordTensorType | None): Index of the image of every box,
+            all boxes belong to a single image if None.
+        num_images (int | None): Number of images, inferred from `image_indices`
+            if None.
+        dtype (torch.dtype): dtype of the masks.
+
+    Returns:
+        Shaped[torch.Tensor, "image height width"]: masks of size (num_images, height, width).
+    """
+    if image_indices is None:
+        image_indices = torch.zeros(len(boxes), dtype=torch.long, device=boxes.device)
+        num_images = 1
+    elif num_images is None:
+        num_images = int(image_indices.max().item()) + 1 if len(image_indices) else 0
+
+    x_1, y_1, x_3, y_3 = _get_pixel_bounds(boxes, width, height)
+    valid = ((x_3 > x_1) & (y_3 > y_1)).to(torch.int32)
+    offsets = image_indices.to(torch.long) * (height + 1) * (width + 1)
+    indices = torch.cat(
+        [
+            offsets + y_1 * (width + 1) + x_1,
+            offsets + y_1 * (width + 1) + x_3,
+            offsets + y_3 * (width + 1) + x_1,
+            offsets + y_3 * (width + 1) + x_3,
+        ]
+    )
+    values = torch.cat([valid, -valid, -valid, valid])
+    diff = torch.zeros(
+        num_images, height + 1, width + 1, dtype=torch.int32, device=boxes.device
+    )
+    diff.view(-1).index_add_(0, indices, values)
+    coverage = diff.cumsum(dim=1, dtype=torch.int32).cumsum(dim=2, dtype=torch.int32)
+    return (coverage[:, :height, :width] == 0).to(dtype)
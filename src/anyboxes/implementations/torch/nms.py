@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+from enum import Enum
+from typing import TYPE_CHECKING
+
+import torch
+
+from ._utils import expand_ranges
+
+if TYPE_CHECKING:
+    from ._typing import BoxesTensorType, CoordTensorType
+
+# Maximum number of fixed-point iterations of `nms` before the sequential sweep.
+MAX_ITERATIONS = 32
+
+
+class SoftNMSMethod(Enum):
+    """Enum class for score decay of soft non-maximum suppression."""
+
+    LINEAR = "linear"
+    GAUSSIAN = "gaussian"
+
+
+def _prepare(
+    boxes: BoxesTensorType,
+    scores: CoordTensorType,
+    classes: CoordTensorType | None,
+    top_k: int | None,
+) -> tuple[BoxesTensorType, CoordTensorType, CoordTensorType]:
+    """Sort boxes by decreasing score, keep the `top_k` best ones and offset
+    boxes of different classes so that they never overlap.
+
+    Args:
+        boxes (BoxesTensorType): Packed boxes of size (n, 4).
+        scores (CoordTensorType): Scores of size (n).
+        classes (CoordTensorType | None): Classes of size (n), or None.
+        top_k (int | None): Number of best boxes kept before suppression, or None.
+
+    Returns:
+        tuple[BoxesTensorType, CoordTensorType, CoordTensorType]: Sorted boxes with
+            ordered corners, sorted scores and their indices in the input.
+    """
+    if top_k is not None and top_k < len(scores):
+        scores, order = scores.topk(top_k)
+    else:
+        scores, order = scores.sort(descending=True, stable=True)
+    boxes = boxes[order]
+    # Class offsets overflow half precision, and integers can't be offset safely.
+    boxes = boxes.to(torch.promote_types(boxes.dtype, torch.get_default_dtype()))
+    boxes = torch.cat(
+        [
+            torch.minimum(boxes[:, :2], boxes[:, 2:]),
+            torch.maximum(boxes[:, :2], boxes[:, 2:]),
+        ],
+        dim=1,
+    )
+    if classes is not None and len(boxes):
+        lowest, highest = boxes.min(), boxes.max()
+        offsets = classes[order].to(boxes.dtype) * (highest - lowest + 1)
+        boxes = boxes - lowest + offsets[:, None]
+    return boxes, scores, order
+
+
+def _find_suppressions(
+    boxes: BoxesTensorType, iou_threshold: float, chunk_size: int
+) -> tuple[CoordTensorType, CoordTensorType]:
+    """Find all pairs of boxes with an IoU higher than a threshold.
+
+    Boxes are bucketed in horizontal strips as high as the highest box, and
+    swept along the x axis inside a strip, so a box is only compared with the
+    boxes of its strip and of the next one whose x range can give an IoU higher
+    than the threshold. Candidates are compared by chunks of at most
+    `chunk_size` pairs.
+
+    Args:
+        boxes (BoxesTensorType): Packed boxes of size (n, 4), sorted by decreasing score.
+        iou_threshold (float): IoU threshold.
+        chunk_size (int): Maximum number of pairs compared at once.
+
+    Returns:
+        tuple[CoordTensorType, CoordTensorType]: Indices of the better and of the
+            worse box of every pair.
+    """
+    empty = torch.zeros(0, dtype=torch.long, device=boxes.device)
+    heights = boxes[:, 3] - boxes[:, 1]
+    if not len(boxes) or heights.max() <= 0:
+        return empty, empty
+
+    # Sort boxes by strip, then by x_1, with keys `strip * span + x_1`.
+    x_1, y_1, x_3 = boxes[:, 0].double(), boxes[:, 1].double(), boxes[:, 2].double()
+    widths = x_3 - x_1
+    strips = ((y_1 - y_1.min()) / heights.max().double()).floor()
+    span = x_3.max() - x_1.min() + widths.max() + 1
+    keys, key_order = (strips * span + x_1 - x_1.min()).sort()
+    widths = widths[key_order].contiguous()
+    sorted_boxes = boxes[key_order]
+
+    # A box `j` on the right of a box `i` overlaps it by more than the threshold only
+    # if x_1[j] < x_3[i] - threshold * w[i], and a box on its left only if
+    # x_1[j] > x_1[i] - (1 - threshold) * w[j].
+    positions = torch.arange(len(boxes), device=boxes.device)
+    same_strip_stops = torch.searchsorted(
+        keys, keys + (1 - iou_threshold) * widths, side="left"
+    )
+    next_strip_starts = torch.searchsorted(
+        keys, keys + span - (1 - iou_threshold) * widths.max(), side="right"
+    )
+    next_strip_stops = torch.searchsorted(
+        keys, keys + span + (1 - iou_threshold) * widths, side="left"
+    )
+    starts = torch.stack([positions + 1, next_strip_starts], dim=1)
+    counts = (torch.stack([same_strip_stops, next_strip_stops], dim=1) - starts).clamp(
+        min=0
+    )
+
+    areas = (sorted_boxes[:, 2:] - sorted_boxes[:, :2]).prod(dim=1)
+    ends = counts.sum(dim=1).cumsum(dim=0)
+    betters, worses = [], []
+    start = 0
+    while start < len(boxes):
+        offset = ends[start - 1] if start else 0
+        stop = max(int(torch.searchsorted(ends, offset + chunk_size)), start + 1)
+        owners, candidates = expand_ranges(
+            starts[start:stop].flatten(), counts[start:stop].flatten()
+        )
+        first, second = owners // 2 + start, candidates
+        first_boxes = sorted_boxes.index_select(0, first)
+        second_boxes = sorted_boxes.index_select(0, second)
+        top_left = torch.maximum(first_boxes[:, :2], second_boxes[:, :2])
+        bottom_right = torch.minimum(first_boxes[:, 2:], second_boxes[:, 2:])
+        inter = (bottom_right - top_left).clamp(min=0).prod(dim=1)
+        union = areas.index_select(0, first) + areas.index_select(0, second) - inter
+        overlapping = inter > iou_threshold * union
+        first, second = key_order[first[overlapping]], key_order[second[overlapping]]
+        betters.append(torch.minimum(first, second))
+        worses.append(torch.maximum(first, second))
+        start = stop
+    return torch.cat(betters), torch.cat(worses)
+
+
+def _suppress_sequentially(
+    better: CoordTensorType, worse: CoordTensorType, num_boxes: int
+) -> CoordTensorType:
+    """Resolve the greedy suppression with a sequential sweep of the boxes in
+    decreasing score order, a kept box discarding all the boxes it overlaps.
+
+    Args:
+        better (CoordTensorType): Indices of the better box of every pair.
+        worse (CoordTensorType): Indices of the worse box of every pair.
+        num_boxes (int): Number of boxes.
+
+    Returns:
+        CoordTensorType: Mask of the kept boxes.
+    """
+    better, pair_order = better.cpu().sort(stable=True)
+    worse = worse.cpu()[pair_order].tolist()
+    starts = torch.searchsorted(better, torch.arange(num_boxes + 1)).tolist()
+    keep = [True] * num_boxes
+    for index in better.unique_consecutive().tolist():
+        if keep[index]:
+            for suppressed in worse[starts[index] : starts[index + 1]]:
+                keep[suppressed] = False
+    return torch.tensor(keep)
+
+
+def nms(
+    boxes: BoxesTensorType,
+    scores: CoordTensorType,
+    iou_threshold: float = 0.5,
+    classes: CoordTensorType | None = None,
+    top_k: int | None = None,
+    chunk_size: int = 1 << 22,
+) -> CoordTensorType:
+    """Perform greedy non-maximum suppression. All pairs of boxes with an IoU
+    higher than the threshold are first found with a sweep along the x axis.
+    The greedy result is then resolved on this sparse graph with vectorized
+    fixed-point iterations: a box is kept if no kept box with a better score
+    overlaps it, which gives the same result as the sequential algorithm. Long
+    chains of suppressions settle a box per iteration, so once the number of
+    changed boxes stops halving, or after `MAX_ITERATIONS` iterations, the graph
+    is resolved with a sequential sweep instead.
+
+    Args:
+        boxes (BoxesTensorType): Packed boxes of size (n, 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        scores (CoordTensorType): Scores of size (n).
+        iou_threshold (float): Boxes overlapping a better box with an IoU strictly
+            higher than this threshold are discarded.
+        classes (CoordTensorType | None): Classes of size (n), boxes of different
+            classes never suppress each other. All boxes are compared if None.
+        top_k (int | None): Number of best boxes kept before suppression, or None.
+        chunk_size (int): Maximum number of pairs of boxes compared at once.
+
+    Returns:
+        CoordTensorType: Indices of the kept boxes, sorted by decreasing score.
+    """
+    boxes, _, order = _prepare(boxes, scores, classes, top_k)
+    better, worse = _find_suppressions(boxes, iou_threshold, chunk_size)
+    keep = torch.ones(len(boxes), dtype=torch.bool, device=boxes.device)
+    changed = None
+    for _ in range(MAX_ITERATIONS):
+        updated = torch.ones_like(keep)
+        updated[worse[keep[better]]] = False
+        num_changed = int((updated != keep).sum())
+        if not num_changed:
+            return order[keep]
+        if changed is not None and num_changed > changed // 2:
+            break
+        keep, changed = updated, num_changed
+    keep = _suppress_sequentially(better, worse, len(boxes)).to(boxes.device)
+    return order[keep]
+
+
+def soft_nms(
+    boxes: BoxesTensorType,
+    scores: CoordTensorType,
+    sigma: float = 0.5,
+    method: SoftNMSMethod | str = SoftNMSMethod.GAUSSIAN,
+    iou_threshold: float = 0.3,
+    score_threshold: float = 1e-3,
+    classes: CoordTensorType | None = None,
+    top_k: int | None = None,
+) -> tuple[CoordTensorType, CoordTensorType]:
+    """Perform soft non-maximum suppression: instead of being discarded, boxes
+    overlapping a better box see their score decayed.
+
+    Args:
+        boxes (BoxesTensorType): Packed boxes of size (n, 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        scores (CoordTensorType): Scores of size (n).
+        sigma (float): Spread of the gaussian decay.
+        method (SoftNMSMethod | str): `linear` or `gaussian` decay.
+        iou_threshold (float): IoU above which scores are decayed with the linear decay.
+        score_threshold (float): Boxes whose score falls below this threshold are discarded.
+        classes (CoordTensorType | None): Classes of size (n), boxes of different
+            classes never decay each other. All boxes are compared if None.
+        top_k (int | None): Number of best boxes kept before suppression, or None.
+
+    Returns:
+        tuple[CoordTensorType, CoordTensorType]: Indices of the kept boxes and their
+            decayed scores, sorted by decreasing decayed score.
+    """
+    method = SoftNMSMethod(method)
+    boxes, scores, order = _prepare(boxes, scores, classes, top_k)
+    kept_scores = scores.new_empty(len(scores))
+    alive = torch.ones(len(scores), dtype=torch.bool, device=scores.device)
+    areas = (boxes[:, 2:] - boxes[:, :2]).prod(dim=1)
+    kept = []
+    for _ in range(len(scores)):
+        best = int(torch.where(alive, scores, -torch.inf).argmax())
+        if not alive[best] or scores[best] < score_threshold:
+            break
+        kept_scores[len(kept)] = scores[best]
+        kept.append(best)
+        alive[best] = False
+        top_left = torch.maximum(boxes[:, :2], boxes[best, :2])
+        bottom_right = torch.minimum(boxes[:, 2:], boxes[best, 2:])
+        inter = (bottom_right - top_left).clamp(min=0).prod(dim=1)
+        ious = inter / (areas + areas[best] - inter).clamp(min=1e-7)
+        if method == SoftNMSMethod.LINEAR:
+            scores = torch.where(ious > iou_threshold, scores * (1 - ious), scores)
+        else:
+            scores = scores * torch.exp(-(ious**2) / sigma)
+
+    return order[kept], kept_scores[: len(kept)]
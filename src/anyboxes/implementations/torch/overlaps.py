@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import math
+from enum import Enum
+from typing import TYPE_CHECKING
+
+import torch
+
+if TYPE_CHECKING:
+    from jaxtyping import Shaped
+
+    from ._typing import BoxesTensorType, OverlapsTensorType
+
+
+class OverlapMetric(Enum):
+    """Enum class for overlap metrics between boxes."""
+
+    IOU = "iou"
+    GIOU = "giou"
+    DIOU = "diou"
+    CIOU = "ciou"
+
+
+def _compute_overlaps(
+    boxes_1: Shaped[torch.Tensor, "... 4"],  # noqa: F722
+    boxes_2: Shaped[torch.Tensor, "... 4"],  # noqa: F722
+    metric: OverlapMetric,
+    eps: float,
+) -> OverlapsTensorType:
+    """Compute an overlap metric between broadcastable tensors of boxes.
+
+    Args:
+        boxes_1 (Shaped[torch.Tensor, "... 4"]): Packed boxes (x_1, y_1, x_3, y_3).
+        boxes_2 (Shaped[torch.Tensor, "... 4"]): Packed boxes (x_1, y_1, x_3, y_3).
+        metric (OverlapMetric): Overlap metric.
+        eps (float): Small value avoiding divisions by zero.
+
+    Returns:
+        OverlapsTensorType: Overlap metric of the broadcast boxes.
+    """
+    top_left_1 = torch.minimum(boxes_1[..., :2], boxes_1[..., 2:])
+    bottom_right_1 = torch.maximum(boxes_1[..., :2], boxes_1[..., 2:])
+    top_left_2 = torch.minimum(boxes_2[..., :2], boxes_2[..., 2:])
+    bottom_right_2 = torch.maximum(boxes_2[..., :2], boxes_2[..., 2:])
+    size_1 = bottom_right_1 - top_left_1
+    size_2 = bottom_right_2 - top_left_2
+
+    inter = (
+        (
+            torch.minimum(bottom_right_1, bottom_right_2)
+            - torch.maximum(top_left_1, top_left_2)
+        )
+        .clamp(min=0)
+        .prod(dim=-1)
+    )
+    union = size_1.prod(dim=-1) + size_2.prod(dim=-1) - inter
+    iou = inter / union.clamp(min=eps)
+    if metric == OverlapMetric.IOU:
+        return iou
+
+    enclosing = torch.maximum(bottom_right_1, bottom_right_2) - torch.minimum(
+        top_left_1, top_left_2
+    )
+    if metric == OverlapMetric.GIOU:
+        enclosing_area = enclosing.prod(dim=-1).clamp(min=eps)
+        return iou - (enclosing_area - union) / enclosing_area
+
+    centers_distance = (
+        (((top_left_2 + bottom_right_2) - (top_left_1 + bottom_right_1)) / 2)
+        .pow(2)
+        .sum(dim=-1)
+    )
+    diagonal = enclosing.pow(2).sum(dim=-1).clamp(min=eps)
+    diou = iou - centers_distance / diagonal
+    if metric == OverlapMetric.DIOU:
+        return diou
+
+    v = (4 / math.pi**2) * (
+        torch.atan(size_2[..., 0] / size_2[..., 1].clamp(min=eps))
+        - torch.atan(size_1[..., 0] / size_1[..., 1].clamp(min=eps))
+    ).pow(2)
+    alpha = v / (1 - iou + v).clamp(min=eps)
+    return diou - alpha * v
+
+
+def compute_overlaps(
+    boxes_1: BoxesTensorType,
+    boxes_2: BoxesTensorType,
+    metric: OverlapMetric | str = OverlapMetric.IOU,
+    pairwise: bool = True,
+    chunk_size: int | None = None,
+    eps: float = 1e-7,
+) -> OverlapsTensorType:
+    """Compute an overlap metric between two sets of boxes.
+
+    Args:
+        boxes_1 (BoxesTensorType): Packed boxes of size (n, 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        boxes_2 (BoxesTensorType): Packed boxes of size (m, 4),
+            containing the (x_1, y_1, x_3, y_3) for all boxes.
+        metric (OverlapMetric | str): One of `iou`, `giou`, `diou` or `ciou`.
+        pairwise (bool): Compare every box of `boxes_1` with every box of `boxes_2`
+            if True, else compare boxes with the same index.
+        chunk_size (int | None): Number of rows of `boxes_1` processed at once in
+            pairwise mode, which bounds the size of intermediate tensors to
+            (chunk_size, m). All rows are processed at once if None.
+        eps (float): Small value avoiding divisions by zero.
+
+    Raises:
+        ValueError: Raised if boxes don't have the same length in elementwise mode.
+
+    Returns:
+        OverlapsTensorType: Tensor of size (n, m) in pairwise mode, else (n).
+    """
+    metric = OverlapMetric(metric)
+    dtype = torch.promote_types(
+        torch.promote_types(boxes_1.dtype, boxes_2.dtype), torch.get_default_dtype()
+    )
+    boxes_1, boxes_2 = boxes_1.to(dtype), boxes_2.to(dtype)
+    if not pairwise:
+        if len(boxes_1) != len(boxes_2):
+            raise ValueError("Boxes must have the same length in elementwise mode.")
+        return _compute_overlaps(boxes_1, boxes_2, metric, eps)
+
+    if chunk_size is None or chunk_size >= len(boxes_1):
+        return _compute_overlaps(boxes_1[:, None], boxes_2[None], metric, eps)
+    overlaps = torch.empty(
+        len(boxes_1), len(boxes_2), dtype=dtype, device=boxes_1.device
+    )
+    for start in range(0, len(boxes_1), chunk_size):
+        overlaps[start : start + chunk_size] = _compute_overlaps(
+            boxes_1[start : start + chunk_size, None], boxes_2[None], metric, eps
+        )
+    return overlaps
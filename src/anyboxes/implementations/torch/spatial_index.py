@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING
+
+import torch
+
+from ._utils import expand_ranges, get_tensor_version
+
+if TYPE_CHECKING:
+    from ._typing import BoxesTensorType, CoordTensorType
+    from .boxes import TorchBoxes
+
+
+class GridIndex:
+    """Spatial index over a TorchBoxes object, to query the boxes intersecting
+    a window, containing a point or nearest to a point without scanning all the
+    boxes.
+
+    Boxes are bucketed in a uniform grid of square cells, a box being registered
+    in every cell it overlaps. Cells are stored in compressed sparse row layout:
+    the indices of the boxes of all cells are concatenated, sorted by cell, and
+    `cell_starts[c]` gives the position of the first box of cell `c`.
+
+    The index is built lazily and rebuilt on the next query when the boxes have
+    been mutated in place, by `flip_origin` or `square` for instance, or through
+    a view of their packed tensor.
+    """
+
+    def __init__(self, boxes: TorchBoxes, cell_size: float | None = None):
+        """Make a GridIndex object. Object instanced is expected by method
+        `TorchBoxes.build_spatial_index`.
+
+        Args:
+            boxes (TorchBoxes): Indexed boxes.
+            cell_size (float | None): Side of the cells of the grid. The mean of the
+                largest side of the boxes is used if None, the cells being enlarged
+                if needed so that there are at most four cells per box.
+        """
+        self.boxes = boxes
+        self.cell_size = cell_size
+        self._version: tuple[int, int | None] | None = None
+
+    def __len__(self) -> int:
+        """Return the number of indexed boxes.
+
+        Returns:
+            int: Number of indexed boxes.
+        """
+        return len(self._get_corners())
+
+    def __get_boxes_version(self) -> tuple[int, int | None]:
+        """Return the versions of the boxes, which change when they are mutated,
+        in place or through a view of their packed tensor.
+
+        Returns:
+            tuple[int, int | None]: Version of the Boxes and of their packed tensor.
+        """
+        return self.boxes._version, get_tensor_version(self.boxes._boxes)
+
+    def _get_corners(self) -> BoxesTensorType:
+        """Return the packed boxes with ordered corners, building the index
+        first if the boxes have been mutated since the last build.
+
+        Returns:
+            BoxesTensorType: Packed boxes of size (n, 4), with x_1 <= x_3 and y_1 <= y_3.
+        """
+        if self._version != self.__get_boxes_version():
+            self.build()
+        return self._corners
+
+    def build(self) -> GridIndex:
+        """Build the index from the current state of the boxes.
+
+        Returns:
+            self
+        """
+        boxes = self.boxes._boxes
+        boxes = boxes.to(torch.promote_types(boxes.dtype, torch.get_default_dtype()))
+        corners = torch.cat(
+            [
+                torch.minimum(boxes[:, :2], boxes[:, 2:]),
+                torch.maximum(boxes[:, :2], boxes[:, 2:]),
+            ],
+            dim=1,
+        )
+        device = corners.device
+        if len(corners):
+            lowest = corners[:, :2].amin(dim=0)
+            extent = (corners[:, 2:].amax(dim=0) - lowest).tolist()
+            cell_size = self.cell_size
+            if cell_size is None:
+                cell_size = float((corners[:, 2:] - corners[:, :2]).amax(dim=1).mean())
+                cell_size = cell_size or max(extent + [1.0]) / math.sqrt(len(corners))
+                while (extent[0] // cell_size + 1) * (
+                    extent[1] // cell_size + 1
+                ) > 4 * len(corners):
+                    cell_size *= 2
+        else:
+            lowest = torch.zeros(2, dtype=corners.dtype, device=device)
+            extent, cell_size = [0.0, 0.0], 1.0
+        n_cols = int(extent[0] // cell_size) + 1
+        n_rows = int(extent[1] // cell_size) + 1
+
+        first_cells, last_cells = self.__locate(
+            corners, lowest, cell_size, n_cols, n_rows
+        )
+        spans = last_cells - first_cells + 1
+        owners, positions = expand_ranges(
+            torch.zeros(len(corners), dtype=torch.long, device=device),
+            spans.prod(dim=1),
+        )
+        widths = spans[:, 0].index_select(0, owners)
+        cols = first_cells[:, 0].index_select(0, owners) + positions % widths
+        rows = first_cells[:, 1].index_select(0, owners) + positions // widths
+        cells, order = (rows * n_cols + cols).sort(stable=True)
+
+        self._corners = corners
+        self._lowest = lowest
+        self._cell_size = cell_size
+        self._n_cols, self._n_rows = n_cols, n_rows
+        self._entries = owners[order]
+        self._cell_starts = torch.searchsorted(
+            cells, torch.arange(n_cols * n_rows + 1, device=device)
+        )
+        self._version = self.__get_boxes_version()
+        return self
+
+    @staticmethod
+    def __locate(
+        windows: BoxesTensorType,
+        lowest: CoordTensorType,
+        cell_size: float,
+        n_cols: int,
+        n_rows: int,
+    ) -> tuple[BoxesTensorType, BoxesTensorType]:
+        """Return the first and last cells covered by windows, clipped to the grid.
+
+        Args:
+            windows (BoxesTensorType): Windows of size (n, 4) with ordered corners.
+            lowest (CoordTensorType): Coordinates of the top-left corner of the grid.
+            cell_size (float): Side of the cells.
+            n_cols (int): Number of columns of the grid.
+            n_rows (int): Number of rows of the grid.
+
+        Returns:
+            tuple[BoxesTensorType, BoxesTensorType]: (col, row) of the first and of
+                the last cell of every window, of size (n, 2).
+        """
+        highest = torch.tensor([n_cols - 1, n_rows - 1], device=windows.device)
+        cells = ((windows - lowest.repeat(2)) / cell_size).floor().to(torch.long)
+        first_cells = torch.minimum(cells[:, :2].clamp(min=0), highest)
+        last_cells = torch.minimum(cells[:, 2:].clamp(min=0), highest)
+        return first_cells, last_cells
+
+    def __get_candidates(
+        self, first_cells: BoxesTensorType, last_cells: BoxesTensorType
+    ) -> tuple[CoordTensorType, CoordTensorType]:
+        """Return the boxes registered in ranges of cells.
+
+        Args:
+            first_cells (BoxesTensorType): (col, row) of the first cell of every range.
+            last_cells (BoxesTensorType): (col, row) of the last cell of every range.
+
+        Returns:
+            tuple[CoordTensorType, CoordTensorType]: Index of the range and of the
+                box of every candidate, without duplicates.
+        """
+        # Cells of a row of a range are contiguous, so the boxes registered in them
+        # are a single slice of `_entries`.
+        ranges_rows, rows = expand_ranges(
+            first_cells[:, 1], last_cells[:, 1] - first_cells[:, 1] + 1
+        )
+        row_starts = self._cell_starts.index_select(
+            0, rows * self._n_cols + first_cells[:, 0].index_select(0, ranges_rows)
+        )
+        row_stops = self._cell_starts.index_select(
+            0, rows * self._n_cols + last_cells[:, 0].index_select(0, ranges_rows) + 1
+        )
+        owners, positions = expand_ranges(row_starts, row_stops - row_starts)
+        range_indices = ranges_rows.index_select(0, owners)
+        box_indices = self._entries.index_select(0, positions)
+        pairs = torch.unique(range_indices * len(self._corners) + box_indices)
+        return pairs // len(self._corners), pairs % len(self._corners)
+
+    def query_windows(
+        self, windows: BoxesTensorType
+    ) -> tuple[CoordTensorType, CoordTensorType]:
+        """Find the boxes intersecting several windows at once. Boxes touching a
+        window on an edge intersect it.
+
+        Args:
+            windows (BoxesTensorType): Windows of size (n, 4),
+                containing the (x_1, y_1, x_3, y_3) for all windows.
+
+        Returns:
+            tuple[CoordTensorType, CoordTensorType]: Index of the window and of the
+                box of every intersecting pair, sorted by window then by box.
+        """
+        corners = self._get_corners()
+        windows = windows.to(corners.dtype).reshape(-1, 4)
+        windows = torch.cat(
+            [
+                torch.minimum(windows[:, :2], windows[:, 2:]),
+                torch.maximum(windows[:, :2], windows[:, 2:]),
+            ],
+            dim=1,
+        )
+        window_indices, box_indices = self.__get_candidates(
+            *self.__locate(
+                windows, self._lowest, self._cell_size, self._n_cols, self._n_rows
+            )
+        )
+        candidates = corners.index_select(0, box_indices)
+        windows = windows.index_select(0, window_indices)
+        intersecting = (
+            (candidates[:, :2] <= windows[:, 2:])
+            & (candidates[:, 2:] >= windows[:, :2])
+        ).all(dim=1)
+        return window_indices[intersecting], box_indices[intersecting]
+
+    def query_window(
+        self, x_1: float, y_1: float, x_3: float, y_3: float
+    ) -> CoordTensorType:
+        """Find the boxes intersecting a window. Boxes touching the window on an
+        edge intersect it.
+
+        Args:
+            x_1 (float): x coordinate of the top-left corner of the window.
+            y_1 (float): y coordinate of the top-left corner of the window.
+            x_3 (float): x coordinate of the bottom-right corner of the window.
+            y_3 (float): y coordinate of the bottom-right corner of the window.
+
+        Returns:
+            CoordTensorType: Sorted indices of the intersecting boxes.
+        """
+        windows = torch.tensor([[x_1, y_1, x_3, y_3]], device=self.boxes.device)
+        return self.query_windows(windows)[1]
+
+    def query_points(
+        self, points: CoordTensorType
+    ) -> tuple[CoordTensorType, CoordTensorType]:
+        """Find the boxes containing several points at once. Points on the edge
+        of a box are inside it.
+
+        Args:
+            points (CoordTensorType): Points of size (n, 2), containing the (x, y)
+                for all points.
+
+        Returns:
+            tuple[CoordTensorType, CoordTensorType]: Index of the point and of the
+                box of every pair, sorted by point then by box.
+        """
+        points = points.reshape(-1, 2)
+        return self.query_windows(torch.cat([points, points], dim=1))
+
+    def query_point(self, x: float, y: float) -> CoordTensorType:
+        """Find the boxes containing a point. Points on the edge of a box are
+        inside it.
+
+        Args:
+            x (float): x coordinate of the point.
+            y (float): y coordinate of the point.
+
+        Returns:
+            CoordTensorType: Sorted indices of the boxes containing the point.
+        """
+        return self.query_window(x, y, x, y)
+
+    def nearest(
+        self, x: float, y: float, k: int = 1
+    ) -> tuple[CoordTensorType, CoordTensorType]:
+        """Find the `k` boxes nearest to a point, the distance to a box being 0
+        if the point is inside it. Rings of cells around the point are searched
+        until no box outside the searched cells can be nearer.
+
+        Args:
+            x (float): x coordinate of the point.
+            y (float): y coordinate of the point.
+            k (int): Number of boxes to find.
+
+        Returns:
+            tuple[CoordTensorType, CoordTensorType]: Indices of the nearest boxes
+                and their distances to the point, sorted by increasing distance.
+        """
+        corners = self._get_corners()
+        k = min(k, len(corners))
+        point = torch.tensor([x, y], dtype=corners.dtype, device=corners.device)
+        if not k:
+            return self._entries[:0], point[:0]
+        left, top = self._lowest.tolist()
+        cell_size, n_cols, n_rows = self._cell_size, self._n_cols, self._n_rows
+        col = min(max(int((x - left) // cell_size), 0), n_cols - 1)
+        row = min(max(int((y - top) // cell_size), 0), n_rows - 1)
+        radius = 0
+        while True:
+            first_col, last_col = max(col - radius, 0), min(col + radius, n_cols - 1)
+            first_row, last_row = max(row - radius, 0), min(row + radius, n_rows - 1)
+            _, box_indices = self.__get_candidates(
+                torch.tensor([[first_col, first_row]], device=corners.device),
+                torch.tensor([[last_col, last_row]], device=corners.device),
+            )
+            if len(box_indices) >= k:
+                candidates = corners.index_select(0, box_indices)
+                distances = torch.linalg.vector_norm(
+                    torch.maximum(
+                        candidates[:, :2] - point, point - candidates[:, 2:]
+                    ).clamp(min=0),
+                    dim=1,
+                )
+                distances, nearest = distances.topk(k, largest=False)
+                # Boxes outside the searched cells are farther than the nearest side
+                # of the searched area which is not a side of the grid.
+                margin = min(
+                    x - left - first_col * cell_size if first_col > 0 else math.inf,
+                    y - top - first_row * cell_size if first_row > 0 else math.inf,
+                    (
+                        left + (last_col + 1) * cell_size - x
+                        if last_col < n_cols - 1
+                        else math.inf
+                    ),
+                    (
+                        top + (last_row + 1) * cell_size - y
+                        if last_row < n_rows - 1
+                        else math.inf
+                    ),
+                )
+                if distances[-1] <= margin:
+                    return box_indices[nearest], distances
+            radius = 2 * radius + 1
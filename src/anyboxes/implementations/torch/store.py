@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+import torch
+
+from anyboxes.implementations.origin import Origin
+
+from .batched import BatchedTorchBoxes
+from .boxes import TorchBoxes
+from .interop import to_numpy
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from ._typing import CoordTensorType
+
+FORMAT_VERSION = 1
+METADATA_FILENAME = "metadata.json"
+# Torch dtypes missing from Numpy, stored as the bits of an integer dtype.
+_BITS_DTYPES = {torch.bfloat16: torch.uint16}
+_DTYPES = {"bfloat16": torch.bfloat16}
+
+
+def _to_column(values: torch.Tensor) -> tuple[NDArray, str | None]:
+    """Return the values of a column as Numpy array, as the bits of an integer
+    dtype for dtypes missing from Numpy.
+
+    Args:
+        values (torch.Tensor): values of the column.
+
+    Returns:
+        tuple[NDArray, str | None]: values, with the name of their torch dtype if
+            they are stored as bits, None otherwise.
+    """
+    if values.dtype in _BITS_DTYPES:
+        bits = values.contiguous().view(_BITS_DTYPES[values.dtype])
+        return to_numpy(bits, dtype=None), str(values.dtype).split(".")[-1]
+    return to_numpy(values, dtype=None), None
+
+
+class BoxStore:
+    """Columnar on-disk store of the boxes of a dataset.
+
+    A store is a directory holding one `.npy` file per column: `boxes`, the
+    packed boxes of size (n, 4) containing the (x_1, y_1, x_3, y_3) of all
+    boxes image after image, `offsets`, the position of the first box of every
+    image followed by n, and the optional `scores` and `labels` of size (n).
+    Columns are memory-mapped copy-on-write when the store is opened, so opening
+    is independent of the number of boxes, worker processes share the pages of
+    the files, and boxes are views over the mapping: in place methods modify
+    private pages and never write to the files. bfloat16 columns are stored as
+    uint16 bits, their dtype being recorded in the metadata.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        """Open a store written by `BoxStore.write`.
+
+        Args:
+            path (str | os.PathLike): directory of the store.
+
+        Raises:
+            ValueError: Raised if the store was written by an unsupported version.
+        """
+        self.path = Path(path)
+        with open(self.path / METADATA_FILENAME) as file:
+            metadata = json.load(file)
+        if metadata["version"] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported store version: {metadata['version']}.")
+        self._origin = Origin(metadata["origin"])
+        self._columns = {
+            column: np.load(self.path / f"{column}.npy", mmap_mode="c")
+            for column in metadata["columns"]
+        }
+        self._dtypes = {
+            column: _DTYPES[dtype]
+            for column, dtype in metadata.get("dtypes", {}).items()
+        }
+
+    @classmethod
+    def write(
+        cls,
+        path: str | os.PathLike,
+        boxes: TorchBoxes,
+        scores: CoordTensorType | None = None,
+        labels: CoordTensorType | None = None,
+    ) -> BoxStore:
+        """Write boxes to a new store, keeping their storage dtype.
+
+        Args:
+            path (str | os.PathLike): directory of the store, created if missing.
+            boxes (TorchBoxes): boxes of a single image, or `BatchedTorchBoxes` of
+                a set of images.
+            scores (CoordTensorType | None): scores of size (n), not stored if None.
+            labels (CoordTensorType | None): labels of size (n), not stored if None.
+
+        Raises:
+            ValueError: Raised if `scores` or `labels` aren't of size (n).
+
+        Returns:
+            BoxStore: the written store, opened.
+        """
+        offsets = (
+            boxes.offsets if isinstance(boxes, BatchedTorchBoxes) else [0, len(boxes)]
+        )
+        columns = {"offsets": np.array(offsets, dtype=np.int64)}
+        dtypes = {}
+        for column, values in (
+            ("boxes", boxes._boxes),
+            ("scores", scores),
+            ("labels", labels),
+        ):
+            if values is None:
+                continue
+            if column != "boxes" and values.shape != (len(boxes),):
+                raise ValueError(f"`{column}` must be of size (n).")
+            columns[column], dtype = _to_column(values)
+            if dtype is not None:
+                dtypes[column] = dtype
+
+        path = Path(path)
+        path.mkdir(parents=True, exist_ok=True)
+        for column, values in columns.items():
+            np.save(path / f"{column}.npy", values)
+        metadata = {
+            "version": FORMAT_VERSION,
+            "origin": boxes.origin,
+            "columns": list(columns),
+            "dtypes": dtypes,
+        }
+        with open(path / METADATA_FILENAME, "w") as file:
+            json.dump(metadata, file)
+        return cls(path)
+
+    @property
+    def num_images(self) -> int:
+        """Return the number of images of the store.
+
+        Returns:
+            int: Number of images.
+        """
+        return len(self._columns["offsets"]) - 1
+
+    def __len__(self) -> int:
+        """Return the number of boxes of the store.
+
+        Returns:
+            int: Number of boxes.
+        """
+        return len(self._columns["boxes"])
+
+    def __get_range(self, index: int) -> slice:
+        """Return the positions of the boxes of an image.
+
+        Args:
+            index (int): index of the image.
+
+        Returns:
+            slice: positions of the boxes of the image in the columns.
+        """
+        offsets = self._columns["offsets"]
+        index = range(self.num_images)[index]
+        return slice(int(offsets[index]), int(offsets[index + 1]))
+
+    def __get_column(self, column: str, index: int | None) -> NDArray | None:
+        """Return a column, or its values for an image.
+
+        Args:
+            column (str): name of the column.
+            index (int | None): index of the image, all images if None.
+
+        Returns:
+            NDArray | None: memory-mapped values, None if the column isn't stored.
+        """
+        if column not in self._columns:
+            return None
+        values = self._columns[column]
+        return values if index is None else values[self.__get_range(index)]
+
+    def __to_tensor(self, column: str, values: NDArray) -> torch.Tensor:
+        """Return values of a column as tensor sharing their memory, viewed in
+        their torch dtype if they are stored as bits.
+
+        Args:
+            column (str): name of the column.
+            values (NDArray): values of the column.
+
+        Returns:
+            torch.Tensor: values.
+        """
+        tensor = torch.from_numpy(values)
+        if column in self._dtypes:
+            tensor = tensor.view(self._dtypes[column])
+        return tensor
+
+    def get_boxes(self) -> BatchedTorchBoxes:
+        """Return the boxes of all images, as views over the mapping.
+
+        Returns:
+            BatchedTorchBoxes: boxes of all images.
+        """
+        return BatchedTorchBoxes(
+            self.__to_tensor("boxes", self._columns["boxes"]),
+            self._origin,
+            torch.from_numpy(np.diff(self._columns["offsets"])),
+        )
+
+    def get_image(self, index: int) -> TorchBoxes:
+        """Return the boxes of an image, as views over the mapping. Only the
+        pages of the image are read.
+
+        Args:
+            index (int): index of the image.
+
+        Returns:
+            TorchBoxes: boxes of the image.
+        """
+        return TorchBoxes(
+            self.__to_tensor("boxes", self.__get_column("boxes", index)),
+            self._origin,
+        )
+
+    def get_scores(self, index: int | None = None) -> CoordTensorType | None:
+        """Return the scores of the boxes, as a view over the mapping.
+
+        Args:
+            index (int | None): index of an image, the scores of all images if None.
+
+        Returns:
+            CoordTensorType | None: scores, None if the store has no scores.
+        """
+        scores = self.__get_column("scores", index)
+        return None if scores is None else self.__to_tensor("scores", scores)
+
+    def get_labels(self, index: int | None = None) -> CoordTensorType | None:
+        """Return the labels of the boxes, as a view over the mapping.
+
+        Args:
+            index (int | None): index of an image, the labels of all images if None.
+
+        Returns:
+            CoordTensorType | None: labels, None if the store has no labels.
+        """
+        labels = self.__get_column("labels", index)
+        return None if labels is None else self.__to_tensor("labels", labels)
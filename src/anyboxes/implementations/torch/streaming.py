@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterable, Iterator
+
+import numpy as np
+import torch
+
+from anyboxes.implementations.box_format import BoxFormat
+
+from ._utils import check_height
+from .functional import convert_boxes, flip_boxes, square_boxes
+from .interop import to_torch
+
+if TYPE_CHECKING:
+    from ._typing import BoxesTensorType
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+
+
+def _read_header(file: BinaryIO) -> tuple[tuple[int, ...], bool, np.dtype]:
+    """Read the header of a `.npy` file, leaving the file at the start of the
+    data.
+
+    Args:
+        file (BinaryIO): `.npy` file opened in binary mode.
+
+    Returns:
+        tuple[tuple[int, ...], bool, np.dtype]: Shape, Fortran order and dtype.
+    """
+    if np.lib.format.read_magic(file) == (1, 0):
+        return np.lib.format.read_array_header_1_0(file)
+    return np.lib.format.read_array_header_2_0(file)
+
+
+def read_chunks(
+    path: str | os.PathLike, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> Iterator[BoxesTensorType]:
+    """Read boxes from a `.npy` file chunk by chunk. The file is read
+    sequentially, so only the current chunk is held in memory.
+
+    Args:
+        path (str | os.PathLike): Path of a `.npy` file of boxes of size (n, 4).
+        chunk_size (int): Number of boxes per chunk.
+
+    Raises:
+        ValueError: Raised if the file doesn't contain boxes of size (n, 4) in C
+            order.
+
+    Yields:
+        BoxesTensorType: Chunks of at most `chunk_size` boxes, a single empty chunk
+            for an empty file, so that its dtype is known.
+    """
+    with open(path, "rb") as file:
+        shape, fortran_order, dtype = _read_header(file)
+        if len(shape) != 2 or shape[1] != 4 or fortran_order:
+            raise ValueError("The file must contain boxes of size (n, 4) in C order.")
+        for start in range(0, max(shape[0], 1), chunk_size):
+            count = min(chunk_size, shape[0] - start)
+            chunk = np.fromfile(file, dtype=dtype, count=count * 4)
+            yield torch.from_numpy(chunk.reshape(count, 4))
+
+
+def stream_boxes(
+    source: Iterable[Any] | str | os.PathLike,
+    in_format: BoxFormat | str,
+    out_format: BoxFormat | str,
+    height: float | None = None,
+    square: bool = False,
+    dtype: torch.dtype | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[BoxesTensorType]:
+    """Convert boxes chunk by chunk, so that the working set is bounded by the
+    size of a chunk whatever the number of boxes. Chunks go through the same
+    steps as `TorchBoxes`: conversion to two corners, squaring, origin flip and
+    conversion to the output format, with absolute sizes.
+
+    Args:
+        source (Iterable[Any] | str | os.PathLike): Iterable of chunks of boxes of
+            size (n_i, 4), as tensors or NumPy, JAX or Tensorflow arrays, or path of
+            a `.npy` file read by chunks of `chunk_size` boxes.
+        in_format (BoxFormat | str): Format of the input boxes.
+        out_format (BoxFormat | str): Format of the output boxes.
+        height (float | None): Height of the images, the origin of the boxes is
+            flipped if not None.
+        square (bool): Pad the boxes so that they become squares.
+        dtype (torch.dtype | None): dtype of the output boxes, the dtype of floating
+            point boxes and the default floating point dtype for integer boxes if None.
+        chunk_size (int): Number of boxes per chunk when `source` is a path.
+
+    Raises:
+        ValueError: Raised if `height` is smaller than a box.
+
+    Yields:
+        BoxesTensorType: Converted chunks.
+    """
+    in_format, out_format = BoxFormat(in_format), BoxFormat(out_format)
+    if isinstance(source, (str, os.PathLike)):
+        source = read_chunks(source, chunk_size)
+    for chunk in source:
+        boxes = convert_boxes(to_torch(chunk), in_format, BoxFormat.TWO_CORNERS)
+        if square:
+            boxes = square_boxes(boxes)
+        if height is not None:
+            check_height(boxes, height)
+            boxes = flip_boxes(boxes, height)
+        boxes = convert_boxes(boxes, BoxFormat.TWO_CORNERS, out_format, dtype)
+        if out_format != BoxFormat.TWO_CORNERS:
+            boxes[:, 2:].abs_()
+        yield boxes
+
+
+def convert_file(
+    in_path: str | os.PathLike,
+    out_path: str | os.PathLike,
+    in_format: BoxFormat | str,
+    out_format: BoxFormat | str,
+    height: float | None = None,
+    square: bool = False,
+    dtype: torch.dtype | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+):
+    """Convert a `.npy` file of boxes to another `.npy` file chunk by chunk.
+    Both files are read and written sequentially, so peak memory doesn't depend
+    on the number of boxes.
+
+    Args:
+        in_path (str | os.PathLike): Path of a `.npy` file of boxes of size (n, 4).
+        out_path (str | os.PathLike): Path of the output `.npy` file.
+        in_format (BoxFormat | str): Format of the input boxes.
+        out_format (BoxFormat | str): Format of the output boxes.
+        height (float | None): Height of the images, the origin of the boxes is
+            flipped if not None.
+        square (bool): Pad the boxes so that they become squares.
+        dtype (torch.dtype | None): dtype of the output boxes, the dtype of floating
+            point boxes and the default floating point dtype for integer boxes if None.
+        chunk_size (int): Number of boxes per chunk.
+
+    Raises:
+        ValueError: Raised if `height` is smaller than a box.
+    """
+    with open(in_path, "rb") as file:
+        shape, _, _ = _read_header(file)
+    with open(out_path, "wb") as file:
+        for index, chunk in enumerate(
+            stream_boxes(
+                in_path, in_format, out_format, height, square, dtype, chunk_size
+            )
+        ):
+            chunk = chunk.numpy()
+            if index == 0:
+                header = {
+                    "descr": np.lib.format.dtype_to_descr(chunk.dtype),
+                    "fortran_order": False,
+                    "shape": shape,
+                }
+                np.lib.format.write_array_header_2_0(file, header)
+            chunk.tofile(file)
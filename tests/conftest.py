@@ -4,6 +4,8 @@ import pytest
 import tensorflow as tf
 import torch
 
+from anyboxes import BatchedTorchBoxes
+
 
 @pytest.fixture
 def top_left_data():
@@ -151,3 +153,39 @@ def mask_data():
 @pytest.fixture
 def mask_tensor(mask_data):
     return torch.tensor(mask_data)
+
+
+@pytest.fixture
+def random_two_corners_tensor():
+    generator = torch.Generator().manual_seed(0)
+    top_left = torch.randint(-5, 40, (50, 2), generator=generator)
+    size = torch.randint(0, 20, (50, 2), generator=generator)
+    return torch.cat([top_left, top_left + size], dim=1).to(torch.float)
+
+
+@pytest.fixture
+def random_image_indices():
+    return torch.arange(50) % 3
+
+
+@pytest.fixture
+def overlapping_two_corners_tensors():
+    return torch.tensor([[0.0, 0.0, 2.0, 2.0], [0.0, 0.0, 1.0, 4.0]]), torch.tensor(
+        [[1.0, 1.0, 3.0, 3.0], [0.0, 0.0, 1.0, 4.0], [5.0, 5.0, 6.0, 6.0]]
+    )
+
+
+@pytest.fixture
+def detections():
+    generator = torch.Generator().manual_seed(0)
+    centers = torch.rand(300, 2, generator=generator) * 100
+    sizes = torch.rand(300, 2, generator=generator) * 30 + 1
+    boxes = torch.cat([centers - sizes / 2, centers + sizes / 2], dim=1)
+    scores = torch.rand(300, generator=generator)
+    classes = torch.randint(0, 3, (300,), generator=generator)
+    return boxes, scores, classes
+
+
+@pytest.fixture
+def batched_boxes(random_two_corners_tensor):
+    return BatchedTorchBoxes.from_packed(random_two_corners_tensor, [20, 0, 30])
@@ -0,0 +1,119 @@
+# type: ignore
+
+import pytest
+import torch
+
+from anyboxes.implementations.torch.annotations import (
+    read_coco,
+    read_voc,
+    read_yolo,
+    write_coco,
+    write_voc,
+    write_yolo,
+)
+from anyboxes.implementations.torch.batched import BatchedTorchBoxes
+
+
+@pytest.fixture
+def image_sizes():
+    return torch.tensor([[64, 48], [32, 32], [100, 80]])
+
+
+@pytest.mark.usefixtures("batched_boxes", "random_two_corners_tensor")
+def test_coco_round_trip(tmp_path, batched_boxes, random_two_corners_tensor):
+    labels = torch.arange(50) % 4
+    write_coco(tmp_path / "coco.json", batched_boxes, labels, [7, 8, 9])
+    boxes, read_labels, image_ids = read_coco(tmp_path / "coco.json")
+    assert image_ids == [7, 8, 9] and boxes.offsets == [0, 20, 20, 50]
+    torch.testing.assert_close(boxes.to_two_corners().boxes_, random_two_corners_tensor)
+    torch.testing.assert_close(read_labels, labels)
+
+
+def test_read_coco_groups_by_image():
+    dataset = {
+        "images": [{"id": 3}, {"id": 1}],
+        "annotations": [
+            {"image_id": 1, "category_id": 2, "bbox": [0, 0, 2, 2]},
+            {"image_id": 3, "category_id": 5, "bbox": [1, 2, 3, 4]},
+            {"image_id": 1, "category_id": 1, "bbox": [4, 4, 1, 1]},
+        ],
+    }
+    boxes, labels, _ = read_coco(dataset)
+    assert boxes.lengths.tolist() == [1, 2]
+    assert labels.tolist() == [5, 2, 1]
+    assert boxes.to_two_corners().boxes_.tolist() == [
+        [1, 2, 4, 6],
+        [0, 0, 2, 2],
+        [4, 4, 5, 5],
+    ]
+
+
+@pytest.mark.usefixtures("batched_boxes", "random_two_corners_tensor", "image_sizes")
+def test_voc_round_trip(
+    tmp_path, batched_boxes, random_two_corners_tensor, image_sizes
+):
+    paths = [tmp_path / f"{index}.xml" for index in range(3)]
+    classes = ["cat", "dog", "a&b"]
+    labels = torch.arange(50) % 3
+    write_voc(paths, batched_boxes, labels, classes, image_sizes)
+    boxes, read_labels, read_classes = read_voc(paths, classes)
+    assert read_classes == classes and boxes.offsets == [0, 20, 20, 50]
+    torch.testing.assert_close(boxes.to_two_corners().boxes_, random_two_corners_tensor)
+    torch.testing.assert_close(read_labels, labels)
+    assert read_voc(paths)[2] == ["cat", "dog", "a&b"]
+
+
+@pytest.mark.usefixtures("batched_boxes", "image_sizes")
+def test_yolo_round_trip(tmp_path, batched_boxes, image_sizes):
+    paths = [tmp_path / f"{index}.txt" for index in range(3)]
+    labels = torch.arange(50) % 5
+    write_yolo(paths, batched_boxes, labels, image_sizes)
+    assert paths[1].read_text() == ""
+    first_line = paths[0].read_text().splitlines()[0].split()
+    assert first_line[0] == "0" and 0 <= float(first_line[3]) <= 1
+
+    boxes, read_labels = read_yolo(paths, image_sizes)
+    torch.testing.assert_close(
+        boxes.to_center().boxes_, batched_boxes.to_center().boxes_, atol=1e-4, rtol=0
+    )
+    torch.testing.assert_close(read_labels, labels)
+    normalized, _ = read_yolo(paths)
+    assert normalized.to_center().boxes_.max() <= 1
+
+
+@pytest.mark.usefixtures("batched_boxes")
+def test_annotation_errors(tmp_path, batched_boxes):
+    labels = torch.zeros(50, dtype=torch.long)
+    with pytest.raises(ValueError):
+        write_yolo([tmp_path / "0.txt"], batched_boxes, labels)
+    (tmp_path / "bad.txt").write_text("0 0.5 0.5 0.1\n")
+    with pytest.raises(ValueError):
+        read_yolo([tmp_path / "bad.txt"])
+    # Six columns, 30 values in all, which used to be read as 6 boxes.
+    (tmp_path / "scores.txt").write_text("0 0.5 0.5 0.1 0.1 0.9\n" * 5)
+    with pytest.raises(ValueError):
+        read_yolo([tmp_path / "scores.txt"])
+    (tmp_path / "text.txt").write_text("0 0.5 0.5 0.1 x\n")
+    with pytest.raises(ValueError):
+        read_yolo([tmp_path / "text.txt"])
+    flipped = BatchedTorchBoxes.from_packed(batched_boxes._boxes.clone(), [50])
+    flipped.flip_origin(100)
+    with pytest.raises(ValueError):
+        write_coco(tmp_path / "coco.json", flipped, labels)
+
+
+def test_read_voc_ignores_owner_and_parts(tmp_path):
+    (tmp_path / "0.xml").write_text(
+        "<annotation>\n<owner><name>Someone</name></owner>\n"
+        "<object><name> person </name><bndbox><xmin>1</xmin><ymin>2</ymin>"
+        "<xmax>3</xmax><ymax>4</ymax></bndbox>"
+        "<part><name>head</name><bndbox><xmin>1</xmin><ymin>2</ymin>"
+        "<xmax>2</xmax><ymax>3</ymax></bndbox></part></object>\n"
+        "<object><name>a&amp;b</name><difficult>0</difficult><bndbox><xmin>5</xmin>"
+        "<ymin>6</ymin><xmax>7.5</xmax><ymax>8</ymax></bndbox></object>\n</annotation>\n"
+    )
+    (tmp_path / "1.xml").write_text("<annotation></annotation>")
+    boxes, labels, classes = read_voc([tmp_path / "0.xml", tmp_path / "1.xml"])
+    assert classes == ["person", "a&b"] and labels.tolist() == [0, 1]
+    assert boxes.lengths.tolist() == [2, 0]
+    assert boxes.to_two_corners().boxes_.tolist() == [[1, 2, 3, 4], [5, 6, 7.5, 8]]
@@ -0,0 +1,118 @@
+# type: ignore
+import math
+
+import pytest
+import torch
+
+from anyboxes.implementations.origin import Origin
+from anyboxes.implementations.torch.augmentations import (
+    Affine,
+    Compose,
+    HorizontalFlip,
+    Letterbox,
+    RandomAffine,
+    RandomCrop,
+    Transform,
+    VerticalFlip,
+    warp_boxes,
+)
+from anyboxes.implementations.torch.batched import BatchedTorchBoxes
+from anyboxes.implementations.torch.boxes import TorchBoxes
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor")
+def test_pipeline_is_fused(random_two_corners_tensor):
+    boxes = TorchBoxes.from_two_corners(random_two_corners_tensor).clip_to_image(50, 40)
+    transforms = [HorizontalFlip(1.0), RandomCrop(30, 20), Letterbox(60, 60)]
+    fused, fused_indices = Compose(transforms)(
+        boxes, 50, 40, generator=torch.Generator().manual_seed(0)
+    )
+
+    generator = torch.Generator().manual_seed(0)
+    indices, width, height = torch.arange(len(boxes)), 50, 40
+    for transform in transforms:
+        matrix, width, height, window = transform.sample(
+            width, height, generator=generator
+        )
+        boxes, kept = warp_boxes(boxes, matrix, window)
+        indices = indices[kept]
+    assert torch.equal(fused_indices, indices)
+    torch.testing.assert_close(fused._boxes, boxes._boxes)
+
+
+def test_transforms():
+    boxes = TorchBoxes.from_two_corners(torch.tensor([[10.0, 20.0, 30.0, 60.0]]))
+    flipped, _ = Compose([HorizontalFlip(1.0), VerticalFlip(1.0)])(boxes, 100, 80)
+    assert flipped._boxes.tolist() == [[70.0, 20.0, 90.0, 60.0]]
+    letterboxed, _ = Letterbox(50, 50)(boxes, 100, 80)
+    assert letterboxed._boxes.tolist() == [[5.0, 15.0, 15.0, 35.0]]
+    assert Letterbox(50, 50).sample(100, 80)[3].tolist() == [[0.0, 5.0, 50.0, 45.0]]
+
+    # Rotation of 45 degrees around the origin, then translation along x.
+    c = math.cos(math.pi / 4)
+    rotated, _ = Affine([[c, c, 50.0], [-c, c, 0.0]])(
+        TorchBoxes.from_two_corners(torch.tensor([[0.0, 10.0, 10.0, 20.0]])), 100, 100
+    )
+    torch.testing.assert_close(
+        rotated._boxes, torch.tensor([[50 + 10 * c, 0.0, 50 + 30 * c, 20 * c]])
+    )
+    with pytest.raises(ValueError):
+        Affine(torch.eye(3))(TorchBoxes(boxes._boxes, Origin.BOTTOM_LEFT), 100, 80)
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor")
+def test_crop_filters_boxes_by_retained_area(random_two_corners_tensor):
+    boxes = TorchBoxes.from_two_corners(random_two_corners_tensor, dtype=torch.int32)
+    generator = torch.Generator().manual_seed(1)
+    (matrix,), _, _, window = RandomCrop(25, 25).sample(50, 50, generator=generator)
+    assert window.tolist() == [[0.0, 0.0, 25.0, 25.0]]
+    cropped, indices = warp_boxes(boxes, matrix, window, min_area_ratio=0.5)
+    assert cropped._boxes.dtype == torch.int32 and len(cropped) == len(indices)
+
+    translated = random_two_corners_tensor + matrix[:2, 2].repeat(2).float()
+    clipped = translated.clamp(0, 25)
+    areas = (translated[:, 2:] - translated[:, :2]).prod(dim=1)
+    clipped_areas = (clipped[:, 2:] - clipped[:, :2]).prod(dim=1)
+    expected = ((clipped_areas > 0) & (clipped_areas >= areas / 2)).nonzero()[:, 0]
+    assert 0 < len(expected) < len(boxes)
+    assert torch.equal(indices, expected)
+    assert torch.equal(cropped._boxes, clipped[expected].int())
+
+
+@pytest.mark.usefixtures("batched_boxes")
+def test_batched_pipeline(batched_boxes):
+    pipeline = Compose([RandomAffine(30.0, 0.1, (0.5, 1.5), 10.0), HorizontalFlip()])
+    widths = torch.tensor([60.0, 80.0, 40.0])
+    matrices, width, _, windows = pipeline.sample(
+        widths, 50, 3, torch.Generator().manual_seed(0)
+    )
+    assert matrices.shape == (3, 3, 3) and torch.equal(width, widths)
+    warped, indices = warp_boxes(batched_boxes, matrices, windows)
+    assert isinstance(warped, BatchedTorchBoxes)
+    image_indices = batched_boxes.image_indices[indices]
+    assert (
+        warped.lengths.tolist() == torch.bincount(image_indices, minlength=3).tolist()
+    )
+    for index in (0, 2):
+        image = batched_boxes.get_image(index)
+        expected, _ = warp_boxes(image, matrices[index], windows[index])
+        torch.testing.assert_close(warped.get_image(index)._boxes, expected._boxes)
+    assert (warped._boxes[:, 2] <= widths[image_indices]).all()
+
+    with pytest.raises(ValueError):
+        warp_boxes(batched_boxes, matrices[:2], windows[:2])
+
+
+def test_transforms_implement_get_matrices():
+    with pytest.raises(TypeError):
+        Transform()
+    pipeline = Compose(
+        [RandomCrop(30, 20), Compose([HorizontalFlip(), Letterbox(60, 60)])]
+    )
+    size = torch.tensor([50.0, 80.0])
+    matrices, width, height = pipeline.get_matrices(
+        size, size, torch.Generator().manual_seed(0)
+    )
+    expected = pipeline.sample(size, size, 2, torch.Generator().manual_seed(0))
+    assert torch.equal(matrices, expected[0]) and torch.equal(width, expected[1])
+    assert height.tolist() == [60.0, 60.0]
@@ -0,0 +1,79 @@
+# type: ignore
+import pytest
+import torch
+
+from anyboxes import BatchedTorchBoxes, TorchBoxes
+
+
+@pytest.mark.usefixtures("batched_boxes", "random_two_corners_tensor")
+def test_conversions_match_per_image(batched_boxes, random_two_corners_tensor):
+    expected = torch.cat(
+        [
+            TorchBoxes.from_two_corners(boxes).to_center().as_tensor
+            for boxes in random_two_corners_tensor.split([20, 0, 30])
+        ]
+    )
+    assert torch.equal(batched_boxes.to_center().as_tensor, expected)
+
+
+@pytest.mark.usefixtures("batched_boxes", "random_two_corners_tensor")
+def test_images_are_views(batched_boxes, random_two_corners_tensor):
+    image = batched_boxes.get_image(2)
+    assert len(image) == 30
+    assert image._boxes.data_ptr() == batched_boxes._boxes[20].data_ptr()
+    assert [len(boxes) for boxes in batched_boxes.split()] == [20, 0, 30]
+    assert batched_boxes.get_image(slice(1, 3)).lengths.tolist() == [0, 30]
+
+
+@pytest.mark.usefixtures("batched_boxes", "random_two_corners_tensor")
+def test_flip_origin_per_image(batched_boxes, random_two_corners_tensor):
+    batched_boxes.flip_origin(torch.tensor([60, 70, 80]))
+    flipped = random_two_corners_tensor.clone()
+    flipped[:20, 1::2] = 60 - flipped[:20, 1::2]
+    flipped[20:, 1::2] = 80 - flipped[20:, 1::2]
+    assert torch.equal(batched_boxes._boxes, flipped)
+    assert batched_boxes.origin == "bottom-left"
+    with pytest.raises(ValueError):
+        batched_boxes.flip_origin(torch.tensor([1, 1, 1]))
+
+
+@pytest.mark.usefixtures("batched_boxes", "random_two_corners_tensor")
+def test_merged_masks_per_image(batched_boxes, random_two_corners_tensor):
+    masks = batched_boxes.get_binary_mask(64, 64, merge=True)
+    assert masks.shape == (3, 64, 64)
+    assert torch.equal(
+        masks[0],
+        TorchBoxes.from_two_corners(random_two_corners_tensor[:20]).get_binary_mask(
+            64, 64, merge=True
+        ),
+    )
+    assert masks[1].all()
+
+    # Images without boxes get masks without zeros, even when no image has boxes.
+    empty = BatchedTorchBoxes.from_list([torch.zeros(0, 4), torch.zeros(0, 4)])
+    masks = empty.get_binary_mask(4, 4, merge=True)
+    assert masks.shape == (2, 4, 4) and masks.all()
+    assert empty.get_binary_mask(4, 4).shape == (0, 4, 4)
+
+
+@pytest.mark.usefixtures("batched_boxes", "random_two_corners_tensor")
+def test_padded_tensor(batched_boxes, random_two_corners_tensor):
+    padded = batched_boxes.to_two_corners().as_padded_tensor
+    assert padded.shape == (3, 30, 4)
+    assert torch.equal(padded[0, :20], random_two_corners_tensor[:20])
+    assert not padded[0, 20:].any() and not padded[1].any()
+    assert batched_boxes.padding_mask.sum(dim=1).tolist() == [20, 0, 30]
+
+
+@pytest.mark.usefixtures("detections")
+def test_nms_per_image(detections):
+    boxes, scores, _ = detections
+    batched_boxes = BatchedTorchBoxes.from_packed(boxes, [100, 200])
+    keep = batched_boxes.nms(scores, iou_threshold=0.3)
+    expected = torch.cat(
+        [
+            TorchBoxes.from_two_corners(boxes[:100]).nms(scores[:100], 0.3),
+            TorchBoxes.from_two_corners(boxes[100:]).nms(scores[100:], 0.3) + 100,
+        ]
+    )
+    assert torch.equal(keep.sort().values, expected.sort().values)
@@ -144,3 +144,21 @@ def test_bottom_left_origin_is_conserved(bottom_left_tensor, image_height):
     b.flip_origin(image_height)
     b.flip_origin(image_height)
     assert torch.equal(b.to_bottom_left_corner().as_tensor, bottom_left_tensor)
+
+
+@pytest.mark.usefixtures("top_left_tensor", "two_corners_tensor")
+def test_packed_storage_corners_are_views(top_left_tensor, two_corners_tensor):
+    b = TorchBoxes.from_top_left_corner(top_left_tensor)
+    c_1, _, c_3, _ = b.corners_coordinates
+    assert torch.equal(
+        torch.stack([c_1.x, c_1.y, c_3.x, c_3.y], dim=1), two_corners_tensor
+    )
+    assert c_1.x.data_ptr() == b._boxes.data_ptr()
+
+
+@pytest.mark.usefixtures("top_left_tensor", "image_height")
+def test_flip_origin_does_not_mutate_input(top_left_tensor, image_height):
+    expected = top_left_tensor.clone()
+    b = TorchBoxes.from_top_left_corner(top_left_tensor)
+    b.flip_origin(image_height)
+    assert torch.equal(top_left_tensor, expected)
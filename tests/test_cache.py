@@ -0,0 +1,65 @@
+# type: ignore
+import pytest
+import torch
+
+from anyboxes.implementations.torch.boxes import TorchBoxes
+
+
+@pytest.mark.usefixtures("center_tensor", "squared_center_data")
+def test_representations_are_cached(center_tensor, squared_center_data):
+    b = TorchBoxes.from_center(center_tensor)
+    boxes = b.to_center().boxes_
+    as_dict, as_tuple = b.as_dict, b.as_tuple
+    assert b.to_center().boxes_ is boxes
+    assert b.to_center(torch.float64).boxes_ is not boxes
+    assert b.as_dict is as_dict and b.as_tuple is as_tuple
+    assert as_tuple[-2:] == (center_tensor[:, 2].tolist(), center_tensor[:, 3].tolist())
+
+    b.square()
+    assert b.to_center().boxes_.tolist() == squared_center_data
+    assert b.as_dict is not as_dict and b.as_tuple is not as_tuple
+
+
+@pytest.mark.usefixtures("two_corners_tensor")
+def test_cache_follows_mutations_of_views(two_corners_tensor):
+    b = TorchBoxes.from_two_corners(two_corners_tensor)
+    before = b.to_two_corners().boxes_.clone()
+    b.flip_origin(100)
+    assert b.origin == "bottom-left"
+    assert not torch.equal(b.to_two_corners().boxes_, before)
+
+    flipped = b.to_two_corners().boxes_.clone()
+    b[:1].flip_origin(100)
+    assert not torch.equal(b.to_two_corners().boxes_, flipped)
+    assert torch.equal(b.to_two_corners().boxes_[:1], before[:1])
+
+
+@pytest.mark.usefixtures("two_corners_tensor", "squared_center_data")
+def test_cache_under_inference_mode(two_corners_tensor, squared_center_data):
+    with torch.inference_mode():
+        b = TorchBoxes.from_two_corners(two_corners_tensor)
+        as_dict = b.as_dict
+        assert b.as_dict is as_dict
+        b.square()
+        assert b.as_dict is not as_dict
+        assert b.to_center().boxes_.tolist() == squared_center_data
+        before = b.to_two_corners().boxes_.clone()
+        b.translate(1, 2)
+        torch.testing.assert_close(
+            b.to_two_corners().boxes_, before + torch.tensor([1.0, 2.0, 1.0, 2.0])
+        )
+
+
+@pytest.mark.usefixtures("two_corners_tensor")
+def test_shared_exports_are_read_only(two_corners_tensor):
+    b = TorchBoxes.from_two_corners(two_corners_tensor).to_two_corners()
+    assert not b.as_numpy.flags.writeable
+    assert b.get_numpy(copy=True).flags.writeable
+
+
+def test_cache_follows_mutations_of_exports():
+    b = TorchBoxes.from_two_corners(torch.tensor([[1.0, 2.0, 5.0, 6.0]]))
+    b.to_two_corners().as_tensor.add_(100)
+    assert b.to_two_corners().as_tensor.tolist() == [[1.0, 2.0, 5.0, 6.0]]
+    b.to_center(torch.float64).get_tensor(dtype=None).zero_()
+    assert b.to_center(torch.float64).boxes_.tolist() == [[3.0, 4.0, 4.0, 4.0]]
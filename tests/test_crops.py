@@ -0,0 +1,81 @@
+# type: ignore
+import pytest
+import torch
+import torch.nn.functional as F
+
+from anyboxes.implementations.origin import Origin
+from anyboxes.implementations.torch.batched import BatchedTorchBoxes
+from anyboxes.implementations.torch.boxes import TorchBoxes
+
+
+@pytest.fixture
+def images():
+    generator = torch.Generator().manual_seed(0)
+    return torch.randint(0, 256, (3, 2, 30, 40), generator=generator, dtype=torch.uint8)
+
+
+@pytest.mark.usefixtures("images")
+def test_crops_of_pixel_aligned_boxes(images):
+    boxes = TorchBoxes.from_two_corners(
+        torch.tensor([[4, 2, 12, 10], [30, 20, 38, 28]])
+    )
+    crops = boxes.crop_from(images[0], 8)
+    assert crops.shape == (2, 2, 8, 8) and crops.dtype == torch.float32
+    # Samples fall on pixel centers, up to the rounding of the float32 grid.
+    expected = torch.stack([images[0, :, 2:10, 4:12], images[0, :, 20:28, 30:38]])
+    torch.testing.assert_close(crops, expected.float(), rtol=0, atol=1e-3)
+
+    # Halving the size averages 2x2 pixels, bottom-left boxes are flipped.
+    flipped = TorchBoxes(boxes._boxes.clone(), Origin.TOP_LEFT).flip_origin(30)
+    torch.testing.assert_close(
+        flipped.crop_from(images[0].double(), (4, 4))[0],
+        F.avg_pool2d(images[0, :, 2:10, 4:12].double(), 2),
+    )
+
+
+@pytest.mark.usefixtures("images")
+def test_crops_are_interpolated(images):
+    images = images.float()
+    boxes = torch.tensor([[2.5, 1.2, 20.3, 9.9], [-4.0, -3.0, 10.0, 11.0]])
+    crops = TorchBoxes.from_two_corners(boxes).crop_from(images[:1], (5, 7))
+
+    for box, crop in zip(boxes, crops):
+        steps = (torch.arange(7) + 0.5) / 7, (torch.arange(5) + 0.5) / 5
+        x = box[0] + steps[0] * (box[2] - box[0])
+        y = box[1] + steps[1] * (box[3] - box[1])
+        grid = torch.stack(torch.meshgrid(x / 20 - 1, y / 15 - 1, indexing="xy"), -1)
+        expected = F.grid_sample(images[:1], grid[None], align_corners=False)
+        torch.testing.assert_close(crop, expected[0], rtol=1e-5, atol=1e-3)
+    # Pixels outside of the image are zeros.
+    assert crops[1].max() > 0 and (crops[1, :, 0, 0] < images[0, :, 0, 0] / 4).all()
+    sampled = TorchBoxes.from_two_corners(boxes).crop_from(
+        images[0], 4, sampling_ratio=3
+    )
+    dense = TorchBoxes.from_two_corners(boxes).crop_from(images[0], 12)
+    torch.testing.assert_close(sampled, F.avg_pool2d(dense, 3))
+
+
+@pytest.mark.usefixtures("images", "random_two_corners_tensor")
+def test_batched_crops(images, random_two_corners_tensor):
+    batch = BatchedTorchBoxes.from_packed(random_two_corners_tensor, [20, 0, 30])
+    crops = batch.crop_from(images, (6, 5), sampling_ratio=2)
+    assert crops.shape == (50, 2, 6, 5)
+    for index in (0, 2):
+        start, end = batch.offsets[index], batch.offsets[index + 1]
+        expected = batch.get_image(index).crop_from(
+            images[index], (6, 5), sampling_ratio=2
+        )
+        torch.testing.assert_close(crops[start:end], expected)
+
+    boxes = TorchBoxes.from_two_corners(random_two_corners_tensor)
+    torch.testing.assert_close(
+        boxes.crop_from(images, (6, 5), batch.offsets, sampling_ratio=2), crops
+    )
+    with pytest.raises(ValueError):
+        boxes.crop_from(images, 4, [0, 20, 40])
+    with pytest.raises(ValueError):
+        boxes.crop_from(images, 4, [0, 10, 20, 30, 50])
+    with pytest.raises(ValueError):
+        boxes.crop_from(images, 4, [10, 20, 50])
+    with pytest.raises(ValueError):
+        boxes.crop_from(images, 4, [0, 30, 20, 50])
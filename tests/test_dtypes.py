@@ -0,0 +1,68 @@
+# type: ignore
+import numpy as np
+import pytest
+import torch
+
+from anyboxes.implementations.torch.boxes import TorchBoxes
+from anyboxes.implementations.torch.functional import box_centers, convert_boxes
+
+
+@pytest.mark.usefixtures("center_tensor", "top_left_tensor")
+@pytest.mark.parametrize("dtype", [torch.float16, torch.bfloat16, torch.float64])
+def test_floating_storage(center_tensor, top_left_tensor, dtype):
+    b = TorchBoxes.from_center(center_tensor.to(dtype))
+    assert b._boxes.dtype == dtype
+    assert b.to_top_left_corner().boxes_.dtype == dtype
+    assert torch.equal(b.get_tensor(dtype=None), top_left_tensor.to(dtype))
+    assert b.get_tensor().dtype == torch.float32
+    assert b.square()._boxes.dtype == dtype
+    assert b.flip_origin(100)._boxes.dtype == dtype
+
+
+@pytest.mark.usefixtures("top_left_tensor", "center_tensor")
+def test_integer_storage(top_left_tensor, center_tensor):
+    b = TorchBoxes.from_top_left_corner(top_left_tensor.to(torch.int32), torch.int32)
+    assert b._boxes.dtype == torch.int32
+    assert torch.equal(b.to_center().boxes_, center_tensor)
+    assert torch.equal(
+        b.to_top_left_corner(torch.int32).boxes_, top_left_tensor.to(torch.int32)
+    )
+    assert b.get_numpy(dtype=None).dtype == np.int32
+    assert b.square()._boxes.dtype == torch.int32
+    b = TorchBoxes.from_two_corners(torch.tensor([[0, 0, 3, 2]]), dtype=torch.int32)
+    assert b.flip_origin(10)._boxes.tolist() == [[0, 10, 3, 8]]
+    with pytest.raises(ValueError):
+        TorchBoxes.from_two_corners(b._boxes, copy=False, dtype=torch.float32)
+
+
+def test_half_precision_centers_dont_overflow():
+    boxes = torch.tensor([[40000.0, 0.0, 60000.0, 2.0]], dtype=torch.float16)
+    assert box_centers(boxes)[0, 0] == torch.tensor(50000.0, dtype=torch.float16)
+    center = convert_boxes(boxes, "two-corners", "center")
+    assert center.dtype == torch.float16
+    assert torch.isfinite(center).all()
+
+
+def test_integer_rounding_keeps_sizes():
+    centers = torch.tensor([[5.0, 5.0, 3.0, 3.0], [6.0, 6.0, 3.0, 3.0]])
+    b = TorchBoxes.from_center(centers, dtype=torch.int32)
+    assert b._boxes.tolist() == [[4, 4, 7, 7], [5, 5, 8, 8]]
+    b = TorchBoxes.from_two_corners(torch.tensor([[1, 2, 4, 4]]), dtype=torch.int32)
+    assert b.translate(0.5, -0.5)._boxes.tolist() == [[2, 2, 5, 4]]
+    assert b.translate(0.5, 0.5)._boxes.tolist() == [[3, 3, 6, 5]]
+
+
+@pytest.mark.parametrize("dtype", [torch.int32, torch.int64])
+def test_large_integer_boxes_are_exact(dtype):
+    boxes = torch.tensor([[2**30 + 1, 0, 2**30 + 3, 2]])
+    b = TorchBoxes.from_two_corners(boxes, dtype=dtype)
+    assert b.translate(1, 0)._boxes.tolist() == [[2**30 + 2, 0, 2**30 + 4, 2]]
+    translated = b.translate(torch.tensor([-1]), 0.5)._boxes.tolist()
+    assert translated == [[2**30 + 1, 1, 2**30 + 3, 3]]
+    assert b.clip_to_image(2**30 + 2, 2)._boxes.tolist() == [
+        [2**30 + 1, 1, 2**30 + 2, 2]
+    ]
+    assert b.flip_origin(4)._boxes.tolist() == [[2**30 + 1, 3, 2**30 + 2, 2]]
+    b = TorchBoxes.from_center(torch.tensor([[2**30 + 2, 1, 2, 2]]), dtype=dtype)
+    assert b._boxes.tolist() == [[2**30 + 1, 0, 2**30 + 3, 2]]
+    assert b._boxes.dtype == dtype
@@ -1,4 +1,5 @@
 import pytest
+import torch
 
 from anyboxes._errors import MissingToMethodError
 from anyboxes.implementations.torch.boxes import TorchBoxes
@@ -54,3 +55,9 @@ def test_missing_to_method_as_tensor(top_left_tensor):
     ):
         b = TorchBoxes.from_top_left_corner(top_left_tensor)
         b.as_tensor
+
+
+@pytest.mark.parametrize("shape", [(4,), (2, 3), (2, 2, 4)])
+def test_invalid_boxes_shape(shape):
+    with pytest.raises(ValueError, match="Boxes must be of size"):
+        TorchBoxes.from_center(torch.zeros(shape))
@@ -0,0 +1,109 @@
+# type: ignore
+import subprocess
+import sys
+
+import pytest
+import torch
+
+from anyboxes.implementations.box_format import BoxFormat
+from anyboxes.implementations.torch.functional import (
+    convert_boxes,
+    flip_boxes,
+    from_two_corners,
+    square_boxes,
+    to_two_corners,
+)
+
+
+@pytest.mark.usefixtures("top_left_tensor", "center_tensor")
+def test_convert_top_left_corner_to_center(top_left_tensor, center_tensor):
+    boxes = convert_boxes(top_left_tensor, "top-left-corner", "center")
+    assert torch.equal(boxes, center_tensor)
+
+
+@pytest.mark.usefixtures("center_tensor", "bottom_left_tensor")
+def test_convert_center_to_bottom_left_corner(center_tensor, bottom_left_tensor):
+    boxes = convert_boxes(center_tensor, BoxFormat.CENTER, BoxFormat.BOTTOM_LEFT_CORNER)
+    assert torch.equal(boxes, bottom_left_tensor)
+
+
+@pytest.mark.usefixtures("bottom_left_tensor", "two_corners_tensor")
+def test_convert_bottom_left_corner_to_two_corners(
+    bottom_left_tensor, two_corners_tensor
+):
+    boxes = convert_boxes(
+        bottom_left_tensor, BoxFormat.BOTTOM_LEFT_CORNER, BoxFormat.TWO_CORNERS
+    )
+    assert torch.equal(boxes, two_corners_tensor)
+
+
+@pytest.mark.usefixtures("two_corners_tensor")
+def test_convert_same_format_returns_a_copy(two_corners_tensor):
+    boxes = convert_boxes(two_corners_tensor, "two-corners", "two-corners")
+    assert torch.equal(boxes, two_corners_tensor)
+    assert boxes.data_ptr() != two_corners_tensor.data_ptr()
+
+
+@pytest.mark.usefixtures("top_left_tensor", "center_tensor")
+def test_convert_integer_boxes(top_left_tensor, center_tensor):
+    boxes = convert_boxes(top_left_tensor.to(torch.int), "top-left-corner", "center")
+    assert boxes.dtype == torch.get_default_dtype()
+    assert torch.equal(boxes, center_tensor)
+
+
+COMPILE_SCRIPT = """
+import torch
+
+from anyboxes.implementations.torch.functional import (
+    convert_boxes,
+    flip_boxes,
+    square_boxes,
+)
+
+
+def decode(boxes, height):
+    boxes = convert_boxes(boxes, "center", "two-corners")
+    return flip_boxes(square_boxes(boxes), height)
+
+
+boxes = torch.rand(8, 4)
+compiled = torch.compile(decode, fullgraph=True, backend="eager")
+torch.testing.assert_close(compiled(boxes, 40.0), decode(boxes, 40.0))
+"""
+
+FORMATS = ["top-left-corner", "bottom-left-corner", "two-corners", "center"]
+
+
+def decode(boxes: torch.Tensor, height: float) -> torch.Tensor:
+    boxes = convert_boxes(boxes, "center", "two-corners")
+    return flip_boxes(square_boxes(boxes), height)
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor")
+@pytest.mark.parametrize("in_format", FORMATS)
+@pytest.mark.parametrize("out_format", FORMATS)
+def test_elementwise_conversions_match_matrices(
+    random_two_corners_tensor, in_format, out_format
+):
+    boxes = convert_boxes(random_two_corners_tensor, "two-corners", in_format)
+    torch.testing.assert_close(
+        from_two_corners(to_two_corners(boxes, in_format), out_format),
+        convert_boxes(boxes, in_format, out_format),
+    )
+
+
+@pytest.mark.filterwarnings("ignore:`torch.jit.script` is deprecated")
+@pytest.mark.usefixtures("center_tensor")
+def test_script(center_tensor):
+    scripted = torch.jit.script(decode)
+    torch.testing.assert_close(
+        scripted(center_tensor, 40.0), decode(center_tensor, 40.0)
+    )
+    with pytest.raises(torch.jit.Error):
+        torch.jit.script(convert_boxes)(center_tensor, "center", "corners")
+
+
+def test_compile_without_graph_breaks():
+    # Dynamo is run in a fresh interpreter, as importing its compilers after
+    # Tensorflow crashes.
+    subprocess.run([sys.executable, "-c", COMPILE_SCRIPT], check=True)
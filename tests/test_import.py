@@ -0,0 +1,39 @@
+# type: ignore
+import subprocess
+import sys
+
+IMPORT_TIME_BUDGET = 0.5
+
+IMPORT_SCRIPT = """
+import sys
+import time
+
+start = time.perf_counter()
+import anyboxes
+from anyboxes._errors import MissingToMethodError
+from anyboxes.implementations.origin import Origin
+
+print(time.perf_counter() - start)
+print(sorted(m for m in ("torch", "jax", "tensorflow") if m in sys.modules))
+"""
+
+
+def test_import_is_lazy():
+    output = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.splitlines()
+    assert float(output[0]) < IMPORT_TIME_BUDGET
+    assert output[1] == "[]"
+
+
+def test_lazy_attributes():
+    import anyboxes
+    from anyboxes.implementations.torch.boxes import TorchBoxes
+
+    assert anyboxes.TorchBoxes is TorchBoxes
+    assert isinstance(anyboxes.__version__, str)
+    assert "NumpyBoxes" in dir(anyboxes)
+    assert dir(anyboxes).count("TorchBoxes") == 1
@@ -0,0 +1,76 @@
+# type: ignore
+import pytest
+import torch
+
+from anyboxes.implementations.torch.batched import BatchedTorchBoxes
+from anyboxes.implementations.torch.boxes import TorchBoxes
+from anyboxes.implementations.torch.instrumentation import (
+    disable_instrumentation,
+    enable_instrumentation,
+    format_summary,
+    get_summary,
+    instrumented,
+    is_instrumentation_enabled,
+    reset_summary,
+)
+
+
+@pytest.fixture(autouse=True)
+def clean_instrumentation():
+    reset_summary()
+    yield
+    disable_instrumentation()
+    reset_summary()
+
+
+def test_instrumentation_is_removed_when_disabled():
+    to_center, size = TorchBoxes.to_center, TorchBoxes.__dict__["size"]
+    enable_instrumentation()
+    assert is_instrumentation_enabled()
+    assert TorchBoxes.to_center is not to_center
+    disable_instrumentation()
+    assert TorchBoxes.to_center is to_center
+    assert TorchBoxes.__dict__["size"] is size
+    TorchBoxes.from_two_corners(torch.zeros(1, 4)).to_center()
+    assert get_summary() == {}
+
+
+def test_instrumentation_records_calls():
+    boxes = torch.rand(50, 4) * 10
+    boxes[:, 2:] += boxes[:, :2]
+    with instrumented():
+        b = TorchBoxes.from_two_corners(boxes)
+        b.flip_origin(100).to_center()
+        b.to_center()
+        b.as_tensor
+        batch = BatchedTorchBoxes.from_packed(boxes, [20, 0, 30])
+        batch.flip_origin(torch.tensor([100, 100, 100]))
+        # `torch.profiler.profile` imports Inductor, which crashes after Tensorflow.
+        with torch.autograd.profiler.profile() as prof:
+            batch.get_image(0)
+    assert not is_instrumentation_enabled()
+
+    summary = get_summary()
+    assert summary["TorchBoxes.to_center"]["calls"] == 2
+    assert summary["TorchBoxes.as_tensor"]["calls"] == 1
+    creation = summary["TorchBoxes.from_two_corners"]
+    assert creation["tensors"] == 1 and creation["allocated_bytes"] == 50 * 4 * 4
+    flip = summary["TorchBoxes.flip_origin"]
+    assert flip["syncs"] >= 1 and flip["tensors"] > 0
+    assert flip["total_time"] >= flip["max_time"] > 0
+    assert summary["BatchedTorchBoxes.flip_origin"]["calls"] == 1
+    assert summary["BatchedTorchBoxes.image_indices"]["calls"] == 1
+    assert "BatchedTorchBoxes.get_image" in {
+        event.name for event in prof.function_events
+    }
+    assert "TorchBoxes.flip_origin" in format_summary()
+
+
+def test_instrumentation_with_tensorflow():
+    pytest.importorskip("tensorflow")
+    with instrumented():
+        b = TorchBoxes.from_two_corners(torch.tensor([[0.0, 0.0, 2.0, 4.0]]))
+        b.flip_origin(10)
+    summary = get_summary()
+    assert summary["TorchBoxes.from_two_corners"]["tensors"] == 1
+    assert summary["TorchBoxes.flip_origin"]["syncs"] >= 1
@@ -0,0 +1,72 @@
+# type: ignore
+import jax.numpy as jnp
+import numpy as np
+import pytest
+import tensorflow as tf
+import torch
+
+from anyboxes.implementations.torch.boxes import TorchBoxes
+
+
+@pytest.mark.usefixtures("top_left_tensor")
+def test_exports_share_memory(top_left_tensor):
+    b = TorchBoxes.from_top_left_corner(top_left_tensor).to_top_left_corner()
+    numpy_boxes, array = b.as_numpy, b.as_array
+    assert array.unsafe_buffer_pointer() == b.boxes_.data_ptr()
+    b.boxes_[0, 0] = 99
+    assert numpy_boxes[0, 0] == 99
+    assert b.get_numpy(copy=True)[0, 0] == 99
+    b.boxes_[0, 0] = 0
+    assert b.get_array(copy=True)[0, 0] == 0
+
+
+@pytest.mark.usefixtures("top_left_tensor")
+def test_export_copy_flag(top_left_tensor):
+    b = TorchBoxes.from_top_left_corner(top_left_tensor.double()).to_top_left_corner()
+    assert b.get_numpy().dtype == np.float32
+    assert b.get_tensor().dtype == torch.float32
+    for method in [b.get_numpy, b.get_array, b.get_tf_tensor, b.get_tensor]:
+        with pytest.raises(ValueError):
+            method(copy=False)
+    b = TorchBoxes.from_top_left_corner(top_left_tensor).to_top_left_corner()
+    assert b.get_tensor(copy=False) is not None
+    assert b.get_tensor(copy=True).data_ptr() != b.boxes_.data_ptr()
+
+
+@pytest.mark.usefixtures("top_left_tensor")
+def test_from_foreign_arrays(top_left_tensor):
+    expected = TorchBoxes.from_top_left_corner(top_left_tensor).to_center().as_tensor
+    for boxes in [
+        top_left_tensor.numpy(),
+        jnp.asarray(top_left_tensor.numpy()),
+        tf.convert_to_tensor(top_left_tensor.numpy()),
+    ]:
+        b = TorchBoxes.from_top_left_corner(boxes).to_center()
+        assert torch.equal(b.as_tensor, expected)
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor")
+def test_from_two_corners_without_copy(random_two_corners_tensor):
+    numpy_boxes = random_two_corners_tensor.numpy().copy()
+    b = TorchBoxes.from_two_corners(numpy_boxes, copy=False)
+    b.flip_origin(100)
+    assert numpy_boxes[0, 1] == 100 - random_two_corners_tensor[0, 1].item()
+    with pytest.raises(ValueError):
+        TorchBoxes.from_two_corners(np.zeros((2, 4), dtype=np.int64), copy=False)
+    b = TorchBoxes.from_two_corners(np.zeros((2, 4), dtype=np.int64), copy=None)
+    assert b._boxes.is_floating_point()
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor")
+def test_from_arrays_needing_a_copy(random_two_corners_tensor):
+    flipped = np.flipud(random_two_corners_tensor.numpy().copy())
+    b = TorchBoxes.from_two_corners(flipped, copy=None)
+    assert torch.equal(b._boxes, random_two_corners_tensor.flip(0))
+    flipped.flags.writeable = False
+    assert torch.equal(TorchBoxes.from_two_corners(flipped)._boxes, b._boxes)
+
+    array = jnp.asarray(random_two_corners_tensor.numpy())
+    with pytest.raises(ValueError):
+        TorchBoxes.from_two_corners(array, copy=False)
+    TorchBoxes.from_two_corners(array, copy=None).flip_origin(100)
+    np.testing.assert_array_equal(array, random_two_corners_tensor.numpy())
@@ -0,0 +1,118 @@
+# type: ignore
+import jax
+import jax.numpy as jnp
+import numpy as np
+import pytest
+import torch
+
+from anyboxes.implementations.jax.boxes import JaxBoxes
+from anyboxes.implementations.jax.functional import (
+    build_union_binary_masks,
+    compute_overlaps,
+    convert_boxes,
+)
+from anyboxes.implementations.torch.boxes import TorchBoxes
+
+FORMATS = {
+    "top_left_data": ("from_top_left_corner", "to_top_left_corner"),
+    "bottom_left_data": ("from_bottom_left_corner", "to_bottom_left_corner"),
+    "center_data": ("from_center", "to_center"),
+    "two_corners_data": ("from_two_corners", "to_two_corners"),
+}
+
+
+@pytest.mark.parametrize("in_data", FORMATS)
+@pytest.mark.parametrize("out_data", FORMATS)
+def test_conversions(request, in_data, out_data):
+    from_method, _ = FORMATS[in_data]
+    _, to_method = FORMATS[out_data]
+    b = getattr(JaxBoxes, from_method)(jnp.array(request.getfixturevalue(in_data)))
+    assert jnp.array_equal(
+        getattr(b, to_method)().as_array, jnp.array(request.getfixturevalue(out_data))
+    )
+
+
+@pytest.mark.usefixtures(
+    "center_data",
+    "squared_center_data",
+    "top_left_data",
+    "top_left_data_with_bottom_left_origin",
+    "image_height",
+)
+def test_square_and_flip_origin(
+    center_data,
+    squared_center_data,
+    top_left_data,
+    top_left_data_with_bottom_left_origin,
+    image_height,
+):
+    b = JaxBoxes.from_center(jnp.array(center_data)).square()
+    assert jnp.array_equal(b.to_center().as_array, jnp.array(squared_center_data))
+    b = JaxBoxes.from_top_left_corner(jnp.array(top_left_data))
+    b.flip_origin(image_height).to_top_left_corner()
+    assert jnp.array_equal(b.as_array, jnp.array(top_left_data_with_bottom_left_origin))
+    assert b.origin == "bottom-left"
+
+
+@pytest.mark.usefixtures("center_data_to_mask", "mask_dimension", "mask_data")
+def test_get_mask(center_data_to_mask, mask_dimension, mask_data):
+    b = JaxBoxes.from_center(jnp.array(center_data_to_mask))
+    assert jnp.array_equal(b.get_binary_mask(*mask_dimension), jnp.array(mask_data))
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor", "random_image_indices")
+def test_masks_and_overlaps_match_torch(
+    random_two_corners_tensor, random_image_indices
+):
+    torch_boxes = TorchBoxes.from_two_corners(random_two_corners_tensor)
+    b = JaxBoxes.from_two_corners(jnp.array(random_two_corners_tensor.numpy()))
+    masks = b.get_binary_mask(
+        64, 64, merge=True, image_indices=jnp.array(random_image_indices.numpy())
+    )
+    expected = torch_boxes.get_binary_mask(
+        64, 64, merge=True, image_indices=random_image_indices
+    )
+    np.testing.assert_equal(np.asarray(masks), expected.numpy())
+    for metric in ["iou", "giou", "diou", "ciou"]:
+        np.testing.assert_allclose(
+            np.asarray(getattr(b, metric)(b[:10])),
+            getattr(torch_boxes, metric)(torch_boxes[:10]).numpy(),
+            atol=1e-6,
+        )
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor")
+def test_jit_and_vmap(random_two_corners_tensor):
+    batch = jnp.array(random_two_corners_tensor.numpy()).reshape(5, 10, 4)
+
+    @jax.jit
+    def process(boxes):
+        b = JaxBoxes.from_two_corners(boxes).square().flip_origin(100.0)
+        masks = build_union_binary_masks(b._boxes, 64, 64)
+        return b.to_center(), compute_overlaps(b._boxes, b._boxes), masks
+
+    b, overlaps, masks = jax.vmap(process)(batch)
+    assert isinstance(b, JaxBoxes) and b.origin == "bottom-left"
+    assert b.as_array.shape == (5, 10, 4) and overlaps.shape == (5, 10, 10)
+    assert masks.shape == (5, 1, 64, 64)
+    expected = TorchBoxes.from_two_corners(random_two_corners_tensor[10:20])
+    expected = expected.square().flip_origin(100).to_center().as_tensor
+    np.testing.assert_allclose(np.asarray(b.as_array[1]), expected.numpy())
+    assert jnp.array_equal(
+        convert_boxes(batch, "two-corners", "center"),
+        jax.vmap(lambda x: convert_boxes(x, "two-corners", "center"))(batch),
+    )
+
+
+@pytest.mark.usefixtures("top_left_data")
+def test_exports(top_left_data):
+    b = JaxBoxes.from_top_left_corner(jnp.array(top_left_data)).to_top_left_corner()
+    np.testing.assert_equal(b.as_numpy, top_left_data)
+    assert torch.equal(b.as_tensor, torch.tensor(top_left_data))
+    np.testing.assert_equal(b.as_tf_tensor.numpy(), top_left_data)
+
+
+def test_empty_boxes():
+    b = JaxBoxes.from_two_corners(jnp.empty((0, 4)))
+    assert b.get_binary_mask(4, 3).shape == (0, 3, 4)
+    assert b.flip_origin(3).origin == "bottom-left"
@@ -0,0 +1,111 @@
+# type: ignore
+import pytest
+import torch
+
+from anyboxes.implementations.torch.boxes import TorchBoxes
+
+
+def reference_masks(boxes, width, height):
+    masks = torch.ones(len(boxes), height, width, dtype=torch.uint8)
+    for mask, (x_1, y_1, x_3, y_3) in zip(masks, boxes.to(torch.int).tolist()):
+        mask[max(y_1, 0) : max(y_3, 0), max(x_1, 0) : max(x_3, 0)] = 0
+    return masks
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor")
+def test_get_binary_mask_matches_reference(random_two_corners_tensor):
+    b = TorchBoxes.from_two_corners(random_two_corners_tensor)
+    masks = b.get_binary_mask(48, 32)
+    assert masks.dtype == torch.uint8
+    assert torch.equal(masks, reference_masks(random_two_corners_tensor, 48, 32))
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor")
+def test_get_binary_mask_dtype(random_two_corners_tensor):
+    b = TorchBoxes.from_two_corners(random_two_corners_tensor)
+    masks = b.get_binary_mask(48, 32, dtype=torch.bool)
+    assert masks.dtype == torch.bool
+    assert torch.equal(masks, reference_masks(random_two_corners_tensor, 48, 32).bool())
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor")
+def test_get_merged_binary_mask(random_two_corners_tensor):
+    b = TorchBoxes.from_two_corners(random_two_corners_tensor)
+    mask = b.get_binary_mask(48, 32, merge=True)
+    expected = reference_masks(random_two_corners_tensor, 48, 32).amin(dim=0)
+    assert torch.equal(mask, expected)
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor", "random_image_indices")
+def test_get_merged_binary_mask_per_image(
+    random_two_corners_tensor, random_image_indices
+):
+    b = TorchBoxes.from_two_corners(random_two_corners_tensor)
+    masks = b.get_binary_mask(48, 32, merge=True, image_indices=random_image_indices)
+    reference = reference_masks(random_two_corners_tensor, 48, 32)
+    expected = torch.stack(
+        [reference[random_image_indices == i].amin(dim=0) for i in range(3)]
+    )
+    assert torch.equal(masks, expected)
+
+
+def decode_rle(rle):
+    height, width = rle["size"]
+    values = torch.cat(
+        [
+            torch.full((count,), i % 2, dtype=torch.uint8)
+            for i, count in enumerate(rle["counts"])
+        ]
+    )
+    return values.reshape(width, height).T
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor")
+def test_lazy_binary_mask_to_dense(random_two_corners_tensor):
+    b = TorchBoxes.from_two_corners(random_two_corners_tensor)
+    masks = b.get_lazy_binary_mask(48, 32)
+    assert masks.shape == (50, 32, 48)
+    assert torch.equal(masks.to_dense(), b.get_binary_mask(48, 32))
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor")
+def test_lazy_binary_mask_window(random_two_corners_tensor):
+    b = TorchBoxes.from_two_corners(random_two_corners_tensor)
+    masks = b.get_lazy_binary_mask(48, 32)
+    dense = b.get_binary_mask(48, 32)
+    assert torch.equal(masks.to_dense(window=(5, 3, 20, 30)), dense[:, 3:30, 5:20])
+    assert torch.equal(masks[2:4].to_dense(), dense[2:4])
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor")
+def test_lazy_binary_mask_to_rle(random_two_corners_tensor):
+    b = TorchBoxes.from_two_corners(random_two_corners_tensor)
+    rles = b.get_lazy_binary_mask(48, 32).to_rle()
+    dense = b.get_binary_mask(48, 32)
+    for rle, mask in zip(rles, dense):
+        assert rle["size"] == [32, 48]
+        assert torch.equal(decode_rle(rle), mask)
+
+
+@pytest.mark.usefixtures("mask_dimension")
+def test_lazy_binary_mask_to_rle_full_height(mask_dimension):
+    b = TorchBoxes.from_two_corners(torch.tensor([[2.0, 0.0, 4.0, 10.0]]))
+    (rle,) = b.get_lazy_binary_mask(*mask_dimension).to_rle()
+    assert rle["counts"] == [0, 20, 20, 60]
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor")
+def test_lazy_binary_mask_to_spans(random_two_corners_tensor):
+    b = TorchBoxes.from_two_corners(random_two_corners_tensor)
+    masks = b.get_lazy_binary_mask(48, 32)
+    rebuilt = torch.ones(masks.shape, dtype=torch.uint8)
+    for box_index, row, x_start, x_end in masks.to_spans().tolist():
+        rebuilt[box_index, row, x_start:x_end] = 0
+    assert torch.equal(rebuilt, masks.to_dense())
+
+
+def test_binary_masks_of_empty_boxes():
+    b = TorchBoxes.from_two_corners(torch.empty(0, 4))
+    assert b.get_binary_mask(4, 3).shape == (0, 3, 4)
+    assert torch.equal(b.get_binary_mask(4, 3, merge=True), torch.ones(3, 4).byte())
+    assert len(b.flip_origin(3)) == 0
@@ -0,0 +1,80 @@
+# type: ignore
+import pytest
+import torch
+
+from anyboxes.implementations.torch.batched import BatchedTorchBoxes
+from anyboxes.implementations.torch.boxes import TorchBoxes
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor")
+def test_mutators_work_in_place(random_two_corners_tensor):
+    b = TorchBoxes.from_two_corners(random_two_corners_tensor)
+    data_ptr = b._boxes.data_ptr()
+    b.to_center()
+
+    b.translate(1.5, -2.0).scale(2.0, 0.5).square()
+    b.clip_to_image(60, 30).resize_to_image(60, 30, 120, 60)
+    centers = b.center_coordinates
+    b.flip_origin(100)
+    assert b._boxes.data_ptr() == data_ptr and b.origin == "bottom-left"
+
+    expected = (random_two_corners_tensor + torch.tensor([1.5, -2.0, 1.5, -2.0])) * (
+        torch.tensor([2.0, 0.5, 2.0, 0.5])
+    )
+    expected = TorchBoxes.from_two_corners(expected).square()._boxes
+    expected = expected.clamp(min=0).minimum(torch.tensor([60.0, 30.0, 60.0, 30.0]))
+    expected = expected * 2
+    expected[:, 1::2] = 100 - expected[:, 1::2]
+    torch.testing.assert_close(b._boxes, expected)
+    torch.testing.assert_close(b.center_coordinates.y, 100 - centers.y)
+    torch.testing.assert_close(b.to_two_corners().boxes_, expected)
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor")
+def test_mutators_write_out(random_two_corners_tensor):
+    b = TorchBoxes.from_two_corners(random_two_corners_tensor)
+    out = torch.empty_like(random_two_corners_tensor)
+    flipped = b.flip_origin(100, out=out)
+    assert flipped._boxes is out and flipped.origin == "bottom-left"
+    assert b.origin == "top-left"
+    assert torch.equal(b._boxes, random_two_corners_tensor)
+    torch.testing.assert_close(out[:, 1::2], 100 - random_two_corners_tensor[:, 1::2])
+
+    squared = b.square(out=out)
+    assert squared._boxes is out
+    torch.testing.assert_close(
+        out, TorchBoxes.from_two_corners(b._boxes).square()._boxes
+    )
+    with pytest.raises(ValueError):
+        b.translate(1, 1, out=torch.empty(3, 4))
+    with pytest.raises(ValueError):
+        b.translate(1, 1, out=out.double())
+
+
+def test_integer_boxes_are_rounded():
+    b = TorchBoxes.from_two_corners(
+        torch.tensor([[0, 0, 3, 3], [2, 2, 4, 6]]), dtype=torch.int32
+    )
+    b.translate(0.4, 1.6).scale(2, 2)
+    assert b._boxes.dtype == torch.int32
+    assert b._boxes.tolist() == [[0, 4, 6, 10], [4, 8, 8, 16]]
+
+
+@pytest.mark.usefixtures("batched_boxes", "random_two_corners_tensor")
+def test_batched_mutators_per_image(batched_boxes, random_two_corners_tensor):
+    image_indices = batched_boxes.image_indices
+    out = torch.empty_like(random_two_corners_tensor)
+    clipped = batched_boxes.clip_to_image(torch.tensor([10, 20, 30]), 25, out=out)
+    assert isinstance(clipped, BatchedTorchBoxes) and clipped.offsets == [0, 20, 20, 50]
+    widths = torch.tensor([10.0, 20.0, 30.0])[image_indices]
+    assert (out[:, 0::2] <= widths[:, None]).all() and (out[:, 1::2] <= 25).all()
+
+    batched_boxes.resize_to_image(
+        torch.tensor([10, 20, 40]), 20, torch.tensor([20, 20, 20]), 10
+    )
+    factors = torch.tensor([2.0, 1.0, 0.5])[image_indices]
+    torch.testing.assert_close(
+        batched_boxes._boxes,
+        random_two_corners_tensor
+        * torch.stack([factors, torch.full_like(factors, 0.5)], dim=1).repeat(1, 2),
+    )
@@ -0,0 +1,93 @@
+# type: ignore
+import pytest
+import torch
+
+from anyboxes.implementations.torch import nms as nms_module
+from anyboxes.implementations.torch.boxes import TorchBoxes
+from anyboxes.implementations.torch.nms import nms
+
+
+def reference_nms(boxes, scores, iou_threshold, classes=None):
+    b = TorchBoxes.from_two_corners(boxes)
+    ious = b.iou(b)
+    if classes is not None:
+        ious = ious * (classes[:, None] == classes[None]).to(ious.dtype)
+    keep = []
+    for i in scores.argsort(descending=True).tolist():
+        if all(ious[i, j] <= iou_threshold for j in keep):
+            keep.append(i)
+    return torch.tensor(keep)
+
+
+@pytest.mark.usefixtures("detections")
+def test_nms_matches_reference(detections):
+    boxes, scores, _ = detections
+    b = TorchBoxes.from_two_corners(boxes)
+    keep = b.nms(scores, iou_threshold=0.3)
+    assert torch.equal(keep, reference_nms(boxes, scores, 0.3))
+
+
+@pytest.mark.usefixtures("detections")
+def test_nms_chunks_match_reference(detections):
+    boxes, scores, _ = detections
+    b = TorchBoxes.from_two_corners(boxes)
+    keep = nms(b._boxes, scores, iou_threshold=0.3, chunk_size=64)
+    assert torch.equal(keep, reference_nms(boxes, scores, 0.3))
+
+
+@pytest.mark.usefixtures("detections")
+def test_sequential_nms_matches_reference(detections, monkeypatch):
+    boxes, scores, _ = detections
+    monkeypatch.setattr(nms_module, "MAX_ITERATIONS", 1)
+    keep = nms(boxes, scores, iou_threshold=0.3)
+    assert torch.equal(keep, reference_nms(boxes, scores, 0.3))
+
+
+def test_nms_of_chained_boxes():
+    # Every box only overlaps its neighbours enough to be suppressed, so the
+    # fixed-point iterations would only settle a box per iteration.
+    n = 20000
+    x_1 = torch.arange(n, dtype=torch.float32) * 2
+    boxes = torch.stack([x_1, torch.zeros(n), x_1 + 10, torch.ones(n)], dim=1)
+    keep = nms(boxes, torch.linspace(1, 0, n), iou_threshold=0.5)
+    assert torch.equal(keep, torch.arange(0, n, 2))
+
+
+@pytest.mark.usefixtures("detections")
+def test_class_aware_nms(detections):
+    boxes, scores, classes = detections
+    b = TorchBoxes.from_two_corners(boxes)
+    keep = b.nms(scores, iou_threshold=0.3, classes=classes)
+    assert torch.equal(keep, reference_nms(boxes, scores, 0.3, classes))
+
+
+@pytest.mark.usefixtures("detections")
+def test_nms_top_k(detections):
+    boxes, scores, _ = detections
+    b = TorchBoxes.from_two_corners(boxes)
+    keep = b.nms(scores, iou_threshold=0.3, top_k=50)
+    top_k = scores.topk(50).indices
+    assert torch.equal(keep, top_k[reference_nms(boxes[top_k], scores[top_k], 0.3)])
+
+
+@pytest.mark.usefixtures("detections")
+def test_soft_nms(detections):
+    boxes, scores, _ = detections
+    b = TorchBoxes.from_two_corners(boxes)
+    for method in ("linear", "gaussian"):
+        keep, decayed = b.soft_nms(scores, method=method, score_threshold=0.1)
+        assert keep[0] == scores.argmax()
+        assert (decayed[:-1] >= decayed[1:]).all()
+        assert (decayed <= scores[keep]).all()
+        assert (decayed >= 0.1).all()
+
+
+@pytest.mark.usefixtures("detections")
+def test_soft_nms_linear_without_overlap_keeps_scores(detections):
+    boxes, scores, _ = detections
+    b = TorchBoxes.from_two_corners(boxes)
+    keep, decayed = b.soft_nms(
+        scores, method="linear", iou_threshold=1.0, score_threshold=0.0
+    )
+    assert torch.equal(keep, scores.argsort(descending=True))
+    assert torch.equal(decayed, scores[keep])
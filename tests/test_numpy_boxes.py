@@ -0,0 +1,79 @@
+# type: ignore
+import numpy as np
+import pytest
+import torch
+
+from anyboxes.implementations.numpy.boxes import NumpyBoxes
+
+FORMATS = {
+    "top_left_data": ("from_top_left_corner", "to_top_left_corner"),
+    "bottom_left_data": ("from_bottom_left_corner", "to_bottom_left_corner"),
+    "center_data": ("from_center", "to_center"),
+    "two_corners_data": ("from_two_corners", "to_two_corners"),
+}
+
+
+@pytest.mark.parametrize("in_data", FORMATS)
+@pytest.mark.parametrize("out_data", FORMATS)
+def test_conversions(request, in_data, out_data):
+    from_method, _ = FORMATS[in_data]
+    _, to_method = FORMATS[out_data]
+    b = getattr(NumpyBoxes, from_method)(np.array(request.getfixturevalue(in_data)))
+    np.testing.assert_equal(
+        getattr(b, to_method)().as_numpy,
+        np.array(request.getfixturevalue(out_data), dtype=np.float32),
+    )
+
+
+@pytest.mark.usefixtures("center_data", "squared_center_data")
+def test_square(center_data, squared_center_data):
+    b = NumpyBoxes.from_center(np.array(center_data)).square()
+    np.testing.assert_equal(b.to_center().as_numpy, squared_center_data)
+
+
+@pytest.mark.usefixtures(
+    "top_left_data", "top_left_data_with_bottom_left_origin", "image_height"
+)
+def test_flip_origin(
+    top_left_data, top_left_data_with_bottom_left_origin, image_height
+):
+    b = NumpyBoxes.from_top_left_corner(np.array(top_left_data))
+    b.flip_origin(image_height).to_top_left_corner()
+    np.testing.assert_equal(b.as_numpy, top_left_data_with_bottom_left_origin)
+    assert b.origin == "bottom-left"
+
+
+@pytest.mark.usefixtures("center_data_to_mask", "mask_dimension", "mask_data")
+def test_get_mask(center_data_to_mask, mask_dimension, mask_data):
+    b = NumpyBoxes.from_center(np.array(center_data_to_mask))
+    np.testing.assert_equal(b.get_binary_mask(*mask_dimension), mask_data)
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor", "random_image_indices")
+def test_merged_masks_match_torch(random_two_corners_tensor, random_image_indices):
+    from anyboxes.implementations.torch.boxes import TorchBoxes
+
+    b = NumpyBoxes.from_two_corners(random_two_corners_tensor.numpy())
+    expected = TorchBoxes.from_two_corners(random_two_corners_tensor).get_binary_mask(
+        64, 64, merge=True, image_indices=random_image_indices
+    )
+    masks = b.get_binary_mask(
+        64, 64, merge=True, image_indices=random_image_indices.numpy()
+    )
+    np.testing.assert_equal(masks, expected.numpy())
+
+
+@pytest.mark.usefixtures("top_left_data", "top_left_dict", "top_left_tuple")
+def test_representations(top_left_data, top_left_dict, top_left_tuple):
+    b = NumpyBoxes.from_top_left_corner(np.array(top_left_data)).to_top_left_corner()
+    assert b.as_dict == top_left_dict
+    assert b.as_tuple == top_left_tuple
+    assert torch.equal(b.as_tensor, torch.tensor(top_left_data))
+    np.testing.assert_equal(np.asarray(b.as_array), top_left_data)
+    np.testing.assert_equal(b.as_tf_tensor.numpy(), top_left_data)
+
+
+def test_empty_boxes():
+    b = NumpyBoxes.from_two_corners(np.empty((0, 4)))
+    assert b.get_binary_mask(4, 3).shape == (0, 3, 4)
+    assert b.flip_origin(3).origin == "bottom-left"
@@ -0,0 +1,48 @@
+# type: ignore
+import pytest
+import torch
+
+from anyboxes.implementations.torch.boxes import TorchBoxes
+
+
+@pytest.mark.usefixtures("overlapping_two_corners_tensors")
+def test_pairwise_iou(overlapping_two_corners_tensors):
+    b_1, b_2 = map(TorchBoxes.from_two_corners, overlapping_two_corners_tensors)
+    expected = torch.tensor([[1 / 7, 2 / 6, 0.0], [0.0, 1.0, 0.0]])
+    assert torch.allclose(b_1.iou(b_2), expected)
+
+
+@pytest.mark.usefixtures("overlapping_two_corners_tensors")
+def test_elementwise_overlaps(overlapping_two_corners_tensors):
+    b_1, b_2 = map(TorchBoxes.from_two_corners, overlapping_two_corners_tensors)
+    b_2 = TorchBoxes.from_two_corners(overlapping_two_corners_tensors[1][:2])
+    for metric in ("iou", "giou", "diou", "ciou"):
+        pairwise = getattr(b_1, metric)(b_2)
+        elementwise = getattr(b_1, metric)(b_2, pairwise=False)
+        assert torch.allclose(elementwise, pairwise.diagonal())
+
+
+@pytest.mark.usefixtures("overlapping_two_corners_tensors")
+def test_giou_diou_ciou(overlapping_two_corners_tensors):
+    b_1, b_2 = map(TorchBoxes.from_two_corners, overlapping_two_corners_tensors)
+    assert torch.isclose(b_1.giou(b_2)[0, 0], torch.tensor(1 / 7 - 2 / 9))
+    assert torch.isclose(b_1.diou(b_2)[0, 0], torch.tensor(1 / 7 - 2 / 18))
+    assert torch.isclose(b_1.ciou(b_2)[0, 0], torch.tensor(1 / 7 - 2 / 18))
+    assert torch.isclose(b_1.ciou(b_2)[1, 1], torch.tensor(1.0))
+    assert (b_1.giou(b_2)[:, 2] < 0).all()
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor")
+def test_chunked_overlaps(random_two_corners_tensor):
+    b = TorchBoxes.from_two_corners(random_two_corners_tensor)
+    for metric in ("iou", "giou", "diou", "ciou"):
+        full = getattr(b, metric)(b)
+        chunked = getattr(b, metric)(b, chunk_size=7)
+        assert torch.equal(full, chunked)
+
+
+@pytest.mark.usefixtures("overlapping_two_corners_tensors")
+def test_elementwise_overlaps_length_mismatch(overlapping_two_corners_tensors):
+    b_1, b_2 = map(TorchBoxes.from_two_corners, overlapping_two_corners_tensors)
+    with pytest.raises(ValueError, match="same length"):
+        b_1.iou(b_2, pairwise=False)
@@ -0,0 +1,82 @@
+# type: ignore
+import pytest
+import torch
+
+from anyboxes.implementations.torch.boxes import TorchBoxes
+
+
+def reference_window(boxes, window):
+    x_1, y_1, x_3, y_3 = window
+    inside = (
+        (boxes[:, 0] <= x_3)
+        & (boxes[:, 2] >= x_1)
+        & (boxes[:, 1] <= y_3)
+        & (boxes[:, 3] >= y_1)
+    )
+    return inside.nonzero().flatten()
+
+
+def reference_distances(boxes, x, y):
+    point = torch.tensor([x, y])
+    return torch.linalg.vector_norm(
+        torch.maximum(boxes[:, :2] - point, point - boxes[:, 2:]).clamp(min=0), dim=1
+    )
+
+
+@pytest.mark.usefixtures("detections")
+@pytest.mark.parametrize("cell_size", [None, 3.0, 1000.0])
+def test_query_window(detections, cell_size):
+    boxes, _, _ = detections
+    index = TorchBoxes.from_two_corners(boxes).build_spatial_index(cell_size)
+    for window in [(10, 20, 30, 25), (-50, -50, -10, -10), (0, 0, 200, 200)]:
+        assert torch.equal(index.query_window(*window), reference_window(boxes, window))
+
+
+@pytest.mark.usefixtures("detections")
+def test_query_points(detections):
+    boxes, _, _ = detections
+    index = TorchBoxes.from_two_corners(boxes).build_spatial_index()
+    points = torch.tensor([[50.0, 50.0], [-5.0, 3.0], [99.0, 12.0]])
+    point_indices, box_indices = index.query_points(points)
+    for i, (x, y) in enumerate(points.tolist()):
+        expected = reference_window(boxes, (x, y, x, y))
+        assert torch.equal(box_indices[point_indices == i], expected)
+        assert torch.equal(index.query_point(x, y), expected)
+
+
+@pytest.mark.usefixtures("detections")
+@pytest.mark.parametrize("point", [(50.0, 50.0), (-80.0, 300.0), (7.5, 91.0)])
+def test_nearest(detections, point):
+    boxes, _, _ = detections
+    index = TorchBoxes.from_two_corners(boxes).build_spatial_index(cell_size=2.0)
+    indices, distances = index.nearest(*point, k=5)
+    expected = reference_distances(boxes, *point)
+    assert torch.allclose(distances, expected.sort().values[:5])
+    assert torch.allclose(expected[indices], distances)
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor")
+def test_index_follows_inplace_mutations(random_two_corners_tensor):
+    boxes = TorchBoxes.from_two_corners(random_two_corners_tensor)
+    index = boxes.build_spatial_index()
+    boxes.flip_origin(100).square()
+    corners = torch.cat(
+        [
+            torch.minimum(boxes._boxes[:, :2], boxes._boxes[:, 2:]),
+            torch.maximum(boxes._boxes[:, :2], boxes._boxes[:, 2:]),
+        ],
+        dim=1,
+    )
+    window = (10, 60, 25, 80)
+    assert torch.equal(index.query_window(*window), reference_window(corners, window))
+
+
+def test_index_follows_mutations_of_views():
+    boxes = TorchBoxes.from_two_corners(torch.tensor([[0.0, 0.0, 10.0, 10.0]]))
+    index = boxes.build_spatial_index()
+    assert index.query_point(5, 5).tolist() == [0]
+    boxes[:1].translate(100, 100)
+    assert index.query_point(5, 5).tolist() == []
+    assert index.query_point(105, 105).tolist() == [0]
+    boxes.translate(-100, -100, out=boxes._boxes)
+    assert index.query_point(5, 5).tolist() == [0]
@@ -0,0 +1,67 @@
+# type: ignore
+import numpy as np
+import pytest
+import torch
+
+from anyboxes.implementations.torch.batched import BatchedTorchBoxes
+from anyboxes.implementations.torch.boxes import TorchBoxes
+from anyboxes.implementations.torch.store import BoxStore
+
+
+@pytest.mark.usefixtures("batched_boxes", "random_two_corners_tensor")
+def test_store_round_trip(tmp_path, batched_boxes, random_two_corners_tensor):
+    scores = torch.rand(50)
+    labels = torch.arange(50) % 3
+    BoxStore.write(tmp_path / "store", batched_boxes, scores, labels)
+    store = BoxStore(tmp_path / "store")
+    assert len(store) == 50 and store.num_images == 3
+
+    boxes = store.get_boxes()
+    assert isinstance(boxes, BatchedTorchBoxes)
+    assert boxes.offsets == [0, 20, 20, 50]
+    torch.testing.assert_close(boxes.to_two_corners().boxes_, random_two_corners_tensor)
+    torch.testing.assert_close(store.get_scores(), scores)
+    torch.testing.assert_close(store.get_labels(2), labels[20:])
+    assert len(store.get_image(1)) == 0
+    torch.testing.assert_close(
+        store.get_image(-1).to_two_corners().boxes_, random_two_corners_tensor[20:]
+    )
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor")
+def test_store_is_zero_copy(tmp_path, random_two_corners_tensor):
+    b = TorchBoxes.from_two_corners(random_two_corners_tensor, dtype=torch.float64)
+    store = BoxStore.write(tmp_path, b)
+    assert store.get_scores() is None and store.get_labels() is None
+
+    image = store.get_image(0)
+    mapping = np.load(tmp_path / "boxes.npy", mmap_mode="r")
+    assert isinstance(store._columns["boxes"], np.memmap)
+    assert image._boxes.dtype == torch.float64
+    assert image._boxes.data_ptr() == store._columns["boxes"].ctypes.data
+
+    image.flip_origin(100)
+    np.testing.assert_array_equal(mapping, random_two_corners_tensor.numpy())
+    assert BoxStore(tmp_path).get_image(0).origin == "top-left"
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor")
+def test_store_errors(tmp_path, random_two_corners_tensor):
+    b = TorchBoxes.from_two_corners(random_two_corners_tensor)
+    with pytest.raises(ValueError):
+        BoxStore.write(tmp_path, b, scores=torch.rand(3))
+    with pytest.raises(IndexError):
+        BoxStore.write(tmp_path, b).get_image(1)
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor")
+def test_store_bfloat16(tmp_path, random_two_corners_tensor):
+    b = TorchBoxes.from_two_corners(random_two_corners_tensor, dtype=torch.bfloat16)
+    scores = torch.rand(50, dtype=torch.bfloat16)
+    store = BoxStore.write(tmp_path, b, scores)
+    assert np.load(tmp_path / "boxes.npy").dtype == np.uint16
+
+    store = BoxStore(tmp_path)
+    assert torch.equal(store.get_image(0)._boxes, b._boxes)
+    assert torch.equal(store.get_boxes()._boxes, b._boxes)
+    assert torch.equal(store.get_scores(), scores)
@@ -0,0 +1,56 @@
+# type: ignore
+import numpy as np
+import pytest
+import torch
+
+from anyboxes.implementations.torch.boxes import TorchBoxes
+from anyboxes.implementations.torch.streaming import convert_file, stream_boxes
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor")
+def test_stream_matches_boxes(random_two_corners_tensor):
+    b = TorchBoxes.from_two_corners(random_two_corners_tensor)
+    expected = b.square().flip_origin(100).to_center().boxes_
+    consumed = []
+
+    def chunks():
+        for chunk in random_two_corners_tensor.split(16):
+            consumed.append(len(chunk))
+            yield chunk.numpy()
+
+    stream = stream_boxes(chunks(), "two-corners", "center", height=100, square=True)
+    first = next(stream)
+    assert consumed == [16] and len(first) == 16
+    torch.testing.assert_close(torch.cat([first, *stream]), expected)
+    with pytest.raises(ValueError):
+        list(stream_boxes(chunks(), "two-corners", "center", height=1))
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor")
+def test_convert_file(tmp_path, random_two_corners_tensor):
+    np.save(tmp_path / "boxes.npy", random_two_corners_tensor.numpy())
+    convert_file(
+        tmp_path / "boxes.npy",
+        tmp_path / "out.npy",
+        "two-corners",
+        "top-left-corner",
+        chunk_size=7,
+    )
+    expected = TorchBoxes.from_two_corners(random_two_corners_tensor)
+    np.testing.assert_array_equal(
+        np.load(tmp_path / "out.npy"), expected.to_top_left_corner().as_numpy
+    )
+
+
+def test_convert_empty_file(tmp_path):
+    np.save(tmp_path / "boxes.npy", np.empty((0, 4), dtype=np.int32))
+    convert_file(
+        tmp_path / "boxes.npy",
+        tmp_path / "out",
+        "two-corners",
+        "center",
+        height=10,
+        dtype=torch.float64,
+    )
+    converted = np.load(tmp_path / "out")
+    assert converted.shape == (0, 4) and converted.dtype == np.float64
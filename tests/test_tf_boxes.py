@@ -0,0 +1,98 @@
+# type: ignore
+import numpy as np
+import pytest
+import tensorflow as tf
+
+from anyboxes.implementations.tensorflow.boxes import TfBoxes
+from anyboxes.implementations.torch.boxes import TorchBoxes
+
+FORMATS = {
+    "top_left_data": ("from_top_left_corner", "to_top_left_corner"),
+    "bottom_left_data": ("from_bottom_left_corner", "to_bottom_left_corner"),
+    "center_data": ("from_center", "to_center"),
+    "two_corners_data": ("from_two_corners", "to_two_corners"),
+}
+
+
+@pytest.mark.parametrize("in_data", FORMATS)
+@pytest.mark.parametrize("out_data", FORMATS)
+def test_conversions(request, in_data, out_data):
+    from_method, _ = FORMATS[in_data]
+    _, to_method = FORMATS[out_data]
+    b = getattr(TfBoxes, from_method)(tf.constant(request.getfixturevalue(in_data)))
+    np.testing.assert_array_equal(
+        getattr(b, to_method)().as_numpy,
+        np.array(request.getfixturevalue(out_data), dtype=np.float32),
+    )
+
+
+@pytest.mark.usefixtures(
+    "center_data",
+    "squared_center_data",
+    "top_left_data",
+    "top_left_data_with_bottom_left_origin",
+    "image_height",
+)
+def test_square_and_flip_origin(
+    center_data,
+    squared_center_data,
+    top_left_data,
+    top_left_data_with_bottom_left_origin,
+    image_height,
+):
+    b = TfBoxes.from_center(tf.constant(center_data)).square()
+    np.testing.assert_array_equal(
+        b.to_center().as_numpy, np.array(squared_center_data, dtype=np.float32)
+    )
+    b = TfBoxes.from_top_left_corner(tf.constant(top_left_data))
+    b.flip_origin(image_height).to_top_left_corner()
+    np.testing.assert_array_equal(
+        b.as_numpy, np.array(top_left_data_with_bottom_left_origin, dtype=np.float32)
+    )
+    assert b.origin == "bottom-left"
+    with pytest.raises(ValueError):
+        b.flip_origin(1)
+
+
+def test_clip_to_image():
+    b = TfBoxes.from_two_corners(tf.constant([[-5.0, 2.0, 30.0, 50.0]]))
+    np.testing.assert_array_equal(
+        b.clip_to_image(20, 40).to_two_corners().as_numpy, [[0.0, 2.0, 20.0, 40.0]]
+    )
+
+
+@pytest.mark.usefixtures("center_data_to_mask", "mask_dimension", "mask_data")
+def test_get_mask(center_data_to_mask, mask_dimension, mask_data):
+    b = TfBoxes.from_center(tf.constant(center_data_to_mask))
+    np.testing.assert_array_equal(b.get_binary_mask(*mask_dimension), mask_data)
+
+
+@pytest.mark.usefixtures("random_two_corners_tensor", "random_image_indices")
+def test_masks_match_torch(random_two_corners_tensor, random_image_indices):
+    torch_boxes = TorchBoxes.from_two_corners(random_two_corners_tensor)
+    b = TfBoxes.from_two_corners(tf.constant(random_two_corners_tensor.numpy()))
+    masks = b.get_binary_mask(
+        64, 64, merge=True, image_indices=tf.constant(random_image_indices.numpy())
+    )
+    expected = torch_boxes.get_binary_mask(
+        64, 64, merge=True, image_indices=random_image_indices
+    )
+    np.testing.assert_array_equal(masks.numpy(), expected.numpy())
+
+
+@pytest.mark.usefixtures("center_data", "two_corners_data")
+def test_tf_data_pipeline(center_data, two_corners_data):
+    def decode(boxes):
+        return TfBoxes.from_center(boxes).flip_origin(1000).to_two_corners().boxes_
+
+    dataset = tf.data.Dataset.from_tensors(tf.constant(center_data)).repeat(2)
+    for boxes in dataset.map(decode):
+        expected = TfBoxes.from_two_corners(tf.constant(two_corners_data))
+        np.testing.assert_allclose(
+            boxes.numpy(), expected.flip_origin(1000).to_two_corners().as_numpy
+        )
+
+    with pytest.raises(tf.errors.InvalidArgumentError):
+        tf.function(decode).get_concrete_function(tf.TensorSpec([None, 4], tf.float32))(
+            tf.constant([[0.0, 0.0, 10.0, 2000.0]])
+        )